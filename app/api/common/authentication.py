@@ -78,7 +78,8 @@ async def get_current_user(
                 detail="User ID not found in token",
             )
 
-        user = await user_repo.get_user_by_id(int(user_id))
+        # Зависимости маршрутов используют только ID пользователя.
+        user = await user_repo.get_user_by_id(int(user_id), columns=("id",))
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
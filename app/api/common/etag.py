@@ -0,0 +1,45 @@
+from typing import Optional
+
+
+def make_etag(resource_id: int, version: int, variant: str = "") -> str:
+    """
+    Формирует сильный ETag ресурса по его версии.
+
+    Версия увеличивается при каждом изменении записи, поэтому пара (id, version)
+    однозначно определяет представление ресурса. Если представление зависит от
+    параметров запроса (например, набора полей), они передаются в variant.
+
+    Args:
+        resource_id (int): ID ресурса.
+        version (int): Версия ресурса.
+        variant (str): Вариант представления.
+
+    Returns:
+        str: ETag в кавычках, например "42-7" или "42-7-id.username".
+    """
+    suffix = f"-{variant}" if variant else ""
+    return f'"{resource_id}-{version}{suffix}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Проверяет, совпадает ли ETag с заголовком If-None-Match.
+
+    Для If-None-Match используется слабое сравнение (RFC 9110): префикс W/ игнорируется.
+    Заголовок может содержать список ETag через запятую или "*".
+
+    Args:
+        if_none_match (Optional[str]): Значение заголовка If-None-Match.
+        etag (str): Текущий ETag ресурса.
+
+    Returns:
+        bool: True, если клиент уже имеет актуальное представление.
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
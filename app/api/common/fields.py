@@ -0,0 +1,43 @@
+from typing import Callable, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+
+
+def sparse_fields(allowed: Tuple[str, ...]) -> Callable[..., Tuple[str, ...]]:
+    """
+    Создаёт dependency для параметра fields (выборочный набор полей ответа).
+
+    Поля проверяются по белому списку и возвращаются в его порядке, а id
+    включается всегда. Благодаря этому число различных наборов полей (и
+    вариантов запросов к базе данных и кэшу) ограничено.
+
+    Args:
+        allowed (Tuple[str, ...]): Допустимые поля в каноническом порядке.
+
+    Returns:
+        Callable[..., Tuple[str, ...]]: Dependency, возвращающая запрошенные поля.
+    """
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description=f"Поля ответа через запятую: {', '.join(allowed)}"
+        ),
+    ) -> Tuple[str, ...]:
+        """
+        Разбирает параметр fields.
+
+        Raises:
+            HTTPException: Если запрошено поле вне белого списка.
+        """
+        if not fields:
+            return allowed
+
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = requested.difference(allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Недопустимые поля: {', '.join(sorted(unknown))}. Допустимые: {', '.join(allowed)}.",
+            )
+        return tuple(field for field in allowed if field in requested or field == "id")
+
+    return dependency
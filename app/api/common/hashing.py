@@ -1,6 +1,9 @@
 import bcrypt
 
+from app.core.tracing import traced
 
+
+@traced("bcrypt.hash")
 def hash_value(value: str) -> str:
     """
     Хэширует переданное значение с использованием bcrypt.
@@ -15,6 +18,7 @@ def hash_value(value: str) -> str:
     return bcrypt.hashpw(value.encode('utf-8'), salt).decode('utf-8')
 
 
+@traced("bcrypt.verify")
 def verify_value(plain_value: str, hashed_value: str) -> bool:
     """
     Проверяет, соответствует ли переданное значение его хэшу.
@@ -1,10 +1,8 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from slowapi.errors import RateLimitExceeded
 
-
-class RateLimitExceededError(RateLimitExceeded):
+class RateLimitExceededError(Exception):
     """
     Пользовательское исключение для обработки превышения лимита запросов.
 
@@ -16,28 +14,22 @@ class RateLimitExceededError(RateLimitExceeded):
     def __init__(self, retry_after: int, detail: str = "Too many requests"):
         super().__init__(detail)
         self.retry_after = retry_after
+        self.detail = detail
 
 
-async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceededError) -> JSONResponse:
     """
     Обработчик ошибок для Rate Limiting.
 
     Args:
         request (Request): Запрос, вызвавший ошибку.
-        exc (RateLimitExceeded): Исключение RateLimitExceeded или RateLimitExceededError.
+        exc (RateLimitExceededError): Исключение RateLimitExceededError.
 
     Returns:
         JSONResponse: Ответ с кодом 429 и деталями ошибки.
     """
-    headers = {}
-    if isinstance(exc, RateLimitExceededError):
-        headers["Retry-After"] = str(exc.retry_after)
-    elif hasattr(exc, "retry_after"):
-        headers["Retry-After"] = str(exc.retry_after)
-
-    detail_message = exc.detail if hasattr(exc, "detail") else "Too many requests. Please try again later."
     return JSONResponse(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        content={"detail": detail_message},
-        headers=headers,
-    )
\ No newline at end of file
+        content={"detail": exc.detail},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
@@ -0,0 +1,27 @@
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from app.core.settings import settings
+
+
+def require_operator(x_operator_token: Optional[str] = Header(default=None)) -> None:
+    """
+    Проверяет токен оператора для служебных эндпоинтов (профилирование, диагностика).
+
+    Если OPERATOR_TOKEN не задан, служебные эндпоинты отключены и отвечают 404.
+
+    Args:
+        x_operator_token (Optional[str]): Значение заголовка X-Operator-Token.
+
+    Raises:
+        HTTPException: Если эндпоинты отключены или токен неверный.
+    """
+    if not settings.OPERATOR_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if not x_operator_token or not secrets.compare_digest(
+        x_operator_token.encode("utf-8"), settings.OPERATOR_TOKEN.encode("utf-8")
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid operator token")
@@ -1,21 +1,485 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import asyncio
+import math
+import time
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Pattern, Tuple
 
+import jwt
+from starlette.datastructures import Headers
+from starlette.requests import Request, cookie_parser
+from starlette.routing import Match, compile_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.api.security.exceptions import RateLimitExceededError, rate_limit_exceeded_handler
+from app.api.storage.redis import RedisManager
+from app.core.monitoring import RATE_LIMIT_DECISIONS
 from app.core.settings import settings
+from app.core.logging import logger
+
+PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+RATE_LIMITS = {
+    ("POST", "/api/v1/auth/register"): "20/minute",
+    ("POST", "/api/v1/auth/login"): "30/minute",
+    ("GET", "/api/v1/auth/availability"): "120/minute",
+    ("GET", "/api/v1/users/current"): "60/minute",
+    ("PATCH", "/api/v1/users/current"): "20/minute",
+    ("DELETE", "/api/v1/users/current"): "20/minute",
+    ("POST", "/api/v1/users/restore"): "10/minute",
+    ("GET", "/api/v1/users"): "300/minute",
+    ("POST", "/api/v1/users/batch"): "300/minute",
+    ("GET", "/api/v1/users/autocomplete"): "600/minute",
+}
+
+# Маршруты, требующие аутентификации: лимит считается по субъекту JWT (sub), а не по IP,
+# и умножается на коэффициент тарифа пользователя (claim tier, выдаётся при входе по users.tier).
+USER_KEYED_ROUTES = frozenset({
+    ("GET", "/api/v1/users/current"),
+    ("PATCH", "/api/v1/users/current"),
+    ("DELETE", "/api/v1/users/current"),
+})
+
+ANONYMOUS_TIER = "anonymous"
+
+# GCRA (Generic Cell Rate Algorithm): в Redis хранится только теоретическое время
+# прибытия следующего запроса (TAT), поэтому проверка и учёт запроса — одна команда EVALSHA.
+# Время считается в микросекундах, чтобы высокие лимиты не округлялись до нулевого интервала.
+# KEYS[1]: ключ состояния; ARGV[1]: интервал эмиссии (мкс); ARGV[2]: период лимита (мкс).
+# Возвращает {1, 0}, если запрос разрешён, или {0, мкс до следующей попытки}.
+GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = time[1] * 1000000 + time[2]
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + tonumber(ARGV[1])
+local allow_at = new_tat - tonumber(ARGV[2])
+if allow_at > now then
+    return {0, allow_at - now}
+end
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', string.format('%d', math.ceil((new_tat - now) / 1000)))
+return {1, 0}
+"""
+
+
+class RateLimit(NamedTuple):
+    """Скомпилированный лимит запросов."""
+
+    key: str
+    limit: int
+    period: int
+    emission_interval_us: int
+    period_us: int
+
+
+class RoutePolicy(NamedTuple):
+    """Политика ограничения маршрута: способ идентификации клиента и лимиты по тарифам."""
 
+    key: str
+    per_user: bool
+    tiers: Dict[str, RateLimit]
 
-def get_rate_limiter() -> Limiter:
+
+def parse_rate_limit(key: str, value: str, multiplier: float = 1.0) -> RateLimit:
     """
-    Возвращает объект Limiter с настроенным хранилищем Redis.
+    Компилирует лимит вида "20/minute" в параметры GCRA.
+
+    Args:
+        key (str): Идентификатор маршрута в ключах Redis.
+        value (str): Лимит в формате "<количество>/<second|minute|hour|day>".
+        multiplier (float): Коэффициент тарифа, на который умножается количество запросов.
 
     Returns:
-        Limiter: Объект Limiter для ограничения запросов.
+        RateLimit: Скомпилированный лимит.
+
+    Raises:
+        ValueError: Если формат лимита некорректен.
     """
-    redis_password = f":{settings.REDIS_PASSWORD}@" if settings.REDIS_PASSWORD else ""
-    storage_uri = f"redis://{redis_password}{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+    amount, _, period_name = value.partition("/")
+    if period_name not in PERIODS or not amount.isdigit() or int(amount) <= 0:
+        raise ValueError(f"Некорректный лимит запросов: {value}")
 
-    limiter = Limiter(
-        key_func=get_remote_address,
-        storage_uri=storage_uri,
+    limit, period = max(1, int(int(amount) * multiplier)), PERIODS[period_name]
+    return RateLimit(
+        key=key,
+        limit=limit,
+        period=period,
+        emission_interval_us=max(1, period * 1_000_000 // limit),
+        period_us=period * 1_000_000,
     )
-    return limiter
+
+
+class LocalWindow:
+    """
+    Локальный счётчик запросов в окне лимита.
+
+    Attributes:
+        window_end (float): Время окончания окна (unix time).
+        expire (int): TTL счётчика окна в Redis в секундах.
+        synced (int): Общее число запросов всех воркеров на момент последней синхронизации.
+        pending (int): Запросы этого воркера, ещё не отправленные в Redis.
+    """
+
+    __slots__ = ("window_end", "expire", "synced", "pending")
+
+    def __init__(self, window_end: float, expire: int):
+        self.window_end = window_end
+        self.expire = expire
+        self.synced = 0
+        self.pending = 0
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов.
+
+    Таблица лимитов компилируется один раз при создании приложения: статические
+    маршруты ищутся по словарю, маршруты с параметрами — по регулярным выражениям.
+
+    Анонимные маршруты ограничиваются по IP клиента. Маршруты из user_keyed
+    ограничиваются по субъекту access-токена: подпись проверяется локально, без
+    обращения к базе данных, а лимит выбирается по тарифу из claim tier (тариф
+    записывается в токен при входе из столбца users.tier, поэтому смена тарифа
+    действует со следующего входа). Запросы без валидного токена на таких
+    маршрутах считаются по IP. Каждое решение учитывается в метрике
+    rate_limit_decisions_total.
+
+    Режимы работы:
+    - ``redis``: каждый ограничиваемый запрос стоит одного EVALSHA скрипта GCRA;
+    - ``hybrid``: решения принимаются по локальным счётчикам окон, а накопленные
+      запросы раз в sync_interval секунд отправляются в Redis одним конвейером;
+      общий счётчик окна воркер получает в ответ на отправку своих запросов.
+      Допускается ограниченное превышение лимита (не больше запросов, принятых
+      воркерами между синхронизациями).
+
+    При недоступности Redis ограничитель пропускает запросы (fail open): в режиме
+    ``redis`` без ограничений, в режиме ``hybrid`` — с ограничением по локальным счётчикам.
+
+    Attributes:
+        cache (RedisManager): Менеджер Redis.
+        mode (str): Режим работы.
+        sync_interval (float): Интервал синхронизации в режиме hybrid в секундах.
+    """
+
+    KEY_PREFIX = "rate_limit"
+    REDIS = "redis"
+    HYBRID = "hybrid"
+
+    def __init__(
+        self,
+        cache: RedisManager,
+        limits: Dict[Tuple[str, str], str] = RATE_LIMITS,
+        user_keyed: FrozenSet[Tuple[str, str]] = USER_KEYED_ROUTES,
+        tiers: Dict[str, float] = settings.RATE_LIMIT_TIERS,
+        default_tier: str = settings.RATE_LIMIT_DEFAULT_TIER,
+        mode: str = settings.RATE_LIMIT_MODE,
+        sync_interval: float = settings.RATE_LIMIT_SYNC_INTERVAL,
+    ):
+        """
+        Инициализирует RateLimiter.
+
+        Args:
+            cache (RedisManager): Менеджер Redis.
+            limits (Dict[Tuple[str, str], str]): Лимиты по паре (HTTP-метод, шаблон пути).
+            user_keyed (FrozenSet[Tuple[str, str]]): Маршруты, ограничиваемые по субъекту токена.
+            tiers (Dict[str, float]): Коэффициенты лимитов по тарифам.
+            default_tier (str): Тариф для токенов без claim tier или с неизвестным тарифом.
+            mode (str): Режим работы (redis или hybrid).
+            sync_interval (float): Интервал синхронизации в режиме hybrid в секундах.
+        """
+        self.cache = cache
+        self.mode = mode
+        self.sync_interval = sync_interval
+        self.default_tier = default_tier
+        self._windows: Dict[str, LocalWindow] = {}
+        self._sync_task: Optional[asyncio.Task] = None
+        self._decisions: Dict[Tuple[str, str, str, str], Any] = {}
+        self._static: Dict[Tuple[str, str], RoutePolicy] = {}
+        self._dynamic: List[Tuple[str, Pattern[str], RoutePolicy]] = []
+
+        tiers = {**tiers, default_tier: tiers.get(default_tier, 1.0)}
+        for (method, path), value in limits.items():
+            key = f"{method}:{path}"
+            if (method, path) in user_keyed:
+                policy = RoutePolicy(
+                    key=key,
+                    per_user=True,
+                    tiers={tier: parse_rate_limit(key, value, multiplier) for tier, multiplier in tiers.items()},
+                )
+            else:
+                policy = RoutePolicy(key=key, per_user=False, tiers={ANONYMOUS_TIER: parse_rate_limit(key, value)})
+
+            if "{" in path:
+                path_regex, _, _ = compile_path(path)
+                self._dynamic.append((method, path_regex, policy))
+            else:
+                self._static[(method, path)] = policy
+
+    def match(self, method: str, path: str) -> Optional[RoutePolicy]:
+        """
+        Находит политику ограничения для запроса.
+
+        Args:
+            method (str): HTTP-метод.
+            path (str): Путь запроса.
+
+        Returns:
+            Optional[RoutePolicy]: Политика или None, если маршрут не ограничивается.
+        """
+        policy = self._static.get((method, path))
+        if policy is not None or not self._dynamic:
+            return policy
+
+        for route_method, path_regex, policy in self._dynamic:
+            if route_method == method and path_regex.match(path):
+                return policy
+        return None
+
+    @staticmethod
+    def _extract_token(scope: Scope) -> Optional[str]:
+        """
+        Извлекает access-токен из cookie или заголовка Authorization, как get_token.
+
+        Args:
+            scope: Scope запроса.
+
+        Returns:
+            Optional[str]: Токен или None, если он отсутствует.
+        """
+        headers = Headers(scope=scope)
+        cookie = headers.get("cookie")
+        if cookie:
+            token = cookie_parser(cookie).get("access_token")
+            if token:
+                return token
+
+        authorization = headers.get("authorization")
+        if authorization and authorization.startswith("Bearer "):
+            return authorization[7:]
+        return None
+
+    def identify(self, policy: RoutePolicy, scope: Scope) -> Tuple[str, str, str]:
+        """
+        Определяет ключ клиента и тариф для запроса.
+
+        Для маршрутов с per_user проверяется подпись и срок действия access-токена
+        без обращения к базе данных. Если токен отсутствует или невалиден, запрос
+        считается по IP; ответ 401 вернёт сам обработчик.
+
+        Args:
+            policy (RoutePolicy): Политика маршрута.
+            scope: Scope запроса.
+
+        Returns:
+            Tuple[str, str, str]: Ключ клиента, тип ключа (user или ip) и тариф.
+        """
+        if policy.per_user:
+            token = self._extract_token(scope)
+            if token:
+                try:
+                    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+                except jwt.PyJWTError:
+                    payload = None
+
+                if payload and payload.get("token_type") == "access" and payload.get("sub"):
+                    tier = payload.get("tier", self.default_tier)
+                    if tier not in policy.tiers:
+                        tier = self.default_tier
+                    return f"user:{payload['sub']}", "user", tier
+
+        client = scope.get("client")
+        tier = ANONYMOUS_TIER if ANONYMOUS_TIER in policy.tiers else self.default_tier
+        return f"ip:{client[0] if client else 'unknown'}", "ip", tier
+
+    async def check(self, policy: RoutePolicy, scope: Scope) -> int:
+        """
+        Идентифицирует клиента, учитывает запрос и записывает решение в метрики.
+
+        Args:
+            policy (RoutePolicy): Политика маршрута.
+            scope: Scope запроса.
+
+        Returns:
+            int: 0, если запрос разрешён, иначе время в секундах до следующей попытки.
+        """
+        identity, key_type, tier = self.identify(policy, scope)
+        retry_after = await self.hit(policy.tiers[tier], identity)
+
+        decision = "rejected" if retry_after else "allowed"
+        labels = (policy.key, key_type, tier, decision)
+        counter = self._decisions.get(labels)
+        if counter is None:
+            counter = self._decisions[labels] = RATE_LIMIT_DECISIONS.labels(*labels)
+        counter.inc()
+
+        if retry_after:
+            logger.warning(f"Превышен лимит {policy.key} для {identity} (тариф {tier}).")
+        return retry_after
+
+    async def hit(self, rate_limit: RateLimit, identity: str) -> int:
+        """
+        Учитывает запрос и проверяет лимит.
+
+        Args:
+            rate_limit (RateLimit): Лимит маршрута.
+            identity (str): Идентификатор клиента.
+
+        Returns:
+            int: 0, если запрос разрешён, иначе время в секундах до следующей попытки.
+        """
+        if self.mode == self.HYBRID:
+            return self._hit_local(rate_limit, identity)
+
+        result = await self.cache.run_script(
+            GCRA_SCRIPT,
+            keys=[f"{self.KEY_PREFIX}:{rate_limit.key}:{identity}"],
+            args=[rate_limit.emission_interval_us, rate_limit.period_us],
+        )
+        if result is None or result[0]:
+            return 0
+        return max(1, math.ceil(int(result[1]) / 1_000_000))
+
+    def _hit_local(self, rate_limit: RateLimit, identity: str) -> int:
+        """
+        Учитывает запрос в локальном счётчике окна без обращения к Redis.
+
+        Args:
+            rate_limit (RateLimit): Лимит маршрута.
+            identity (str): Идентификатор клиента.
+
+        Returns:
+            int: 0, если запрос разрешён, иначе время в секундах до конца окна.
+        """
+        now = time.time()
+        window = int(now // rate_limit.period)
+        key = f"{self.KEY_PREFIX}:{rate_limit.key}:{identity}:{window}"
+
+        counter = self._windows.get(key)
+        if counter is None:
+            counter = self._windows[key] = LocalWindow((window + 1) * rate_limit.period, rate_limit.period)
+
+        if counter.synced + counter.pending >= rate_limit.limit:
+            return max(1, math.ceil(counter.window_end - now))
+
+        counter.pending += 1
+        return 0
+
+    async def sync(self) -> None:
+        """
+        Отправляет накопленные локальные запросы в Redis и получает общие счётчики окон.
+
+        Завершившиеся окна удаляются. В Redis отправляются только окна с новыми
+        запросами: общий счётчик простаивающего окна обновляется при следующей
+        отправке его запросов, поэтому idle-воркер не обращается к Redis. Если Redis
+        недоступен, накопленные запросы сохраняются до следующей синхронизации.
+        """
+        now = time.time()
+        for key in [key for key, counter in self._windows.items() if counter.window_end <= now]:
+            del self._windows[key]
+
+        batch = {key: (counter.pending, counter.expire) for key, counter in self._windows.items() if counter.pending}
+        if not batch:
+            return
+
+        totals = await self.cache.increment_batch(batch)
+        if totals is None:
+            return
+
+        for (key, (flushed, _)), total in zip(batch.items(), totals):
+            counter = self._windows.get(key)
+            if counter is not None:
+                counter.pending -= flushed
+                counter.synced = total
+
+    async def _sync_loop(self) -> None:
+        """Периодически синхронизирует локальные счётчики с Redis."""
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"Ошибка синхронизации счётчиков ограничителя запросов: {e}")
+
+    async def start(self) -> None:
+        """Запускает фоновую синхронизацию в режиме hybrid."""
+        if self.mode == self.HYBRID and self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_loop())
+            logger.info(f"Синхронизация ограничителя запросов запущена (интервал {self.sync_interval} сек.).")
+
+    async def stop(self) -> None:
+        """Останавливает фоновую синхронизацию и отправляет оставшиеся запросы."""
+        if self._sync_task is None:
+            return
+
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except asyncio.CancelledError:
+            pass
+        self._sync_task = None
+        await self.sync()
+
+
+class RateLimitMiddleware:
+    """
+    ASGI-middleware, применяющее общий RateLimiter ко всем HTTP-запросам.
+
+    Отклонённый запрос не доходит до роутера, поэтому маршрут для метрик и
+    трассировки (scope["route"]) записывается самим middleware.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        """
+        Инициализация rate limit middleware.
+
+        Args:
+            app: ASGI-приложение.
+            limiter: Общий экземпляр ограничителя.
+        """
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Проверяет лимит запроса и передаёт его дальше либо отвечает 429.
+
+        Args:
+            scope: Scope запроса.
+            receive: Receive channel.
+            send: Send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.limiter.match(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = await self.limiter.check(policy, scope)
+        if retry_after:
+            self._resolve_route(scope)
+            response = await rate_limit_exceeded_handler(
+                Request(scope), RateLimitExceededError(retry_after=retry_after)
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _resolve_route(scope: Scope) -> None:
+        """Записывает в scope маршрут приложения, которому соответствует запрос."""
+        app = scope.get("app")
+        router = getattr(app, "router", None)
+        for route in getattr(router, "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                scope["route"] = route
+                return
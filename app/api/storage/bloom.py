@@ -0,0 +1,150 @@
+import hashlib
+import math
+from typing import Iterable, List, Optional
+
+from app.api.storage.redis import RedisManager
+
+# Проверка значения: -1, если фильтр ещё не построен, 0 — значения точно нет, 1 — значение возможно есть.
+# KEYS[1]: ключ фильтра; ARGV: номера битов.
+BLOOM_CHECK_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+for i = 1, #ARGV do
+    if redis.call('GETBIT', KEYS[1], ARGV[i]) == 0 then
+        return 0
+    end
+end
+return 1
+"""
+
+# Установка битов во все существующие ключи из KEYS. Несуществующий ключ не создаётся,
+# чтобы частично заполненный фильтр не считался построенным.
+BLOOM_ADD_SCRIPT = """
+local updated = 0
+for k = 1, #KEYS do
+    if redis.call('EXISTS', KEYS[k]) == 1 then
+        for i = 1, #ARGV do
+            redis.call('SETBIT', KEYS[k], ARGV[i], 1)
+        end
+        updated = updated + 1
+    end
+end
+return updated
+"""
+
+# Создание пустого фильтра заданного размера. KEYS[1]: ключ; ARGV[1]: номер последнего бита.
+BLOOM_RESET_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('SETBIT', KEYS[1], ARGV[1], 0)
+return 1
+"""
+
+# Атомарная замена фильтра перестроенным. KEYS[1]: новый фильтр; KEYS[2]: рабочий фильтр.
+BLOOM_SWAP_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('RENAME', KEYS[1], KEYS[2])
+return 1
+"""
+
+
+class BloomFilter:
+    """
+    Фильтр Блума на битовой строке Redis.
+
+    Проверка и добавление значения — один вызов EVALSHA. Фильтр перестраивается
+    в отдельный ключ, который затем атомарно заменяет рабочий; значения,
+    добавленные во время перестроения, записываются в оба ключа.
+
+    Attributes:
+        key (str): Ключ рабочего фильтра.
+        rebuild_key (str): Ключ перестраиваемого фильтра.
+        size (int): Размер фильтра в битах.
+        hashes (int): Количество хэш-функций.
+    """
+
+    def __init__(self, cache: RedisManager, name: str, capacity: int, error_rate: float):
+        """
+        Инициализирует BloomFilter.
+
+        Args:
+            cache (RedisManager): Менеджер Redis.
+            name (str): Имя фильтра.
+            capacity (int): Ожидаемое количество значений.
+            error_rate (float): Допустимая доля ложноположительных ответов.
+        """
+        self.cache = cache
+        self.key = f"bloom:{name}"
+        self.rebuild_key = f"bloom:{name}:rebuild"
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+
+    def positions(self, value: str) -> List[int]:
+        """
+        Вычисляет номера битов значения (двойное хэширование одного дайджеста BLAKE2b).
+
+        Args:
+            value (str): Значение.
+
+        Returns:
+            List[int]: Номера битов.
+        """
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    async def is_built(self) -> Optional[bool]:
+        """
+        Проверяет, построен ли фильтр.
+
+        Returns:
+            Optional[bool]: True или False; None, если Redis недоступен.
+        """
+        result = await self.cache.run_script(BLOOM_CHECK_SCRIPT, [self.key], [])
+        return None if result is None else result >= 0
+
+    async def might_contain(self, value: str) -> Optional[bool]:
+        """
+        Проверяет значение по фильтру.
+
+        Args:
+            value (str): Значение.
+
+        Returns:
+            Optional[bool]: False — значения точно нет, True — возможно есть,
+                None — фильтр не построен или Redis недоступен.
+        """
+        result = await self.cache.run_script(BLOOM_CHECK_SCRIPT, [self.key], self.positions(value))
+        if result is None or result < 0:
+            return None
+        return bool(result)
+
+    async def add(self, values: Iterable[str], rebuilding: bool = False) -> None:
+        """
+        Добавляет значения в фильтр.
+
+        Args:
+            values (Iterable[str]): Значения.
+            rebuilding (bool): Записать только в перестраиваемый фильтр.
+        """
+        positions = [position for value in values for position in self.positions(value)]
+        if not positions:
+            return
+        keys = [self.rebuild_key] if rebuilding else [self.key, self.rebuild_key]
+        await self.cache.run_script(BLOOM_ADD_SCRIPT, keys, positions)
+
+    async def begin_rebuild(self) -> None:
+        """Создаёт пустой перестраиваемый фильтр."""
+        await self.cache.run_script(BLOOM_RESET_SCRIPT, [self.rebuild_key], [self.size - 1])
+
+    async def finish_rebuild(self) -> bool:
+        """
+        Заменяет рабочий фильтр перестроенным.
+
+        Returns:
+            bool: True, если фильтр заменён.
+        """
+        return bool(await self.cache.run_script(BLOOM_SWAP_SCRIPT, [self.rebuild_key, self.key], []))
@@ -0,0 +1,92 @@
+import time
+
+from app.core.monitoring import CIRCUIT_BREAKER_STATE, CIRCUIT_BREAKER_TRIPS
+from app.core.logging import logger
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель для внешней зависимости.
+
+    В замкнутом состоянии вызовы проходят к зависимости. После failure_threshold
+    ошибок подряд выключатель размыкается и в течение recovery_timeout секунд
+    отклоняет вызовы, не обращаясь к зависимости. Затем пропускается пробный
+    вызов (полуоткрытое состояние): успех замыкает выключатель, ошибка снова
+    размыкает его.
+
+    Attributes:
+        name (str): Имя зависимости, используемое в метриках и логах.
+        failure_threshold (int): Количество ошибок подряд до размыкания.
+        recovery_timeout (float): Время в секундах до пробного вызова.
+        state (str): Текущее состояние выключателя.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    _STATE_VALUES = {CLOSED: 0, OPEN: 1, HALF_OPEN: 2}
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float):
+        """
+        Инициализирует CircuitBreaker.
+
+        Args:
+            name (str): Имя зависимости.
+            failure_threshold (int): Количество ошибок подряд до размыкания.
+            recovery_timeout (float): Время в секундах до пробного вызова.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state_gauge = CIRCUIT_BREAKER_STATE.labels(dependency=name)
+        self._trips_counter = CIRCUIT_BREAKER_TRIPS.labels(dependency=name)
+        self._set_state(self.CLOSED)
+
+    def _set_state(self, state: str) -> None:
+        """Переводит выключатель в новое состояние и обновляет метрику."""
+        self.state = state
+        self._state_gauge.set(self._STATE_VALUES[state])
+
+    def allow_request(self) -> bool:
+        """
+        Проверяет, можно ли обратиться к зависимости.
+
+        Returns:
+            bool: True, если вызов разрешён (в том числе как пробный), иначе False.
+        """
+        if self.state == self.CLOSED:
+            return True
+
+        now = time.monotonic()
+        if now - self._opened_at < self.recovery_timeout:
+            return False
+
+        self._opened_at = now
+        if self.state == self.OPEN:
+            self._set_state(self.HALF_OPEN)
+            logger.info(f"Выключатель {self.name} в полуоткрытом состоянии, пробный вызов.")
+        return True
+
+    def record_success(self) -> None:
+        """Фиксирует успешный вызов и замыкает выключатель."""
+        self._failures = 0
+        if self.state != self.CLOSED:
+            self._set_state(self.CLOSED)
+            logger.success(f"Выключатель {self.name} замкнут, зависимость снова доступна.")
+
+    def record_failure(self) -> None:
+        """Фиксирует ошибку вызова и размыкает выключатель при достижении порога."""
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            if self.state != self.OPEN:
+                self._trips_counter.inc()
+                logger.warning(
+                    f"Выключатель {self.name} разомкнут после {self._failures} ошибок подряд "
+                    f"на {self.recovery_timeout} сек."
+                )
+            self._set_state(self.OPEN)
@@ -1,8 +1,9 @@
 import aiomysql
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from app.core.settings import settings
-from app.core.logging import logger
+from app.core.tracing import traced
+from app.core.logging import logger, hot_logger
 
 
 class Database:
@@ -25,7 +26,7 @@ class Database:
                 password=settings.MYSQL_PASSWORD,
                 db=settings.MYSQL_DATABASE,
                 autocommit=True,
-                maxsize=10
+                maxsize=settings.mysql_pool_maxsize
             )
             logger.success("Успешное подключение к базе данных.")
         except Exception as e:
@@ -43,29 +44,67 @@ class Database:
         except Exception as e:
             logger.error(f"Ошибка при закрытии соединений с базой данных: {e}")
 
+    @traced("mysql.fetch", lambda self, query, *args: {"db.system": "mysql", "db.statement": query})
     async def fetch(self, query: str, *args) -> List[dict]:
         """Выполнение запроса, возвращающего результаты (например SELECT)."""
         try:
-            logger.info(f"Выполнение запроса: {query} | Аргументы: {args}")
+            hot_logger.info("Выполнение запроса: {} | Аргументы: {}", query, args)
             async with self.pool.acquire() as connection:
                 async with connection.cursor(aiomysql.DictCursor) as cursor:
                     await cursor.execute(query, args)
                     result = await cursor.fetchall()
-                    logger.info(f"Запрос выполнен успешно. Получено строк: {len(result)}")
+                    hot_logger.info("Запрос выполнен успешно. Получено строк: {}", len(result))
                     return result
         except Exception as e:
             logger.error(f"Ошибка при выполнении запроса: {e}")
             raise
 
+    async def stream(self, query: str, *args, batch_size: int = settings.MYSQL_STREAM_BATCH_SIZE) -> AsyncIterator[List[dict]]:
+        """
+        Выполнение запроса с небуферизованным курсором (SSDictCursor): строки читаются
+        из сокета порциями по batch_size, а не загружаются в память целиком, как в fetch.
+
+        Соединение занято, пока результат не прочитан до конца, поэтому запрос
+        должен быть ограничен (например, LIMIT в постраничной выборке по ключу).
+        Если чтение прервано (отключение клиента, отмена задачи), соединение
+        закрывается, а не возвращается в пул с непрочитанным результатом.
+
+        Args:
+            query (str): SQL-запрос.
+            *args: Аргументы запроса.
+            batch_size (int): Количество строк в порции.
+
+        Yields:
+            List[dict]: Порция строк.
+        """
+        hot_logger.info("Потоковое выполнение запроса: {} | Аргументы: {}", query, args)
+        async with self.pool.acquire() as connection:
+            cursor = await connection.cursor(aiomysql.SSDictCursor)
+            try:
+                await cursor.execute(query, args)
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
+            except BaseException as e:
+                if not isinstance(e, GeneratorExit):
+                    logger.error(f"Ошибка при потоковом выполнении запроса: {e!r}")
+                # Закрытие курсора дочитало бы остаток результата из сокета.
+                connection.close()
+                raise
+            await cursor.close()
+
+    @traced("mysql.execute", lambda self, query, *args: {"db.system": "mysql", "db.statement": query})
     async def execute(self, query: str, *args) -> Optional[int]:
         """Выполнение запроса без возвращаемых результатов (например INSERT, UPDATE, DELETE)."""
         try:
-            logger.info(f"Выполнение запроса: {query} | Аргументы: {args}")
+            hot_logger.info("Выполнение запроса: {} | Аргументы: {}", query, args)
             async with self.pool.acquire() as connection:
                 async with connection.cursor() as cursor:
                     await cursor.execute(query, args)
                     lastrowid = cursor.lastrowid
-                    logger.info(f"Запрос выполнен успешно. ID последней вставленной записи: {lastrowid}")
+                    hot_logger.info("Запрос выполнен успешно. ID последней вставленной записи: {}", lastrowid)
                     return lastrowid
         except Exception as e:
             logger.error(f"Ошибка при выполнении запроса: {e}")
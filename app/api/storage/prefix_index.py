@@ -0,0 +1,130 @@
+from typing import List, Optional, Sequence
+
+from app.api.storage.redis import RedisManager
+
+# Поиск по префиксу: -1, если индекс ещё не построен, иначе до ARGV[2] элементов, начинающихся с ARGV[1].
+# Байт 0xFF больше любого байта UTF-8, поэтому '[prefix\255' ограничивает диапазон сверху.
+# KEYS[1]: ключ индекса; ARGV[1]: префикс (непустой); ARGV[2]: максимальное число элементов.
+PREFIX_SEARCH_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+return redis.call('ZRANGEBYLEX', KEYS[1], '[' .. ARGV[1], '[' .. ARGV[1] .. '\\255', 'LIMIT', 0, ARGV[2])
+"""
+
+# Замена элемента во всех существующих ключах из KEYS. Несуществующий ключ не создаётся,
+# чтобы частично заполненный индекс не считался построенным.
+# ARGV[1]: удаляемый элемент ('' — нет); ARGV[2..]: добавляемые элементы.
+PREFIX_UPDATE_SCRIPT = """
+local updated = 0
+for k = 1, #KEYS do
+    if redis.call('EXISTS', KEYS[k]) == 1 then
+        if ARGV[1] ~= '' then
+            redis.call('ZREM', KEYS[k], ARGV[1])
+        end
+        for i = 2, #ARGV do
+            redis.call('ZADD', KEYS[k], 0, ARGV[i])
+        end
+        updated = updated + 1
+    end
+end
+return updated
+"""
+
+# Создание пустого индекса. Пустой элемент меньше любого непустого префикса и не попадает
+# в результаты поиска, но не даёт Redis удалить ключ пустого индекса. KEYS[1]: ключ.
+PREFIX_RESET_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('ZADD', KEYS[1], 0, '')
+return 1
+"""
+
+# Атомарная замена индекса перестроенным. KEYS[1]: новый индекс; KEYS[2]: рабочий индекс.
+PREFIX_SWAP_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('RENAME', KEYS[1], KEYS[2])
+return 1
+"""
+
+
+class PrefixIndex:
+    """
+    Индекс для поиска по префиксу на сортированном множестве Redis.
+
+    Все элементы имеют нулевой вес и упорядочены лексикографически, поэтому
+    поиск — один ZRANGEBYLEX за O(log N + k). Индекс перестраивается в отдельный
+    ключ, который затем атомарно заменяет рабочий; изменения во время
+    перестроения записываются в оба ключа.
+
+    Attributes:
+        key (str): Ключ рабочего индекса.
+        rebuild_key (str): Ключ перестраиваемого индекса.
+    """
+
+    def __init__(self, cache: RedisManager, name: str):
+        """
+        Инициализирует PrefixIndex.
+
+        Args:
+            cache (RedisManager): Менеджер Redis.
+            name (str): Имя индекса.
+        """
+        self.cache = cache
+        self.key = f"prefix:{name}"
+        self.rebuild_key = f"prefix:{name}:rebuild"
+
+    async def is_built(self) -> Optional[bool]:
+        """
+        Проверяет, построен ли индекс.
+
+        Returns:
+            Optional[bool]: True или False; None, если Redis недоступен.
+        """
+        result = await self.cache.run_script(PREFIX_SEARCH_SCRIPT, [self.key], ["\x00", 0])
+        return None if result is None else result != -1
+
+    async def search(self, prefix: str, limit: int) -> Optional[List[str]]:
+        """
+        Возвращает первые limit элементов, начинающихся с prefix.
+
+        Args:
+            prefix (str): Непустой префикс.
+            limit (int): Максимальное число элементов.
+
+        Returns:
+            Optional[List[str]]: Элементы в лексикографическом порядке или None,
+                если индекс не построен или Redis недоступен.
+        """
+        result = await self.cache.run_script(PREFIX_SEARCH_SCRIPT, [self.key], [prefix, limit])
+        if result is None or result == -1:
+            return None
+        return result
+
+    async def replace(self, old: Optional[str], new: Sequence[str] = (), rebuilding: bool = False) -> None:
+        """
+        Удаляет элемент old и добавляет элементы new.
+
+        Args:
+            old (Optional[str]): Удаляемый элемент.
+            new (Sequence[str]): Добавляемые элементы.
+            rebuilding (bool): Записать только в перестраиваемый индекс.
+        """
+        if not old and not new:
+            return
+        keys = [self.rebuild_key] if rebuilding else [self.key, self.rebuild_key]
+        await self.cache.run_script(PREFIX_UPDATE_SCRIPT, keys, [old or "", *new])
+
+    async def begin_rebuild(self) -> None:
+        """Создаёт пустой перестраиваемый индекс."""
+        await self.cache.run_script(PREFIX_RESET_SCRIPT, [self.rebuild_key], [])
+
+    async def finish_rebuild(self) -> bool:
+        """
+        Заменяет рабочий индекс перестроенным.
+
+        Returns:
+            bool: True, если индекс заменён.
+        """
+        return bool(await self.cache.run_script(PREFIX_SWAP_SCRIPT, [self.rebuild_key, self.key], []))
@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any, Optional
+
+from app.api.storage.redis import RedisManager
+from app.core.logging import logger
+
+# Захват ключа на время ttl: 1, если ключ создан этим вызовом. KEYS[1]: ключ; ARGV[1]: TTL в секундах.
+CLAIM_SCRIPT = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return 1
+end
+return 0
+"""
+
+# Максимальная длительность перестроения; по истечении блокировку может захватить другой воркер.
+REBUILD_TIMEOUT = 600
+
+# Интервал, с которым воркер проверяет, нужно ли перестроить структуру.
+REBUILD_CHECK_INTERVAL = 60.0
+
+
+class PeriodicRebuild:
+    """
+    Фоновое перестроение производной структуры в Redis (фильтра, индекса) по базе данных.
+
+    Каждый воркер API раз в REBUILD_CHECK_INTERVAL секунд проверяет, нужно ли
+    перестроение: структура отсутствует в Redis или с прошлого перестроения
+    прошло rebuild_interval секунд. Перестраивает один воркер — тот, что
+    захватил блокировку в Redis.
+
+    Наследники задают name и реализуют is_built и rebuild.
+
+    Attributes:
+        name (str): Имя структуры (для ключей блокировок и журнала).
+        rebuild_interval (float): Интервал перестроения в секундах.
+    """
+
+    name: str = ""
+
+    def __init__(self, cache: RedisManager, rebuild_interval: float):
+        """
+        Инициализирует PeriodicRebuild.
+
+        Args:
+            cache (RedisManager): Менеджер Redis.
+            rebuild_interval (float): Интервал перестроения в секундах.
+        """
+        self.cache = cache
+        self.rebuild_interval = rebuild_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def is_built(self) -> Optional[bool]:
+        """
+        Проверяет, построена ли структура.
+
+        Returns:
+            Optional[bool]: True или False; None, если Redis недоступен.
+        """
+        raise NotImplementedError
+
+    async def rebuild(self, source: Any) -> int:
+        """
+        Перестраивает структуру по базе данных.
+
+        Args:
+            source (Any): Источник данных (репозиторий).
+
+        Returns:
+            int: Количество учтённых записей.
+        """
+        raise NotImplementedError
+
+    async def _claim(self, key: str, ttl: int) -> bool:
+        """Захватывает ключ в Redis на ttl секунд; True, если ключ захвачен этим вызовом."""
+        return bool(await self.cache.run_script(CLAIM_SCRIPT, [key], [ttl]))
+
+    async def _loop(self, source: Any) -> None:
+        """Перестраивает структуру при её отсутствии и раз в rebuild_interval (одним воркером)."""
+        lock_key = f"rebuild:{self.name}"
+        while True:
+            try:
+                built = await self.is_built()
+                # Метка интервала захватывается и при первом построении, чтобы следующее было через rebuild_interval.
+                due = await self._claim(f"{lock_key}:rebuilt", int(self.rebuild_interval)) or built is False
+                if due and await self._claim(f"{lock_key}:rebuilding", REBUILD_TIMEOUT):
+                    try:
+                        await self.rebuild(source)
+                    finally:
+                        await self.cache.delete(f"{lock_key}:rebuilding")
+            except Exception as e:
+                logger.error(f"Ошибка перестроения {self.name}: {e}")
+            await asyncio.sleep(min(self.rebuild_interval, REBUILD_CHECK_INTERVAL))
+
+    async def start(self, source: Any) -> None:
+        """
+        Запускает фоновое перестроение.
+
+        Args:
+            source (Any): Источник данных (репозиторий).
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(source))
+
+    async def stop(self) -> None:
+        """Останавливает фоновое перестроение."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -1,38 +1,125 @@
+import time
+
 import redis.asyncio as redis
-from typing import Optional
+from cachetools import TLRUCache, TTLCache
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
 
+from app.api.storage.circuit_breaker import CircuitBreaker
+from app.core.monitoring import CACHE_FALLBACK_OPERATIONS
 from app.core.settings import settings
-from app.core.logging import logger
+from app.core.tracing import traced
+from app.core.logging import logger, hot_logger
+
+REDIS_SPAN_ATTRIBUTES = {"db.system": "redis"}
+
+
+class CacheNamespace:
+    """
+    Пространства имён ключей кэша.
+
+    Каждое пространство имеет собственный счётчик поколения: ключи хранятся
+    в виде ``{namespace}:{generation}:{key}``, поэтому инвалидация всего
+    пространства сводится к одному ``INCR``, а устаревшие поколения
+    удаляются Redis по истечении TTL.
+    """
+
+    USER = "user"
+    BRUTE_FORCE_UPDATE = "brute_force_update"
+    BRUTE_FORCE_DELETE = "brute_force_delete"
+
+    ALL = (USER, BRUTE_FORCE_UPDATE, BRUTE_FORCE_DELETE)
+
+    GENERATION_PREFIX = "generation"
+
+
+TOMBSTONE = "__tombstone__"
+
+# Записывает поля хэша, только если в кэше нет более новой версии записи.
+# ARGV: версия, TTL, флаг частичного обновления, поле маркера отсутствия, пары поле/значение.
+# Частичное обновление (изменённые поля версии N) применяется только к записи версии N-1:
+# если в кэше более старая версия, промежуточные изменения в нём отсутствуют, и запись
+# удаляется, чтобы не отдавать неполный профиль под новой версией. Маркеры отсутствия
+# снимаются только явным удалением.
+HSET_IF_NEWER_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[4]) == 1 then
+    return 0
+end
+local current = tonumber(redis.call('HGET', KEYS[1], 'version'))
+if current and current >= tonumber(ARGV[1]) then
+    return 0
+end
+if ARGV[3] == '1' and current ~= tonumber(ARGV[1]) - 1 then
+    if current then
+        redis.call('DEL', KEYS[1])
+    end
+    return 0
+end
+if #ARGV >= 5 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 5))
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
 
 
 class RedisManager:
     """
     Менеджер для работы с Redis.
 
+    Все команды выполняются через автоматический выключатель. Пока Redis
+    недоступен (выключатель разомкнут), команды не отправляются, а чтение и
+    запись обслуживаются локальным кэшем процесса с коротким TTL. Счётчики
+    (increment) хранятся локально отдельно, со своим TTL, чтобы окно блокировки
+    перебора паролей не сокращалось до LOCAL_CACHE_TTL.
+
     Attributes:
         client (Optional[redis.Redis]): Клиент Redis, используемый для операций.
+        breaker (CircuitBreaker): Автоматический выключатель для Redis.
     """
 
     def __init__(self):
-        """
-        Инициализирует RedisManager.
-
-        Args:
-            client (Optional[redis.Redis]): Клиент Redis, используемый для операций.
-        """
+        """Инициализирует RedisManager."""
         self.client: Optional[redis.Redis] = None
+        self.breaker = CircuitBreaker(
+            "redis",
+            failure_threshold=settings.REDIS_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=settings.REDIS_CIRCUIT_RECOVERY_TIMEOUT,
+        )
+        self._local: TTLCache = TTLCache(maxsize=settings.LOCAL_CACHE_MAXSIZE, ttl=settings.LOCAL_CACHE_TTL)
+        # Счётчик: (значение, момент истечения по time.monotonic).
+        self._counters: TLRUCache = TLRUCache(
+            maxsize=settings.LOCAL_CACHE_MAXSIZE, ttu=lambda key, value, now: value[1], timer=time.monotonic
+        )
+        self._generations: TTLCache = TTLCache(maxsize=len(CacheNamespace.ALL) * 4, ttl=settings.CACHE_GENERATION_TTL)
+        self._hset_if_newer = None
+        self._scripts: Dict[str, Any] = {}
+
+    def _register_scripts(self):
+        """Регистрирует Lua-скрипты, вызываемые через EVALSHA."""
+        self._scripts = {}
+        self._hset_if_newer = self.client.register_script(HSET_IF_NEWER_SCRIPT)
 
     async def connect(self):
         """Устанавливает соединение с Redis."""
         try:
             logger.info(f"Подключение к Redis: host={settings.REDIS_HOST}, port={settings.REDIS_PORT}")
-            self.client = redis.Redis(
+            # Блокирующий пул ждёт свободное соединение до socket_timeout, а не
+            # падает с ошибкой при исчерпании лимита соединений воркера.
+            pool = redis.BlockingConnectionPool(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 password=settings.REDIS_PASSWORD,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                max_connections=settings.redis_pool_maxsize,
+                timeout=settings.REDIS_SOCKET_TIMEOUT,
                 decode_responses=True,
             )
+            self.client = redis.Redis.from_pool(pool)
+            self._generations.clear()
+            self._register_scripts()
             await self.client.ping()
             logger.success("Успешное подключение к Redis.")
         except Exception as e:
@@ -49,36 +136,232 @@ class RedisManager:
             except Exception as e:
                 logger.error(f"Ошибка при закрытии Redis: {e}")
 
-    async def clear_cache(self):
-        """Очищает весь кэш Redis."""
-        if self.client:
+    def _available(self, operation: str) -> bool:
+        """
+        Проверяет, можно ли отправить команду в Redis.
+
+        Args:
+            operation (str): Имя операции для метрики обращений к локальному кэшу.
+
+        Returns:
+            bool: True, если выключатель пропускает вызов, иначе False.
+        """
+        if self.breaker.allow_request():
+            return True
+        CACHE_FALLBACK_OPERATIONS.labels(operation=operation).inc()
+        return False
+
+    def _failed(self, operation: str) -> None:
+        """Фиксирует ошибку Redis и переход операции на локальный кэш."""
+        self.breaker.record_failure()
+        CACHE_FALLBACK_OPERATIONS.labels(operation=operation).inc()
+
+    @staticmethod
+    def _local_key(key: str, namespace: Optional[str]) -> Tuple[Optional[str], str]:
+        """Возвращает ключ локального кэша (без учёта поколения)."""
+        return namespace, key
+
+    def _local_set(self, key: Hashable, value: Any) -> None:
+        """Сохраняет значение в локальном кэше."""
+        self._local[key] = value
+
+    def _local_get(self, key: Hashable, default: Any = None) -> Any:
+        """Возвращает значение из локального кэша (сначала среди счётчиков)."""
+        counter = self._counters.get(key)
+        if counter is not None:
+            return counter[0]
+        return self._local.get(key, default)
+
+    def _local_drop(self, key: Hashable) -> None:
+        """Удаляет ключ из локального кэша и счётчиков."""
+        self._local.pop(key, None)
+        self._counters.pop(key, None)
+
+    def _local_sync_hash(self, key: Hashable, value: Dict[str, str], full: bool) -> None:
+        """
+        Согласует локальную копию хэша с ответом Redis.
+
+        Отсутствующий в Redis ключ удаляется и локально (его удалил или заменил другой
+        воркер), полный хэш и маркер отсутствия сохраняются, а локальная копия другой
+        версии, чем частично прочитанная из Redis, удаляется.
+        """
+        if not value:
+            self._local_drop(key)
+        elif full:
+            self._local_set(key, value)
+        elif TOMBSTONE in value:
+            self._local_set(key, {TOMBSTONE: "1"})
+        elif self._local.get(key, {}).get("version") != value.get("version"):
+            self._local.pop(key, None)
+
+    def _drop_local_namespace(self, namespace: str) -> None:
+        """Удаляет из локального кэша все ключи пространства имён."""
+        for store in (self._local, self._counters):
+            for local_key in [local_key for local_key in store.keys() if local_key[0] == namespace]:
+                store.pop(local_key, None)
+
+    @traced("redis.run_script", REDIS_SPAN_ATTRIBUTES)
+    async def run_script(self, script: str, keys: Sequence[str], args: Sequence[Any]) -> Optional[Any]:
+        """
+        Выполняет Lua-скрипт через EVALSHA (с автоматической загрузкой при NOSCRIPT).
+
+        Args:
+            script (str): Исходный код скрипта. Скрипт регистрируется при первом вызове.
+            keys (Sequence[str]): Ключи скрипта (KEYS).
+            args (Sequence[Any]): Аргументы скрипта (ARGV).
+
+        Returns:
+            Optional[Any]: Результат скрипта или None, если Redis недоступен.
+        """
+        if not self._available("run_script"):
+            return None
+
+        try:
+            registered = self._scripts.get(script)
+            if registered is None:
+                registered = self._scripts[script] = self.client.register_script(script)
+            result = await registered(keys=keys, args=args)
+            self.breaker.record_success()
+            return result
+        except Exception as e:
+            self._failed("run_script")
+            logger.error(f"Ошибка при выполнении Lua-скрипта в Redis: {e}")
+            return None
+
+    @traced("redis.clear_cache", REDIS_SPAN_ATTRIBUTES)
+    async def clear_cache(self, namespaces: Iterable[str] = (CacheNamespace.USER,)):
+        """
+        Инвалидирует пространства имён кэша, не затрагивая остальные данные в REDIS_DB.
+
+        Счётчики попыток ввода пароля (BRUTE_FORCE_*) по умолчанию не сбрасываются,
+        чтобы очистка кэша не снимала блокировки; их пространства передаются явно.
+
+        Args:
+            namespaces (Iterable[str], optional): Пространства имён для инвалидации.
+                По умолчанию только профили пользователей (CacheNamespace.USER).
+        """
+        namespaces = list(namespaces)
+        for namespace in namespaces:
+            self._drop_local_namespace(namespace)
+
+        if self.client and self._available("clear_cache"):
             try:
-                await self.client.flushdb()
-                logger.info("Кэш Redis успешно очищен.")
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for namespace in namespaces:
+                        pipe.incr(self._generation_key(namespace))
+                    generations = await pipe.execute()
+                self.breaker.record_success()
+                self._generations.update(zip(namespaces, generations))
+                logger.info("Кэш Redis успешно инвалидирован.")
             except Exception as e:
+                self._failed("clear_cache")
                 logger.error(f"Ошибка при очистке кэша Redis: {e}")
 
-    async def get(self, key: str) -> Optional[str]:
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        """Возвращает ключ счётчика поколения для пространства имён."""
+        return f"{CacheNamespace.GENERATION_PREFIX}:{namespace}"
+
+    @traced("redis.get_generation", REDIS_SPAN_ATTRIBUTES)
+    async def get_generation(self, namespace: str) -> int:
+        """
+        Возвращает текущее поколение пространства имён.
+
+        Поколение кэшируется в процессе на CACHE_GENERATION_TTL секунд, чтобы не
+        добавлять лишний GET к каждой операции с ключом. Инвалидация в этом процессе
+        видна сразу, в других воркерах — не позже чем через CACHE_GENERATION_TTL.
+
+        Args:
+            namespace (str): Пространство имён.
+
+        Returns:
+            int: Номер поколения (0, если пространство ещё не инвалидировалось).
+        """
+        generation = self._generations.get(namespace)
+        if generation is None:
+            value = await self.client.get(self._generation_key(namespace))
+            generation = self._generations[namespace] = int(value) if value else 0
+        return generation
+
+    @traced("redis.invalidate_namespace", REDIS_SPAN_ATTRIBUTES)
+    async def invalidate_namespace(self, namespace: str) -> int:
+        """
+        Инвалидирует все ключи пространства имён одним INCR счётчика поколения.
+
+        Args:
+            namespace (str): Пространство имён.
+
+        Returns:
+            int: Новый номер поколения или 0 в случае ошибки.
+        """
+        self._drop_local_namespace(namespace)
+        if not self._available("invalidate_namespace"):
+            return 0
+
+        try:
+            generation = await self.client.incr(self._generation_key(namespace))
+            self.breaker.record_success()
+            self._generations[namespace] = generation
+            logger.info(f"Пространство имён {namespace} инвалидировано (поколение {generation}).")
+            return generation
+        except Exception as e:
+            self._failed("invalidate_namespace")
+            logger.error(f"Ошибка при инвалидации пространства имён {namespace}: {e}")
+            return 0
+
+    async def _resolve_key(self, key: str, namespace: Optional[str]) -> str:
+        """
+        Формирует полный ключ с учётом пространства имён и его поколения.
+
+        Args:
+            key (str): Ключ внутри пространства имён.
+            namespace (Optional[str]): Пространство имён или None для ключа без пространства.
+
+        Returns:
+            str: Полный ключ в Redis.
+        """
+        if namespace is None:
+            return key
+        generation = await self.get_generation(namespace)
+        return f"{namespace}:{generation}:{key}"
+
+    @traced("redis.get", REDIS_SPAN_ATTRIBUTES)
+    async def get(self, key: str, namespace: Optional[str] = None) -> Optional[str]:
         """
         Получает значение из Redis по ключу.
 
         Args:
             key (str): Ключ в хранилище.
+            namespace (Optional[str]): Пространство имён ключа.
 
         Returns:
             Optional[str]: Значение, если ключ найден, иначе None.
         """
+        local_key = self._local_key(key, namespace)
+        if not self._available("get"):
+            return self._local_get(local_key)
+
         try:
+            key = await self._resolve_key(key, namespace)
             value = await self.client.get(key)
+            self.breaker.record_success()
             if value is not None:
-                logger.info(f"Ключ {key} найден в Redis.")
+                counter = self._counters.get(local_key)
+                if counter is not None:
+                    self._counters[local_key] = (value, counter[1])
+                else:
+                    self._local_set(local_key, value)
+                hot_logger.info("Ключ {} найден в Redis.", key)
                 return value
-            logger.info(f"Ключ {key} не найден в Redis.")
+            self._local_drop(local_key)
+            hot_logger.info("Ключ {} не найден в Redis.", key)
         except Exception as e:
+            self._failed("get")
             logger.error(f"Ошибка при получении ключа {key} из Redis: {e}")
-            return None
+            return self._local_get(local_key)
 
-    async def set(self, key: str, value: str, expire: int = 3600):
+    @traced("redis.set", REDIS_SPAN_ATTRIBUTES)
+    async def set(self, key: str, value: str, expire: int = 3600, namespace: Optional[str] = None):
         """
         Сохраняет значение в Redis.
 
@@ -86,43 +369,350 @@ class RedisManager:
             key (str): Ключ.
             value (str): Значение.
             expire (int, optional): Время жизни в секундах. По умолчанию 3600.
+            namespace (Optional[str]): Пространство имён ключа.
         """
+        self._local_set(self._local_key(key, namespace), value)
+        if not self._available("set"):
+            return
+
         try:
+            key = await self._resolve_key(key, namespace)
             await self.client.set(key, value, ex=expire)
-            logger.info(f"Ключ {key} сохранён в Redis (TTL={expire} сек.).")
+            self.breaker.record_success()
+            hot_logger.info("Ключ {} сохранён в Redis (TTL={} сек.).", key, expire)
+        except Exception as e:
+            self._failed("set")
+            logger.error(f"Ошибка при сохранении ключа {key} в Redis: {e}")
+
+    @staticmethod
+    def _project(value: Dict[str, str], fields: Optional[Sequence[str]]) -> Dict[str, str]:
+        """Оставляет в хэше только запрошенные поля и поле маркера отсутствия."""
+        if fields is None:
+            return dict(value)
+        return {field: value[field] for field in (*fields, TOMBSTONE) if field in value}
+
+    @traced("redis.get_hash", REDIS_SPAN_ATTRIBUTES)
+    async def get_hash(
+        self,
+        key: str,
+        fields: Optional[Sequence[str]] = None,
+        namespace: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Получает поля хэша из Redis.
+
+        Args:
+            key (str): Ключ.
+            fields (Optional[Sequence[str]]): Запрашиваемые поля (HMGET) или None для всех полей (HGETALL).
+                Поле маркера отсутствия запрашивается всегда.
+            namespace (Optional[str]): Пространство имён ключа.
+
+        Returns:
+            Dict[str, str]: Найденные поля или пустой словарь, если ключ не найден.
+        """
+        local_key = self._local_key(key, namespace)
+        if not self._available("get_hash"):
+            return self._project(self._local.get(local_key, {}), fields)
+
+        try:
+            key = await self._resolve_key(key, namespace)
+            if fields is None:
+                value = await self.client.hgetall(key)
+            else:
+                requested = [*fields, TOMBSTONE]
+                values = await self.client.hmget(key, requested)
+                value = {field: item for field, item in zip(requested, values) if item is not None}
+            self.breaker.record_success()
+            self._local_sync_hash(local_key, value, full=fields is None)
+
+            if value:
+                hot_logger.info("Ключ {} найден в Redis.", key)
+            else:
+                hot_logger.info("Ключ {} не найден в Redis.", key)
+            return value
+        except Exception as e:
+            self._failed("get_hash")
+            logger.error(f"Ошибка при получении ключа {key} из Redis: {e}")
+            return self._project(self._local.get(local_key, {}), fields)
+
+    @traced("redis.get_hashes", REDIS_SPAN_ATTRIBUTES)
+    async def get_hashes(
+        self,
+        keys: Sequence[str],
+        fields: Optional[Sequence[str]] = None,
+        namespace: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Получает поля нескольких хэшей одним конвейером команд (HGETALL или HMGET на ключ).
+
+        Для хэшей нет аналога MGET, поэтому команды отправляются конвейером: один
+        обмен с Redis на весь набор ключей. Поколение пространства имён читается один раз.
+
+        Args:
+            keys (Sequence[str]): Ключи.
+            fields (Optional[Sequence[str]]): Запрашиваемые поля или None для всех полей.
+                Поле маркера отсутствия запрашивается всегда.
+            namespace (Optional[str]): Пространство имён ключей.
+
+        Returns:
+            List[Dict[str, str]]: Найденные поля для каждого ключа в порядке ключей
+                (пустой словарь, если ключ не найден).
+        """
+        local_keys = [self._local_key(key, namespace) for key in keys]
+        if not self._available("get_hashes"):
+            return [self._project(self._local.get(local_key, {}), fields) for local_key in local_keys]
+
+        try:
+            prefix = await self._resolve_key("", namespace)
+            requested = None if fields is None else [*fields, TOMBSTONE]
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    if requested is None:
+                        pipe.hgetall(f"{prefix}{key}")
+                    else:
+                        pipe.hmget(f"{prefix}{key}", requested)
+                results = await pipe.execute()
+            self.breaker.record_success()
+
+            values: List[Dict[str, str]] = []
+            for local_key, result in zip(local_keys, results):
+                if requested is not None:
+                    result = {field: item for field, item in zip(requested, result) if item is not None}
+                self._local_sync_hash(local_key, result, full=requested is None)
+                values.append(result)
+            hot_logger.info("Получено {} из {} ключей из Redis.", sum(1 for value in values if value), len(keys))
+            return values
+        except Exception as e:
+            self._failed("get_hashes")
+            logger.error(f"Ошибка при пакетном получении {len(keys)} ключей из Redis: {e}")
+            return [self._project(self._local.get(local_key, {}), fields) for local_key in local_keys]
+
+    def _local_hset_if_newer(
+        self,
+        local_key: Hashable,
+        mapping: Dict[str, str],
+        version: int,
+        partial: bool,
+    ) -> bool:
+        """Повторяет логику HSET_IF_NEWER_SCRIPT для локального кэша."""
+        current = self._local.get(local_key)
+        if current and TOMBSTONE in current:
+            return False
+
+        current_version = int(current["version"]) if current and "version" in current else None
+        if current_version is not None and current_version >= version:
+            return False
+        if partial and current_version != version - 1:
+            self._local.pop(local_key, None)
+            return False
+
+        self._local_set(local_key, {**(current or {}), **mapping, "version": str(version)})
+        return True
+
+    @traced("redis.hset_if_newer", REDIS_SPAN_ATTRIBUTES)
+    async def hset_if_newer(
+        self,
+        key: str,
+        mapping: Dict[str, str],
+        version: int,
+        expire: int = 3600,
+        partial: bool = False,
+        namespace: Optional[str] = None,
+    ) -> bool:
+        """
+        Атомарно записывает поля хэша, если в кэше нет записи с той же или более новой версией.
+
+        Args:
+            key (str): Ключ.
+            mapping (Dict[str, str]): Записываемые поля. Поле version выставляется автоматически.
+            version (int): Версия записи.
+            expire (int, optional): Время жизни в секундах. По умолчанию 3600.
+            partial (bool, optional): Обновить только переданные поля записи предыдущей версии
+                (version - 1). Запись более старой версии удаляется.
+            namespace (Optional[str]): Пространство имён ключа.
+
+        Returns:
+            bool: True, если поля записаны, False если запись отклонена или произошла ошибка.
+        """
+        local_key = self._local_key(key, namespace)
+        if not self._available("hset_if_newer"):
+            return self._local_hset_if_newer(local_key, mapping, version, partial)
+
+        try:
+            key = await self._resolve_key(key, namespace)
+            args = [version, expire, int(partial), TOMBSTONE]
+            for field, value in mapping.items():
+                args.extend((field, value))
+
+            stored = await self._hset_if_newer(keys=[key], args=args)
+            self.breaker.record_success()
+            if stored:
+                self._local_hset_if_newer(local_key, mapping, version, partial)
+                hot_logger.info("Поля {} ключа {} сохранены в Redis (версия {}).", list(mapping), key, version)
+            else:
+                hot_logger.info("Запись ключа {} версии {} отклонена.", key, version)
+            return bool(stored)
         except Exception as e:
+            self._failed("hset_if_newer")
             logger.error(f"Ошибка при сохранении ключа {key} в Redis: {e}")
+            return self._local_hset_if_newer(local_key, mapping, version, partial)
+
+    @traced("redis.hset_if_newer_many", REDIS_SPAN_ATTRIBUTES)
+    async def hset_if_newer_many(
+        self,
+        entries: Sequence[Tuple[str, Dict[str, str], int]],
+        expire: int = 3600,
+        namespace: Optional[str] = None,
+    ) -> List[bool]:
+        """
+        Записывает несколько хэшей с проверкой версии одним конвейером вызовов HSET_IF_NEWER_SCRIPT.
+
+        Args:
+            entries (Sequence[Tuple[str, Dict[str, str], int]]): Ключ, поля и версия каждой записи.
+            expire (int, optional): Время жизни в секундах. По умолчанию 3600.
+            namespace (Optional[str]): Пространство имён ключей.
+
+        Returns:
+            List[bool]: Для каждой записи True, если поля записаны.
+        """
+        local_entries = [(self._local_key(key, namespace), mapping, version) for key, mapping, version in entries]
+        if not self._available("hset_if_newer_many"):
+            return [self._local_hset_if_newer(*entry, partial=False) for entry in local_entries]
+
+        try:
+            prefix = await self._resolve_key("", namespace)
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, mapping, version in entries:
+                    args = [version, expire, 0, TOMBSTONE]
+                    for field, value in mapping.items():
+                        args.extend((field, value))
+                    await self._hset_if_newer(keys=[f"{prefix}{key}"], args=args, client=pipe)
+                results = await pipe.execute()
+            self.breaker.record_success()
+
+            for entry, stored in zip(local_entries, results):
+                if stored:
+                    self._local_hset_if_newer(*entry, partial=False)
+            hot_logger.info("Сохранено {} из {} записей в Redis.", sum(map(bool, results)), len(entries))
+            return [bool(stored) for stored in results]
+        except Exception as e:
+            self._failed("hset_if_newer_many")
+            logger.error(f"Ошибка при пакетном сохранении {len(entries)} записей в Redis: {e}")
+            return [self._local_hset_if_newer(*entry, partial=False) for entry in local_entries]
+
+    @traced("redis.set_tombstone", REDIS_SPAN_ATTRIBUTES)
+    async def set_tombstone(self, key: str, expire: int, namespace: Optional[str] = None):
+        """
+        Сохраняет маркер отсутствующей записи (негативное кэширование) вместо хэша записи.
+
+        Args:
+            key (str): Ключ.
+            expire (int): Время жизни маркера в секундах.
+            namespace (Optional[str]): Пространство имён ключа.
+        """
+        self._local_set(self._local_key(key, namespace), {TOMBSTONE: "1"})
+        if not self._available("set_tombstone"):
+            return
+
+        try:
+            key = await self._resolve_key(key, namespace)
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, TOMBSTONE, 1)
+                pipe.expire(key, expire)
+                await pipe.execute()
+            self.breaker.record_success()
+            hot_logger.info("Маркер отсутствия {} сохранён в Redis (TTL={} сек.).", key, expire)
+        except Exception as e:
+            self._failed("set_tombstone")
+            logger.error(f"Ошибка при сохранении маркера отсутствия {key} в Redis: {e}")
 
-    async def delete(self, key: str):
+    @traced("redis.delete", REDIS_SPAN_ATTRIBUTES)
+    async def delete(self, key: str, namespace: Optional[str] = None):
         """
         Удаляет ключ из Redis.
 
         Args:
             key (str): Ключ.
+            namespace (Optional[str]): Пространство имён ключа.
         """
+        self._local_drop(self._local_key(key, namespace))
+        if not self._available("delete"):
+            return
+
         try:
+            key = await self._resolve_key(key, namespace)
             await self.client.delete(key)
-            logger.info(f"Ключ {key} удалён из Redis.")
+            self.breaker.record_success()
+            hot_logger.info("Ключ {} удалён из Redis.", key)
         except Exception as e:
+            self._failed("delete")
             logger.error(f"Ошибка при удалении ключа {key} из Redis: {e}")
 
-    async def increment(self, key: str, expire: int = 1800) -> int:
+    @traced("redis.increment_batch", REDIS_SPAN_ATTRIBUTES)
+    async def increment_batch(self, counters: Dict[str, Tuple[int, int]]) -> Optional[List[int]]:
+        """
+        Увеличивает несколько счётчиков одним конвейером команд (INCRBY и EXPIRE).
+
+        Args:
+            counters (Dict[str, Tuple[int, int]]): Приращение и TTL в секундах для каждого ключа.
+
+        Returns:
+            Optional[List[int]]: Новые значения счётчиков в порядке ключей или None, если Redis недоступен.
+        """
+        if not self._available("increment_batch"):
+            return None
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, (amount, expire) in counters.items():
+                    pipe.incrby(key, amount)
+                    pipe.expire(key, expire)
+                results = await pipe.execute()
+            self.breaker.record_success()
+            return results[::2]
+        except Exception as e:
+            self._failed("increment_batch")
+            logger.error(f"Ошибка при пакетном увеличении {len(counters)} счётчиков в Redis: {e}")
+            return None
+
+    def _local_set_counter(self, local_key: Hashable, value: int, expire: int) -> None:
+        """Сохраняет счётчик локально на expire секунд."""
+        self._local.pop(local_key, None)
+        self._counters[local_key] = (str(value), time.monotonic() + expire)
+
+    def _local_increment(self, local_key: Hashable, expire: int) -> int:
+        """Увеличивает локальный счётчик и продлевает его TTL, как INCR и EXPIRE в Redis."""
+        value = int(self._local_get(local_key, 0)) + 1
+        self._local_set_counter(local_key, value, expire)
+        return value
+
+    @traced("redis.increment", REDIS_SPAN_ATTRIBUTES)
+    async def increment(self, key: str, expire: int = 1800, namespace: Optional[str] = None) -> int:
         """
         Увеличивает значение ключа. Если ключа нет, создаёт его со значением 1.
 
         Args:
             key (str): Ключ.
             expire (int, optional): TTL в секундах. По умолчанию 1800.
+            namespace (Optional[str]): Пространство имён ключа.
 
         Returns:
             int: Новое значение ключа.
         """
+        local_key = self._local_key(key, namespace)
+        if not self._available("increment"):
+            return self._local_increment(local_key, expire)
+
         try:
+            key = await self._resolve_key(key, namespace)
             value = await self.client.incr(key)
             await self.client.expire(key, expire)
-            logger.info(f"Значение ключа {key} увеличено до {value}.")
+            self.breaker.record_success()
+            self._local_set_counter(local_key, value, expire)
+            hot_logger.info("Значение ключа {} увеличено до {}.", key, value)
             return value
         except Exception as e:
+            self._failed("increment")
             logger.error(f"Ошибка при увеличении значения ключа {key}: {e}")
-            return 0
-    
\ No newline at end of file
+            return self._local_increment(local_key, expire)
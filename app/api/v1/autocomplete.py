@@ -0,0 +1,143 @@
+from typing import List, Optional
+
+from app.api.storage.prefix_index import PrefixIndex
+from app.api.storage.rebuild import PeriodicRebuild
+from app.api.storage.redis import RedisManager
+from app.api.v1.availability import normalize
+from app.api.v1.repositories import UserRepository
+from app.core.settings import settings
+from app.core.logging import logger
+
+# Разделитель частей элемента индекса; меньше любого символа имени, поэтому
+# короткие имена идут раньше своих продолжений ("ann" раньше "anna").
+SEPARATOR = "\x00"
+
+
+class UsernameIndex(PeriodicRebuild):
+    """
+    Индекс имён активных пользователей для автодополнения упоминаний.
+
+    Элемент индекса — "нормализованное имя\\0имя\\0id", поэтому поиск не учитывает
+    регистр и диакритику, а ответ собирается без обращения к базе данных.
+    Индекс обновляется при регистрации, изменении имени, удалении и
+    восстановлении аккаунта и перестраивается в фоне одним из воркеров раз в
+    AUTOCOMPLETE_REBUILD_INTERVAL секунд и при отсутствии индекса в Redis.
+
+    Attributes:
+        index (PrefixIndex): Индекс в Redis.
+        rebuild_interval (float): Интервал перестроения в секундах.
+    """
+
+    name = "autocomplete"
+
+    def __init__(self, cache: RedisManager, rebuild_interval: float = settings.AUTOCOMPLETE_REBUILD_INTERVAL):
+        """
+        Инициализирует UsernameIndex.
+
+        Args:
+            cache (RedisManager): Менеджер Redis.
+            rebuild_interval (float): Интервал перестроения в секундах.
+        """
+        super().__init__(cache, rebuild_interval)
+        self.index = PrefixIndex(cache, "users:username")
+
+    @staticmethod
+    def _sort_key(value: str) -> str:
+        """Нормализует значение для индекса; разделитель из него удаляется."""
+        return normalize(value).replace(SEPARATOR, "")
+
+    @classmethod
+    def _member(cls, user_id: int, username: str) -> str:
+        """Формирует элемент индекса."""
+        return f"{cls._sort_key(username)}{SEPARATOR}{username}{SEPARATOR}{user_id}"
+
+    async def search(self, prefix: str, limit: int) -> Optional[List[dict]]:
+        """
+        Ищет пользователей, имя которых начинается с prefix.
+
+        Args:
+            prefix (str): Начало имени.
+            limit (int): Максимальное число результатов.
+
+        Returns:
+            Optional[List[dict]]: Пользователи (id, username) в алфавитном порядке или None,
+                если индекс не построен или Redis недоступен.
+        """
+        prefix = self._sort_key(prefix)
+        if not prefix:
+            return []
+
+        members = await self.index.search(prefix, limit)
+        if members is None:
+            return None
+
+        users = []
+        for member in members:
+            # Первая часть не содержит разделителя, а ID — последняя часть,
+            # поэтому имя восстанавливается целиком, даже если в нём есть разделитель.
+            rest, user_id = member.rsplit(SEPARATOR, 1)
+            _, username = rest.split(SEPARATOR, 1)
+            users.append({"id": int(user_id), "username": username})
+        return users
+
+    async def add(self, user_id: int, username: str) -> None:
+        """
+        Добавляет пользователя в индекс.
+
+        Args:
+            user_id (int): ID пользователя.
+            username (str): Имя пользователя.
+        """
+        await self.index.replace(None, [self._member(user_id, username)])
+
+    async def rename(self, user_id: int, old_username: str, new_username: str) -> None:
+        """
+        Заменяет имя пользователя в индексе.
+
+        Args:
+            user_id (int): ID пользователя.
+            old_username (str): Прежнее имя.
+            new_username (str): Новое имя.
+        """
+        await self.index.replace(self._member(user_id, old_username), [self._member(user_id, new_username)])
+
+    async def remove(self, user_id: int, username: str) -> None:
+        """
+        Удаляет пользователя из индекса.
+
+        Args:
+            user_id (int): ID пользователя.
+            username (str): Имя пользователя.
+        """
+        await self.index.replace(self._member(user_id, username))
+
+    async def is_built(self) -> Optional[bool]:
+        """
+        Проверяет, построен ли индекс.
+
+        Returns:
+            Optional[bool]: True или False; None, если Redis недоступен.
+        """
+        return await self.index.is_built()
+
+    async def rebuild(self, user_repo: UserRepository) -> int:
+        """
+        Перестраивает индекс по активным пользователям и атомарно заменяет рабочий.
+
+        Args:
+            user_repo (UserRepository): Репозиторий пользователей.
+
+        Returns:
+            int: Количество учтённых пользователей.
+        """
+        await self.index.begin_rebuild()
+
+        total = 0
+        async for users in user_repo.iter_active_usernames():
+            members = [self._member(user["id"], user["username"]) for user in users]
+            await self.index.replace(None, members, rebuilding=True)
+            total += len(users)
+
+        await self.index.finish_rebuild()
+        logger.info(f"Индекс автодополнения имён перестроен: {total} пользователей.")
+        return total
@@ -0,0 +1,125 @@
+import unicodedata
+from typing import Optional
+
+from app.api.storage.bloom import BloomFilter
+from app.api.storage.rebuild import PeriodicRebuild
+from app.api.storage.redis import RedisManager
+from app.api.v1.repositories import UserRepository
+from app.core.settings import settings
+from app.core.logging import logger
+
+
+def normalize(value: str) -> str:
+    """
+    Приводит значение к виду, в котором его сравнивает MySQL (регистр и диакритика не учитываются).
+
+    Нормализация может только объединять значения, поэтому даёт лишние
+    ложноположительные ответы фильтра, но не ложноотрицательные.
+
+    Args:
+        value (str): Имя пользователя или email.
+
+    Returns:
+        str: Нормализованное значение.
+    """
+    decomposed = unicodedata.normalize("NFKD", value.strip().casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+class AvailabilityFilter(PeriodicRebuild):
+    """
+    Фильтры Блума занятых имён пользователей и email.
+
+    Ответ "значения точно нет" не требует обращения к базе данных; возможные
+    совпадения подтверждаются индексированным запросом. Значения добавляются
+    при регистрации и изменении профиля. Фильтр Блума не поддерживает удаление,
+    поэтому освобождённые значения (окончательное удаление, смена имени)
+    остаются ложноположительными до очередного перестроения, которое выполняется
+    в фоне одним из воркеров раз в AVAILABILITY_REBUILD_INTERVAL секунд и при
+    отсутствии фильтра в Redis.
+
+    Attributes:
+        filters (dict): Фильтры по полям (username, email).
+        rebuild_interval (float): Интервал перестроения в секундах.
+    """
+
+    FIELDS = ("username", "email")
+    name = "availability"
+
+    def __init__(
+        self,
+        cache: RedisManager,
+        capacity: int = settings.AVAILABILITY_BLOOM_CAPACITY,
+        error_rate: float = settings.AVAILABILITY_BLOOM_ERROR_RATE,
+        rebuild_interval: float = settings.AVAILABILITY_REBUILD_INTERVAL,
+    ):
+        """
+        Инициализирует AvailabilityFilter.
+
+        Args:
+            cache (RedisManager): Менеджер Redis.
+            capacity (int): Ожидаемое количество пользователей.
+            error_rate (float): Допустимая доля ложноположительных ответов.
+            rebuild_interval (float): Интервал перестроения в секундах.
+        """
+        super().__init__(cache, rebuild_interval)
+        self.filters = {field: BloomFilter(cache, f"users:{field}", capacity, error_rate) for field in self.FIELDS}
+
+    async def might_be_taken(self, field: str, value: str) -> Optional[bool]:
+        """
+        Проверяет значение по фильтру.
+
+        Args:
+            field (str): Поле: username или email.
+            value (str): Значение.
+
+        Returns:
+            Optional[bool]: False — значение точно свободно, True — возможно занято,
+                None — фильтр недоступен.
+        """
+        return await self.filters[field].might_contain(normalize(value))
+
+    async def add(self, username: Optional[str] = None, email: Optional[str] = None) -> None:
+        """
+        Добавляет занятые значения в фильтры.
+
+        Args:
+            username (Optional[str]): Имя пользователя.
+            email (Optional[str]): Email.
+        """
+        for field, value in (("username", username), ("email", email)):
+            if value:
+                await self.filters[field].add([normalize(value)])
+
+    async def is_built(self) -> Optional[bool]:
+        """
+        Проверяет, построены ли фильтры.
+
+        Returns:
+            Optional[bool]: True или False; None, если Redis недоступен.
+        """
+        return await self.filters["username"].is_built()
+
+    async def rebuild(self, user_repo: UserRepository) -> int:
+        """
+        Перестраивает фильтры по таблице users и атомарно заменяет рабочие.
+
+        Args:
+            user_repo (UserRepository): Репозиторий пользователей.
+
+        Returns:
+            int: Количество учтённых пользователей.
+        """
+        for bloom in self.filters.values():
+            await bloom.begin_rebuild()
+
+        total = 0
+        async for users in user_repo.iter_usernames_and_emails():
+            for field, bloom in self.filters.items():
+                await bloom.add([normalize(user[field]) for user in users], rebuilding=True)
+            total += len(users)
+
+        for bloom in self.filters.values():
+            await bloom.finish_rebuild()
+        logger.info(f"Фильтры доступности имён и email перестроены: {total} пользователей.")
+        return total
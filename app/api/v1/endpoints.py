@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Request, Response, Depends, status
+from typing import Optional, Tuple
 
-from app.api.v1.services import UserService
+from pydantic import EmailStr
+
+from fastapi import APIRouter, HTTPException, Response, Depends, Header, Query, status
+
+from app.api.v1.services import UserService, PROFILE_FIELDS, PUBLIC_PROFILE_FIELDS
 
 from app.core.dependencies.services import get_user_service
-from app.api.security.rate_limiter import get_rate_limiter
 from app.api.common.authentication import get_current_user
+from app.api.common.etag import etag_matches
+from app.api.common.fields import sparse_fields
+from app.core.settings import settings
 
 from app.api.v1.schemas import (
     UserRegister,
@@ -12,6 +18,7 @@ from app.api.v1.schemas import (
     UserUpdate,
     UserDelete,
     UserRestore,
+    UserBatchRequest,
     User,
 )
 
@@ -19,9 +26,7 @@ router = APIRouter()
 
 
 @router.post("/auth/register", response_model=dict, status_code=status.HTTP_201_CREATED)
-@get_rate_limiter().limit("20/minute")
 async def register_user_endpoint(
-    request: Request,
     user_data: UserRegister,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -30,9 +35,7 @@ async def register_user_endpoint(
 
 
 @router.post("/auth/login", response_model=dict, status_code=status.HTTP_200_OK)
-@get_rate_limiter().limit("30/minute")
 async def login_user_endpoint(
-    request: Request,
     response: Response,
     user_data: UserLogin,
     user_service: UserService = Depends(get_user_service),
@@ -74,21 +77,92 @@ async def logout_user_endpoint():
     return response
 
 
+@router.get("/auth/availability", response_model=dict, status_code=status.HTTP_200_OK)
+async def check_availability_endpoint(
+    username: Optional[str] = Query(None, min_length=3, max_length=50),
+    email: Optional[EmailStr] = Query(None),
+    user_service: UserService = Depends(get_user_service),
+):
+    """
+    Проверить, свободны ли имя пользователя и email (для формы регистрации).
+
+    Свободные значения в большинстве случаев определяются по фильтру Блума без
+    обращения к базе данных.
+    """
+    if username is None and email is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Укажите username и/или email.",
+        )
+
+    return await user_service.check_availability(username, email)
+
+
 @router.get("/users/current", response_model=dict, status_code=status.HTTP_200_OK)
-@get_rate_limiter().limit("60/minute")
 async def get_user_endpoint(
-    request: Request,
     user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
+    fields: Tuple[str, ...] = Depends(sparse_fields(PROFILE_FIELDS)),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    Получить данные текущего пользователя.
+
+    Ответ содержит ETag по версии профиля. Если ETag из If-None-Match совпадает
+    с версией в кэше, возвращается 304 без чтения профиля и тела ответа.
+    """
+    headers = {"Cache-Control": "private, no-cache"}
+    if if_none_match:
+        etag = await user_service.get_user_etag(user["id"], fields)
+        if etag and etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": etag})
+
+    content, etag = await user_service.get_user(user["id"], fields)
+    headers["ETag"] = etag
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@router.get("/users", response_model=list, status_code=status.HTTP_200_OK)
+async def get_users_endpoint(
+    ids: str = Query(..., pattern=r"^\d+(,\d+)*$", description="ID пользователей через запятую"),
+    user_service: UserService = Depends(get_user_service),
+    fields: Tuple[str, ...] = Depends(sparse_fields(PUBLIC_PROFILE_FIELDS)),
+):
+    """Получить публичные профили пользователей по списку ID в порядке запроса."""
+    user_ids = [int(user_id) for user_id in ids.split(",")]
+    if len(user_ids) > settings.USER_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Не более {settings.USER_BATCH_MAX_IDS} ID за запрос.",
+        )
+
+    return Response(content=await user_service.get_users(user_ids, fields), media_type="application/json")
+
+
+@router.get("/users/autocomplete", response_model=list, status_code=status.HTTP_200_OK)
+async def autocomplete_users_endpoint(
+    q: str = Query(..., min_length=1, max_length=50, description="Начало имени пользователя"),
+    limit: int = Query(settings.AUTOCOMPLETE_DEFAULT_LIMIT, ge=1, le=settings.AUTOCOMPLETE_MAX_LIMIT),
+    user_service: UserService = Depends(get_user_service),
+):
+    """Автодополнение имён пользователей для упоминаний: первые limit имён, начинающихся с q."""
+    return await user_service.autocomplete_usernames(q, limit)
+
+
+@router.post("/users/batch", response_model=list, status_code=status.HTTP_200_OK)
+async def get_users_batch_endpoint(
+    batch: UserBatchRequest,
+    user_service: UserService = Depends(get_user_service),
+    fields: Tuple[str, ...] = Depends(sparse_fields(PUBLIC_PROFILE_FIELDS)),
 ):
-    """Получить данные текущего пользователя."""
-    return await user_service.get_user(user["id"])
+    """Получить публичные профили пользователей по списку ID в теле запроса (для больших наборов)."""
+    return Response(content=await user_service.get_users(batch.ids, fields), media_type="application/json")
 
 
 @router.patch("/users/current", response_model=dict, status_code=status.HTTP_200_OK)
-@get_rate_limiter().limit("20/minute")
 async def update_user_endpoint(
-    request: Request,
     response: Response,
     user_data: UserUpdate,
     user: User = Depends(get_current_user),
@@ -105,9 +179,7 @@ async def update_user_endpoint(
 
 
 @router.delete("/users/current", response_model=dict, status_code=status.HTTP_200_OK)
-@get_rate_limiter().limit("20/minute")
 async def delete_user_endpoint(
-    request: Request,
     response: Response,
     user_data: UserDelete,
     user: User = Depends(get_current_user),
@@ -121,3 +193,14 @@ async def delete_user_endpoint(
         response.delete_cookie(key="refresh_token")
 
     return {"message": "Your account has been successfully deleted. Check your email for restoration instructions."}
+
+
+@router.post("/users/restore", response_model=dict, status_code=status.HTTP_200_OK)
+async def restore_user_endpoint(
+    user_data: UserRestore,
+    user_service: UserService = Depends(get_user_service),
+):
+    """Восстановить ранее удалённый аккаунт по токену восстановления."""
+    await user_service.restore_user(user_data)
+
+    return {"message": "Your account has been successfully restored."}
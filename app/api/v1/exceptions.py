@@ -28,6 +28,13 @@ class UserAlreadyExistsException(ServiceException):
         super().__init__(f"Пользователь с email {email} уже существует.", 400)
 
 
+class UsernameAlreadyExistsException(ServiceException):
+    """Исключение для ситуации, когда имя пользователя уже занято."""
+
+    def __init__(self, username: str):
+        super().__init__(f"Пользователь с именем {username} уже существует.", 400)
+
+
 class InvalidCredentialsException(ServiceException):
     """Исключение для недействительных учетных данных."""
 
@@ -63,4 +70,11 @@ class UserDeletionException(ServiceException):
     """Исключение для ошибки удаления пользователя."""
 
     def __init__(self, user_id: int):
-        super().__init__(f"Ошибка при удалении пользователя с ID {user_id}.", 500)
\ No newline at end of file
+        super().__init__(f"Ошибка при удалении пользователя с ID {user_id}.", 500)
+
+
+class UserRestorationException(ServiceException):
+    """Исключение для ошибки восстановления пользователя."""
+
+    def __init__(self, email: str):
+        super().__init__(f"Ошибка при восстановлении пользователя с email {email}.", 500)
\ No newline at end of file
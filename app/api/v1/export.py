@@ -0,0 +1,160 @@
+"""
+Массовая выгрузка пользователей (NDJSON или CSV) для аналитики и переиндексации.
+
+Выгрузка доступна как служебный эндпоинт GET /operator/export/users и как CLI:
+
+    python -m app.api.v1.export --format csv --output users.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import time
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+
+import orjson
+from fastapi import Depends, FastAPI, Query
+from fastapi.responses import StreamingResponse
+
+from app.api.security.operator import require_operator
+from app.api.storage.database import Database
+from app.api.v1.repositories import UserRepository, EXPORT_COLUMNS
+from app.core.dependencies.repositories import get_user_repository
+from app.core.logging import logger
+from app.core.settings import settings
+
+# Типы содержимого по формату выгрузки.
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Начальные символы, с которых табличные редакторы начинают формулу; такие ячейки CSV экранируются.
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _encode_ndjson(users: List[dict]) -> bytes:
+    """Кодирует порцию пользователей в NDJSON (по объекту на строку)."""
+    return b"".join(orjson.dumps(user) + b"\n" for user in users)
+
+
+def _csv_cell(value) -> object:
+    """
+    Приводит значение к ячейке CSV (даты в ISO 8601, NULL — пустая строка).
+
+    Строка, которую табличный редактор принял бы за формулу, начинается с апострофа.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def _encode_csv(users: List[dict]) -> bytes:
+    """Кодирует порцию пользователей в строки CSV."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for user in users:
+        writer.writerow([_csv_cell(value) for value in user.values()])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def export_users(
+    user_repo: UserRepository,
+    format: str,
+    include_deleted: bool = False,
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Выгружает пользователей порциями в заданном формате.
+
+    Каждая порция кодируется и отдаётся отдельно, поэтому память не зависит от
+    числа пользователей. Следующая порция читается из базы данных только после
+    того, как потребитель забрал предыдущую: при медленном клиенте ожидание
+    отправки ответа приостанавливает и чтение.
+
+    Args:
+        user_repo (UserRepository): Репозиторий пользователей.
+        format (str): Формат: ndjson или csv.
+        include_deleted (bool): Включать удалённых пользователей.
+        chunk_size (Optional[int]): Размер страницы; по умолчанию EXPORT_CHUNK_SIZE.
+
+    Yields:
+        bytes: Фрагмент выгрузки.
+    """
+    columns = EXPORT_COLUMNS if include_deleted else tuple(column for column in EXPORT_COLUMNS if column != "deleted_at")
+    if format == "csv":
+        yield ",".join(columns).encode("utf-8") + b"\n"
+    encode = _encode_csv if format == "csv" else _encode_ndjson
+
+    started = time.perf_counter()
+    total = 0
+    async for users in user_repo.iter_users(columns, include_deleted=include_deleted, chunk_size=chunk_size):
+        total += len(users)
+        yield encode(users)
+    logger.info(f"Выгрузка пользователей ({format}) завершена: {total} записей за {time.perf_counter() - started:.1f} с.")
+
+
+def create_export_router(app: FastAPI) -> None:
+    """
+    Создание служебного эндпоинта выгрузки пользователей.
+
+    Args:
+        app: Экземпляр FastAPI приложения.
+    """
+    @app.get(
+        "/operator/export/users",
+        include_in_schema=False,
+        dependencies=[Depends(require_operator)],
+    )
+    async def export_users_endpoint(
+        format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+        include_deleted: bool = Query(False),
+        user_repo: UserRepository = Depends(get_user_repository),
+    ) -> StreamingResponse:
+        """
+        Выгружает всех пользователей потоком в формате NDJSON или CSV.
+
+        Returns:
+            StreamingResponse: Файл выгрузки.
+        """
+        return StreamingResponse(
+            export_users(user_repo, format, include_deleted, settings.EXPORT_CHUNK_SIZE),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="users-{int(time.time())}.{format}"'},
+        )
+
+
+async def main(format: str, output: str, include_deleted: bool, chunk_size: int) -> None:
+    """
+    Выгружает пользователей в файл.
+
+    Args:
+        format (str): Формат: ndjson или csv.
+        output (str): Путь к файлу (stdout занят журналом).
+        include_deleted (bool): Включать удалённых пользователей.
+        chunk_size (int): Размер страницы.
+    """
+    db = Database()
+    await db.connect()
+    try:
+        with open(output, "wb") as stream:
+            async for chunk in export_users(UserRepository(db), format, include_deleted, chunk_size):
+                stream.write(chunk)
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=tuple(EXPORT_MEDIA_TYPES), default="ndjson", help="формат выгрузки")
+    parser.add_argument("--output", required=True, help="файл выгрузки")
+    parser.add_argument("--include-deleted", action="store_true", help="включать удалённых пользователей")
+    parser.add_argument("--chunk-size", type=int, default=settings.EXPORT_CHUNK_SIZE, help="размер страницы")
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.format, arguments.output, arguments.include_deleted, arguments.chunk_size))
@@ -1,6 +1,48 @@
-from typing import Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
 from app.api.storage.database import Database
+from app.core.settings import settings
+
+# Столбцы таблицы users, которые можно запрашивать выборочно.
+USER_COLUMNS = ("id", "username", "email", "password", "version")
+
+# Публичные данные пользователя (всё, кроме пароля).
+PUBLIC_COLUMNS = ("id", "username", "email", "version")
+
+# Столбцы, доступные при массовой выгрузке (без пароля и токена восстановления).
+EXPORT_COLUMNS = ("id", "username", "email", "version", "created_at", "updated_at", "deleted_at")
+
+
+@lru_cache(maxsize=256)
+def select_active_users_query(columns: Tuple[str, ...], count: int = 1) -> str:
+    """
+    Формирует запрос выборки активных пользователей по ID с заданным списком столбцов.
+
+    Столбцы проверяются по USER_COLUMNS, а готовые варианты запроса кэшируются:
+    вызывающий код передаёт столбцы в порядке белого списка, поэтому вариантов немного.
+
+    Args:
+        columns (Tuple[str, ...]): Запрашиваемые столбцы.
+        count (int): Количество ID (1 — условие id = %s, иначе id IN (...)).
+
+    Returns:
+        str: SQL-запрос с плейсхолдерами для ID.
+
+    Raises:
+        ValueError: Если запрошен столбец вне белого списка.
+    """
+    unknown = set(columns) - set(USER_COLUMNS)
+    if not columns or unknown:
+        raise ValueError(f"Недопустимые столбцы: {sorted(unknown)}")
+
+    condition = "id = %s" if count == 1 else f"id IN ({', '.join(['%s'] * count)})"
+    return f"""
+        SELECT {', '.join(columns)}
+        FROM users
+        WHERE {condition}
+          AND deleted_at IS NULL
+        """
 
 
 class UserRepository:
@@ -31,7 +73,7 @@ class UserRepository:
             Optional[dict]: Данные пользователя или None, если пользователь не найден или удалён.
         """
         query = """
-        SELECT id, username, email, password
+        SELECT id, username, email, password, tier
         FROM users
         WHERE email = %s
           AND deleted_at IS NULL
@@ -39,43 +81,51 @@ class UserRepository:
         users = await self.db.fetch(query, email)
         return users[0] if users else None
 
-    async def get_user_by_id(self, user_id: int) -> Optional[dict]:
+    async def get_user_by_id(
+        self, user_id: int, columns: Sequence[str] = ("id", "username", "email", "password")
+    ) -> Optional[dict]:
         """
         Возвращает данные активного пользователя по ID.
 
         Args:
             user_id (int): Уникальный идентификатор пользователя.
+            columns (Sequence[str]): Запрашиваемые столбцы из USER_COLUMNS.
 
         Returns:
             Optional[dict]: Данные пользователя или None, если пользователь не найден или удалён.
         """
-        query = """
-        SELECT id, username, email, password
-        FROM users
-        WHERE id = %s
-          AND deleted_at IS NULL
-        """
-        users = await self.db.fetch(query, user_id)
+        users = await self.db.fetch(select_active_users_query(tuple(columns)), user_id)
         return users[0] if users else None
 
-    async def get_user_public_data_by_id(self, user_id: int) -> Optional[dict]:
+    async def get_user_public_data_by_id(
+        self, user_id: int, columns: Sequence[str] = PUBLIC_COLUMNS
+    ) -> Optional[dict]:
         """
         Возвращает публичные данные пользователя по ID.
 
         Args:
             user_id (int): Уникальный идентификатор пользователя.
+            columns (Sequence[str]): Запрашиваемые столбцы из PUBLIC_COLUMNS.
 
         Returns:
             Optional[dict]: Публичные данные пользователя или None, если пользователь не найден или удалён.
         """
-        query = """
-        SELECT id, username, email
-        FROM users
-        WHERE id = %s
-        AND deleted_at IS NULL
+        return await self.get_user_by_id(user_id, columns)
+
+    async def get_users_public_data_by_ids(
+        self, user_ids: Sequence[int], columns: Sequence[str] = PUBLIC_COLUMNS
+    ) -> List[dict]:
         """
-        users = await self.db.fetch(query, user_id)
-        return users[0] if users else None
+        Возвращает публичные данные нескольких пользователей одним запросом.
+
+        Args:
+            user_ids (Sequence[int]): Уникальные идентификаторы пользователей.
+            columns (Sequence[str]): Запрашиваемые столбцы из PUBLIC_COLUMNS.
+
+        Returns:
+            List[dict]: Данные найденных активных пользователей в произвольном порядке.
+        """
+        return await self.db.fetch(select_active_users_query(tuple(columns), len(user_ids)), *user_ids)
 
     async def create_user(self, username: str, email: str, password: str) -> dict:
         """
@@ -87,14 +137,14 @@ class UserRepository:
             password (str): Захэшированный пароль.
 
         Returns:
-            dict: Данные созданного пользователя (id, username, email).
+            dict: Данные созданного пользователя (id, username, email, version).
         """
         query = """
         INSERT INTO users (username, email, password)
         VALUES (%s, %s, %s)
         """
         user_id = await self.db.execute(query, username, email, password)
-        return {"id": user_id, "username": username, "email": email}
+        return {"id": user_id, "username": username, "email": email, "version": 1}
 
     async def update_user_in_db(
         self,
@@ -104,7 +154,7 @@ class UserRepository:
         password: Optional[str]
     ) -> Optional[dict]:
         """
-        Обновляет данные активного пользователя в базе.
+        Обновляет данные активного пользователя в базе и увеличивает версию записи.
 
         Args:
             user_id (int): ID пользователя.
@@ -113,18 +163,20 @@ class UserRepository:
             password (Optional[str]): Новый пароль.
 
         Returns:
-            Optional[dict]: Обновлённые данные пользователя или None, если пользователь не найден или удалён.
+            Optional[dict]: Обновлённые публичные данные пользователя или None,
+                если пользователь не найден или удалён.
         """
         query = """
         UPDATE users
         SET username = COALESCE(%s, username),
             email = COALESCE(%s, email),
-            password = COALESCE(%s, password)
+            password = COALESCE(%s, password),
+            version = version + 1
         WHERE id = %s
           AND deleted_at IS NULL
         """
         await self.db.execute(query, username, email, password, user_id)
-        return await self.get_user_by_id(user_id)
+        return await self.get_user_public_data_by_id(user_id)
 
     async def check_email_exists(self, email: str, exclude_user_id: Optional[int] = None) -> bool:
         """
@@ -150,6 +202,123 @@ class UserRepository:
             users = await self.db.fetch(query, email)
         return bool(users)
 
+    async def is_value_taken(self, column: str, value: str, exclude_user_id: Optional[int] = None) -> bool:
+        """
+        Проверяет, занято ли имя пользователя или email.
+
+        Учитываются и удалённые (ещё не удалённые окончательно) пользователи:
+        уникальные индексы username и email распространяются на них.
+
+        Args:
+            column (str): Столбец: username или email.
+            value (str): Проверяемое значение.
+            exclude_user_id (Optional[int]): ID пользователя, которого нужно исключить из проверки.
+
+        Returns:
+            bool: True, если значение занято.
+
+        Raises:
+            ValueError: Если передан другой столбец.
+        """
+        if column not in ("username", "email"):
+            raise ValueError(f"Недопустимый столбец: {column}")
+
+        query = f"SELECT 1 FROM users WHERE {column} = %s"
+        if exclude_user_id:
+            query += " AND id != %s"
+            return bool(await self.db.fetch(query + " LIMIT 1", value, exclude_user_id))
+        return bool(await self.db.fetch(query + " LIMIT 1", value))
+
+    async def iter_users(
+        self,
+        columns: Sequence[str],
+        include_deleted: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Перебирает пользователей в порядке id, не загружая таблицу в память.
+
+        Таблица читается постранично по первичному ключу (WHERE id > последний id
+        LIMIT chunk_size), а каждая страница — небуферизованным курсором порциями,
+        поэтому память не зависит от числа пользователей, а соединение с базой
+        данных занято не дольше одной страницы.
+
+        Args:
+            columns (Sequence[str]): Столбцы из EXPORT_COLUMNS; id добавляется всегда.
+            include_deleted (bool): Включать удалённых пользователей.
+            chunk_size (Optional[int]): Размер страницы; по умолчанию EXPORT_CHUNK_SIZE.
+
+        Yields:
+            List[dict]: Порция пользователей.
+
+        Raises:
+            ValueError: Если запрошен столбец вне белого списка.
+        """
+        unknown = set(columns) - set(EXPORT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Недопустимые столбцы: {sorted(unknown)}")
+
+        chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+        columns = ["id", *(column for column in columns if column != "id")]
+        condition = "" if include_deleted else "AND deleted_at IS NULL"
+        query = f"""
+        SELECT {', '.join(columns)}
+        FROM users
+        WHERE id > %s
+          {condition}
+        ORDER BY id
+        LIMIT %s
+        """
+        last_id = 0
+        while True:
+            count = 0
+            async for users in self.db.stream(query, last_id, chunk_size):
+                yield users
+                count += len(users)
+                last_id = users[-1]["id"]
+            if count < chunk_size:
+                return
+
+    def iter_usernames_and_emails(self) -> AsyncIterator[List[dict]]:
+        """
+        Перебирает имена и email всех пользователей, включая удалённых.
+
+        Yields:
+            List[dict]: Порция пользователей (id, username, email).
+        """
+        return self.iter_users(("username", "email"), include_deleted=True)
+
+    def iter_active_usernames(self) -> AsyncIterator[List[dict]]:
+        """
+        Перебирает имена активных пользователей.
+
+        Yields:
+            List[dict]: Порция пользователей (id, username).
+        """
+        return self.iter_users(("username",))
+
+    async def search_usernames(self, prefix: str, limit: int) -> List[dict]:
+        """
+        Ищет активных пользователей, имя которых начинается с prefix (диапазонный поиск по индексу username).
+
+        Args:
+            prefix (str): Начало имени.
+            limit (int): Максимальное число результатов.
+
+        Returns:
+            List[dict]: Пользователи (id, username) в алфавитном порядке.
+        """
+        pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        query = """
+        SELECT id, username
+        FROM users
+        WHERE username LIKE %s
+          AND deleted_at IS NULL
+        ORDER BY username
+        LIMIT %s
+        """
+        return await self.db.fetch(query, pattern, limit)
+
     async def soft_delete_user(self, user_id: int, restoration_token: str) -> bool:
         """
         Помечает пользователя как удалённого и устанавливает токен восстановления.
@@ -174,13 +343,20 @@ class UserRepository:
         """
         Окончательно удаляет пользователя из базы данных.
 
+        Удаляются только пользователи, помеченные как удалённые, поэтому
+        отложенная задача не затрагивает восстановленные аккаунты.
+
         Args:
             user_id (int): ID пользователя.
 
         Returns:
             bool: True, если пользователь успешно удалён, иначе False.
         """
-        query = "DELETE FROM users WHERE id = %s"
+        query = """
+        DELETE FROM users
+        WHERE id = %s
+          AND deleted_at IS NOT NULL
+        """
         await self.db.execute(query, user_id)
         return True
 
@@ -203,6 +379,26 @@ class UserRepository:
         await self.db.execute(query, user_id)
         return True
 
+    async def get_deleted_user_by_email(self, email: str) -> Optional[dict]:
+        """
+        Возвращает данные удалённого пользователя по email.
+
+        Args:
+            email (str): Email пользователя.
+
+        Returns:
+            Optional[dict]: Данные пользователя с хэшем токена восстановления
+                или None, если удалённый пользователь не найден.
+        """
+        query = """
+        SELECT id, username, email, restoration_token
+        FROM users
+        WHERE email = %s
+          AND deleted_at IS NOT NULL
+        """
+        users = await self.db.fetch(query, email)
+        return users[0] if users else None
+
     async def get_user_by_restoration_token(self, token: str) -> Optional[dict]:
         """
         Возвращает данные пользователя по токену восстановления.
@@ -1,13 +1,20 @@
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from app.core.settings import settings
+
+# Имя пользователя без управляющих символов (включая \x00 — разделитель индекса автодополнения).
+USERNAME_PATTERN = r"^[^\x00-\x1f\x7f]+$"
+
 
 class UserBase(BaseModel):
     """Базовая схема для пользователя."""
     
-    username: str = Field(..., min_length=3, max_length=50, description="Имя пользователя")
+    username: str = Field(
+        ..., min_length=3, max_length=50, pattern=USERNAME_PATTERN, description="Имя пользователя"
+    )
     email: EmailStr = Field(..., description="Email пользователя")
 
     model_config = ConfigDict(str_strip_whitespace=True)
@@ -33,7 +40,7 @@ class UserUpdate(BaseModel):
         None, min_length=8, description="Текущий пароль для подтверждения изменений"
     )
     username: Optional[str] = Field(
-        None, min_length=3, max_length=50, description="Новое имя пользователя"
+        None, min_length=3, max_length=50, pattern=USERNAME_PATTERN, description="Новое имя пользователя"
     )
     email: Optional[EmailStr] = Field(None, description="Новый email пользователя")
     password: Optional[str] = Field(
@@ -62,6 +69,14 @@ class UserRestore(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
 
 
+class UserBatchRequest(BaseModel):
+    """Схема для пакетного получения публичных профилей."""
+
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=settings.USER_BATCH_MAX_IDS, description="ID пользователей"
+    )
+
+
 class User(BaseModel):
     """Схема для получения информации о пользователе."""
     
@@ -1,9 +1,13 @@
-import json
+import orjson
+from pymysql.err import IntegrityError
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 
+from app.api.v1.autocomplete import UsernameIndex
+from app.api.v1.availability import AvailabilityFilter
 from app.api.v1.repositories import UserRepository
-from app.api.storage.redis import RedisManager
+from app.api.storage.redis import RedisManager, CacheNamespace, TOMBSTONE
 from app.api.common.tokens import TokenService
 
 from app.api.v1.schemas import (
@@ -15,13 +19,18 @@ from app.api.v1.schemas import (
 )
 
 from app.api.v1.exceptions import (
+    ServiceException,
+    UserNotFoundException,
     UserAlreadyExistsException,
+    UsernameAlreadyExistsException,
     InvalidCredentialsException,
     UserUpdateException,
     TooManyRequestsException,
     UserDeletionException,
+    UserRestorationException,
 )
 
+from app.api.common.etag import make_etag
 from app.api.common.hashing import hash_value, verify_value
 from app.api.common.jwt_manager import create_access_token, create_refresh_token
 
@@ -29,7 +38,17 @@ from app.workers.tasks.send_email import send_restoration_email
 from app.workers.tasks.delete_account import delete_account_permanently
 
 from app.core.settings import settings
-from app.core.logging import logger
+from app.core.tracing import span
+from app.core.logging import logger, hot_logger
+
+# Код ошибки MySQL о нарушении уникального индекса.
+DUPLICATE_ENTRY = 1062
+
+# Поля профиля текущего пользователя, доступные в параметре fields.
+PROFILE_FIELDS = ("id", "username", "email", "version")
+
+# Поля профиля, которые отдаются другим пользователям (без email).
+PUBLIC_PROFILE_FIELDS = ("id", "username")
 
 
 class UserService:
@@ -39,18 +58,128 @@ class UserService:
     Attributes:
         user_repo (UserRepository): Репозиторий для работы с базой данных пользователей.
         cache (RedisManager): Менеджер для работы с Redis.
+        availability (AvailabilityFilter): Фильтры занятых имён пользователей и email.
+        usernames (UsernameIndex): Индекс имён для автодополнения.
     """
 
-    def __init__(self, user_repo: UserRepository, cache: RedisManager):
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        cache: RedisManager,
+        availability: Optional[AvailabilityFilter] = None,
+        usernames: Optional[UsernameIndex] = None,
+    ):
         """
         Инициализирует UserService.
 
         Args:
             user_repo (UserRepository): Репозиторий для работы с базой данных пользователей.
             cache (RedisManager): Менеджер для работы с Redis.
+            availability (Optional[AvailabilityFilter]): Фильтры занятых имён пользователей и email.
+            usernames (Optional[UsernameIndex]): Индекс имён для автодополнения.
         """
         self.user_repo = user_repo
         self.cache = cache
+        self.availability = availability or AvailabilityFilter(cache)
+        self.usernames = usernames or UsernameIndex(cache)
+
+    async def _is_taken(self, field: str, value: str, exclude_user_id: Optional[int] = None) -> bool:
+        """
+        Проверяет, занято ли имя пользователя или email.
+
+        Отрицательный ответ фильтра Блума окончательный; возможное совпадение
+        (или недоступный фильтр) подтверждается запросом к базе данных.
+
+        Args:
+            field (str): Поле: username или email.
+            value (str): Проверяемое значение.
+            exclude_user_id (Optional[int]): ID пользователя, которого нужно исключить из проверки.
+
+        Returns:
+            bool: True, если значение занято.
+        """
+        if await self.availability.might_be_taken(field, value) is False:
+            return False
+        return await self.user_repo.is_value_taken(field, value, exclude_user_id)
+
+    @staticmethod
+    def _duplicate_exception(error: IntegrityError, username: Optional[str], email: Optional[str]) -> ServiceException:
+        """
+        Преобразует нарушение уникального индекса users в исключение сервиса.
+
+        Args:
+            error (IntegrityError): Ошибка MySQL.
+            username (Optional[str]): Имя пользователя из запроса.
+            email (Optional[str]): Email из запроса.
+
+        Returns:
+            ServiceException: Исключение о занятом имени пользователя или email.
+        """
+        if "username" in str(error):
+            return UsernameAlreadyExistsException(username)
+        return UserAlreadyExistsException(email)
+
+    @staticmethod
+    def _encode_profile(user: dict) -> Dict[str, str]:
+        """
+        Преобразует профиль в поля хэша кэша. Каждое значение хранится в виде JSON.
+
+        Args:
+            user (dict): Публичные данные пользователя.
+
+        Returns:
+            Dict[str, str]: Поля хэша без поля version.
+        """
+        return {field: orjson.dumps(value).decode() for field, value in user.items() if field != "version"}
+
+    @staticmethod
+    def _profile_json(fields: Dict[str, str]) -> bytes:
+        """
+        Собирает JSON профиля из полей хэша кэша без декодирования значений.
+
+        Значения полей уже хранятся в виде JSON (version — целое число), поэтому
+        объект собирается конкатенацией. Имена полей — имена столбцов таблицы
+        users и не требуют экранирования.
+
+        Args:
+            fields (Dict[str, str]): Поля хэша со значениями в виде JSON.
+
+        Returns:
+            bytes: JSON публичных данных пользователя.
+        """
+        return ("{" + ",".join(f'"{field}":{value}' for field, value in fields.items()) + "}").encode()
+
+    async def _cache_profile(self, user: dict, changed_fields: Optional[Iterable[str]] = None) -> None:
+        """
+        Записывает профиль в кэш с проверкой версии.
+
+        Если переданы изменённые поля, сначала обновляются только они (HSET хэша предыдущей
+        версии); если в кэше нет профиля предыдущей версии, записывается полный профиль.
+
+        Args:
+            user (dict): Публичные данные пользователя, включая version.
+            changed_fields (Optional[Iterable[str]]): Поля, изменившиеся с версии version - 1.
+        """
+        mapping = self._encode_profile(user)
+        if changed_fields is not None:
+            changed = {field: mapping[field] for field in changed_fields}
+            if await self.cache.hset_if_newer(
+                str(user["id"]),
+                changed,
+                version=user["version"],
+                expire=settings.USER_CACHE_TTL,
+                partial=True,
+                namespace=CacheNamespace.USER,
+            ):
+                return
+
+        await self.cache.hset_if_newer(
+            str(user["id"]),
+            mapping,
+            version=user["version"],
+            expire=settings.USER_CACHE_TTL,
+            namespace=CacheNamespace.USER,
+        )
 
     async def register_user(self, user_data: UserRegister) -> dict:
         """
@@ -63,21 +192,32 @@ class UserService:
             dict: Данные зарегистрированного пользователя.
 
         Raises:
-            HTTPException: Если пользователь с таким email уже существует или произошла ошибка.
+            HTTPException: Если имя пользователя или email уже заняты или произошла ошибка.
         """
         try:
             logger.info(f"Попытка регистрации пользователя с email: {user_data.email}")
-            if await self.user_repo.check_email_exists(user_data.email):
+            if await self._is_taken("email", user_data.email):
                 raise UserAlreadyExistsException(user_data.email)
+            if await self._is_taken("username", user_data.username):
+                raise UsernameAlreadyExistsException(user_data.username)
 
             hashed_password = hash_value(user_data.password)
-            registered_user = await self.user_repo.create_user(
-                user_data.username, user_data.email, hashed_password
-            )
+            try:
+                registered_user = await self.user_repo.create_user(
+                    user_data.username, user_data.email, hashed_password
+                )
+            except IntegrityError as e:
+                if e.args[0] != DUPLICATE_ENTRY:
+                    raise
+                raise self._duplicate_exception(e, user_data.username, user_data.email)
+
+            await self.cache.delete(str(registered_user["id"]), namespace=CacheNamespace.USER)
+            await self.availability.add(username=registered_user["username"], email=registered_user["email"])
+            await self.usernames.add(registered_user["id"], registered_user["username"])
             logger.success(f"Пользователь {registered_user['username']} успешно зарегистрирован.")
             return registered_user
-        except UserAlreadyExistsException as e:
-            logger.error(f"Пользователь с email {user_data.email} уже существует.")
+        except (UserAlreadyExistsException, UsernameAlreadyExistsException) as e:
+            logger.error(f"Регистрация отклонена: {e.message}")
             raise e.to_http()
         except Exception as e:
             logger.error(f"Неизвестная ошибка при регистрации пользователя: {e}")
@@ -108,7 +248,7 @@ class UserService:
                 logger.warning(f"Неверный пароль для пользователя с email {user_data.email}.")
                 raise InvalidCredentialsException()
 
-            access_token = create_access_token({"sub": user["id"]})
+            access_token = create_access_token({"sub": user["id"], "tier": user["tier"]})
             refresh_token = create_refresh_token({"sub": user["id"]})
 
             logger.info(f"Пользователь {user['username']} успешно аутентифицирован.")
@@ -119,40 +259,191 @@ class UserService:
             logger.error(f"Ошибка при аутентификации: {e}")
             raise HTTPException(status_code=500, detail="Ошибка при входе в систему.")
 
-    async def get_user(self, user_id: int) -> dict:
+    @staticmethod
+    def _profile_etag(user_id: int, version: Any, fields: Sequence[str]) -> str:
+        """Формирует ETag профиля; для выборочного набора полей набор входит в ETag."""
+        return make_etag(user_id, version, "" if tuple(fields) == PROFILE_FIELDS else ".".join(fields))
+
+    async def get_user_etag(self, user_id: int, fields: Sequence[str] = PROFILE_FIELDS) -> Optional[str]:
         """
-        Получает данные пользователя по ID.
+        Возвращает ETag профиля по версии из кэша, не читая сам профиль.
+
+        Запрашивается только поле version (HMGET), поэтому проверка If-None-Match
+        для закэшированного профиля не требует чтения и сборки тела ответа.
 
         Args:
             user_id (int): ID пользователя.
+            fields (Sequence[str]): Запрошенные поля профиля.
 
         Returns:
-            dict: Данные пользователя.
+            Optional[str]: ETag или None, если профиля нет в кэше.
+        """
+        cached = await self.cache.get_hash(str(user_id), fields=["version"], namespace=CacheNamespace.USER)
+        if TOMBSTONE in cached or "version" not in cached:
+            return None
+        return self._profile_etag(user_id, cached["version"], fields)
 
-        Raises:
-            HTTPException: Если произошла ошибка.
+    async def get_user(self, user_id: int, fields: Sequence[str] = PROFILE_FIELDS) -> Tuple[bytes, str]:
         """
-        cache_key = f"user:{user_id}"
+        Получает данные пользователя по ID в виде готового JSON.
+
+        Профиль из кэша отдаётся без цикла декодирования и повторной сериализации.
+        Для выборочного набора полей из кэша читаются только эти поля и версия (HMGET).
+        При промахе из базы данных читается полный публичный профиль, чтобы заполнить кэш.
 
+        Args:
+            user_id (int): ID пользователя.
+            fields (Sequence[str]): Поля профиля из PROFILE_FIELDS.
+
+        Returns:
+            Tuple[bytes, str]: JSON данных пользователя и его ETag.
+
+        Raises:
+            HTTPException: Если пользователь не найден или произошла ошибка.
+        """
         try:
-            cached_user = await self.cache.get(cache_key)
-            if cached_user:
-                logger.info(f"Данные пользователя {user_id} получены из кэша")
-                return json.loads(cached_user)
+            projection = None if tuple(fields) == PROFILE_FIELDS else list(dict.fromkeys((*fields, "version")))
+            cached_user = await self.cache.get_hash(str(user_id), fields=projection, namespace=CacheNamespace.USER)
+            if TOMBSTONE in cached_user:
+                hot_logger.info("Пользователь {} отсутствует (негативный кэш)", user_id)
+                raise UserNotFoundException(user_id)
+
+            if "version" in cached_user and all(field in cached_user for field in fields):
+                hot_logger.info("Данные пользователя {} получены из кэша", user_id)
+                return (
+                    self._profile_json({field: cached_user[field] for field in fields}),
+                    self._profile_etag(user_id, cached_user["version"], fields),
+                )
 
             user = await self.user_repo.get_user_public_data_by_id(user_id)
             if not user:
-                logger.error(f"Пользователь с ID {user_id} не найден.")
-                raise HTTPException(status_code=500, detail="Внутренняя ошибка сервера.")
+                await self.cache.set_tombstone(
+                    str(user_id), expire=settings.USER_TOMBSTONE_TTL, namespace=CacheNamespace.USER
+                )
+                raise UserNotFoundException(user_id)
 
-            await self.cache.set(cache_key, json.dumps(user), expire=3600)
-            logger.info(f"Данные пользователя {user_id} сохранены в кэш")
+            await self._cache_profile(user)
 
-            return user
+            return (
+                orjson.dumps({field: user[field] for field in fields}),
+                self._profile_etag(user_id, user["version"], fields),
+            )
+        except UserNotFoundException as e:
+            logger.warning(f"Пользователь с ID {user_id} не найден.")
+            raise e.to_http()
         except Exception as e:
             logger.error(f"Ошибка при получении данных пользователя {user_id}: {e}")
             raise HTTPException(status_code=500, detail="Внутренняя ошибка сервера.")
 
+    async def get_users(self, user_ids: Sequence[int], fields: Sequence[str] = PUBLIC_PROFILE_FIELDS) -> bytes:
+        """
+        Получает публичные профили нескольких пользователей.
+
+        Профили читаются из кэша одним конвейером HMGET только с запрошенными полями,
+        промахи — одним запросом WHERE id IN (...), после чего найденные профили
+        записываются в кэш одним конвейером. Повторяющиеся ID учитываются один раз;
+        отсутствующие и удалённые пользователи пропускаются. Маркеры отсутствия здесь
+        не записываются: анонимный запрос не должен порождать сотни ключей, а маркер
+        для ещё не выданного ID мог бы перекрыть профиль, созданный регистрацией.
+
+        Args:
+            user_ids (Sequence[int]): ID пользователей.
+            fields (Sequence[str]): Поля профиля из PUBLIC_PROFILE_FIELDS.
+
+        Returns:
+            bytes: JSON-массив профилей в порядке переданных ID.
+
+        Raises:
+            HTTPException: Если произошла ошибка.
+        """
+        try:
+            ids = list(dict.fromkeys(user_ids))
+            cached_users = await self.cache.get_hashes(
+                [str(user_id) for user_id in ids], fields=fields, namespace=CacheNamespace.USER
+            )
+
+            profiles: Dict[int, bytes] = {}
+            misses: List[int] = []
+            for user_id, cached_user in zip(ids, cached_users):
+                if TOMBSTONE in cached_user:
+                    continue
+                if len(cached_user) == len(fields):
+                    profiles[user_id] = self._profile_json(cached_user)
+                else:
+                    misses.append(user_id)
+
+            if misses:
+                users = await self.user_repo.get_users_public_data_by_ids(misses)
+                await self.cache.hset_if_newer_many(
+                    [(str(user["id"]), self._encode_profile(user), user["version"]) for user in users],
+                    expire=settings.USER_CACHE_TTL,
+                    namespace=CacheNamespace.USER,
+                )
+                for user in users:
+                    profiles[user["id"]] = orjson.dumps({field: user[field] for field in fields})
+
+            hot_logger.info(
+                "Получено {} профилей из {} (промахов кэша: {}).", len(profiles), len(ids), len(misses)
+            )
+            return b"[" + b",".join(profiles[user_id] for user_id in ids if user_id in profiles) + b"]"
+        except Exception as e:
+            logger.error(f"Ошибка при пакетном получении пользователей: {e}")
+            raise HTTPException(status_code=500, detail="Внутренняя ошибка сервера.")
+
+    async def check_availability(self, username: Optional[str], email: Optional[str]) -> dict:
+        """
+        Проверяет, свободны ли имя пользователя и email.
+
+        Значения, которых точно нет в фильтре Блума, считаются свободными без
+        обращения к базе данных; возможные совпадения подтверждаются запросом.
+
+        Args:
+            username (Optional[str]): Имя пользователя.
+            email (Optional[str]): Email.
+
+        Returns:
+            dict: Результат проверки по каждому переданному полю.
+
+        Raises:
+            HTTPException: Если произошла ошибка.
+        """
+        try:
+            result = {}
+            for field, value in (("username", username), ("email", email)):
+                if value is not None:
+                    result[field] = {"value": value, "available": not await self._is_taken(field, value)}
+            return result
+        except Exception as e:
+            logger.error(f"Ошибка при проверке доступности имени пользователя и email: {e}")
+            raise HTTPException(status_code=500, detail="Внутренняя ошибка сервера.")
+
+    async def autocomplete_usernames(self, prefix: str, limit: int) -> List[dict]:
+        """
+        Возвращает активных пользователей, имя которых начинается с prefix (для автодополнения упоминаний).
+
+        Поиск выполняется по индексу в Redis; пока индекс не построен или Redis
+        недоступен, используется диапазонный запрос по индексу username в базе данных.
+
+        Args:
+            prefix (str): Начало имени.
+            limit (int): Максимальное число результатов.
+
+        Returns:
+            List[dict]: Пользователи (id, username) в алфавитном порядке.
+
+        Raises:
+            HTTPException: Если произошла ошибка.
+        """
+        try:
+            users = await self.usernames.search(prefix, limit)
+            if users is None:
+                hot_logger.info("Индекс автодополнения недоступен, поиск по базе данных: {}", prefix)
+                users = await self.user_repo.search_usernames(prefix, limit)
+            return users
+        except Exception as e:
+            logger.error(f"Ошибка при автодополнении имени пользователя {prefix}: {e}")
+            raise HTTPException(status_code=500, detail="Внутренняя ошибка сервера.")
+
     async def update_user(self, user_id: int, user_data: UserUpdate) -> dict:
         """
         Обновляет данные пользователя.
@@ -169,44 +460,71 @@ class UserService:
                         превышено количество попыток или произошла ошибка.
         """
         try:
-            user = await self.user_repo.get_user_by_id(user_id)
+            user = await self.user_repo.get_user_by_id(
+                user_id, columns=("id", "username", "email", "password", "version")
+            )
 
-            brute_force_key = f"brute_force_update:{user_id}"
+            brute_force_key = str(user_id)
+            brute_force_namespace = CacheNamespace.BRUTE_FORCE_UPDATE
             if user_data.email or user_data.password:
                 if not user_data.current_password:
                     raise InvalidCredentialsException()
 
-                attempts = await self.cache.get(brute_force_key)
+                attempts = await self.cache.get(brute_force_key, namespace=brute_force_namespace)
                 if attempts and int(attempts) >= settings.BRUTE_FORCE_MAX_ATTEMPTS:
                     raise TooManyRequestsException(settings.BRUTE_FORCE_BLOCK_TIME)
 
                 if not verify_value(user_data.current_password, user["password"]):
-                    await self.cache.increment(brute_force_key, expire=settings.BRUTE_FORCE_BLOCK_TIME)
+                    await self.cache.increment(
+                        brute_force_key,
+                        expire=settings.BRUTE_FORCE_BLOCK_TIME,
+                        namespace=brute_force_namespace,
+                    )
                     logger.warning(
                         f"Неудачная попытка входа для пользователя {user_id}.\n"
                         f"Попытка {attempts}/{settings.BRUTE_FORCE_MAX_ATTEMPTS}."
                     )
                     raise InvalidCredentialsException()
 
-                await self.cache.delete(brute_force_key)
+                await self.cache.delete(brute_force_key, namespace=brute_force_namespace)
 
             if user_data.email and user_data.email != user["email"]:
-                if await self.user_repo.check_email_exists(user_data.email, exclude_user_id=user_id):
+                if await self._is_taken("email", user_data.email, exclude_user_id=user_id):
                     raise UserAlreadyExistsException(user_data.email)
 
-            hashed_password = hash_value(user_data.password) if user_data.password else user["password"]
-            updated_user = await self.user_repo.update_user_in_db(
-                user_id, user_data.username, user_data.email, hashed_password
-            )
+            if user_data.username and user_data.username != user["username"]:
+                if await self._is_taken("username", user_data.username, exclude_user_id=user_id):
+                    raise UsernameAlreadyExistsException(user_data.username)
 
-            cache_key = f"user:{user_id}"
-            await self.cache.delete(cache_key)
-            logger.info(f"Кэш пользователя {user_id} сброшен после обновления данных.")
+            hashed_password = hash_value(user_data.password) if user_data.password else user["password"]
+            try:
+                updated_user = await self.user_repo.update_user_in_db(
+                    user_id, user_data.username, user_data.email, hashed_password
+                )
+            except IntegrityError as e:
+                if e.args[0] != DUPLICATE_ENTRY:
+                    raise
+                raise self._duplicate_exception(e, user_data.username, user_data.email)
+
+            changed_fields = [
+                field for field in ("username", "email")
+                if updated_user[field] != user[field]
+            ]
+            # Разница с прочитанной строкой — это изменения предыдущей версии, только если между
+            # чтением и UPDATE запись не менялась; иначе в кэш записывается полный профиль.
+            consecutive = updated_user["version"] == user["version"] + 1
+            await self._cache_profile(updated_user, changed_fields if consecutive else None)
+            logger.info(f"Кэш пользователя {user_id} обновлён после изменения данных.")
+            if changed_fields:
+                await self.availability.add(**{field: updated_user[field] for field in changed_fields})
+            if "username" in changed_fields:
+                await self.usernames.rename(user_id, user["username"], updated_user["username"])
 
             logger.success(f"Пользователь с ID {user_id} успешно обновлён.")
             return updated_user
         except (
             UserAlreadyExistsException,
+            UsernameAlreadyExistsException,
             InvalidCredentialsException,
             TooManyRequestsException,
         ) as e:
@@ -230,15 +548,20 @@ class UserService:
             HTTPException: Если пароль неверный, превышено количество попыток или произошла ошибка.
         """
         try:
-            user = await self.user_repo.get_user_by_id(user_id)
+            user = await self.user_repo.get_user_by_id(user_id, columns=("id", "username", "email", "password"))
 
-            brute_force_key = f"brute_force_delete:{user_id}"
-            attempts = await self.cache.get(brute_force_key)
+            brute_force_key = str(user_id)
+            brute_force_namespace = CacheNamespace.BRUTE_FORCE_DELETE
+            attempts = await self.cache.get(brute_force_key, namespace=brute_force_namespace)
             if attempts and int(attempts) >= settings.BRUTE_FORCE_MAX_ATTEMPTS:
                 raise TooManyRequestsException(settings.BRUTE_FORCE_BLOCK_TIME)
 
             if not verify_value(user_data.current_password, user["password"]):
-                await self.cache.increment(brute_force_key, expire=settings.BRUTE_FORCE_BLOCK_TIME)
+                await self.cache.increment(
+                    brute_force_key,
+                    expire=settings.BRUTE_FORCE_BLOCK_TIME,
+                    namespace=brute_force_namespace,
+                )
                 logger.warning(
                     f"Неудачная попытка удаления для пользователя {user_id}.\n"
                     f"Попытка {attempts}/{settings.BRUTE_FORCE_MAX_ATTEMPTS}."
@@ -249,6 +572,10 @@ class UserService:
             hashed_token = hash_value(restoration_token)
 
             await self.user_repo.soft_delete_user(user_id, hashed_token)
+            await self.cache.set_tombstone(
+                str(user_id), expire=settings.USER_TOMBSTONE_TTL, namespace=CacheNamespace.USER
+            )
+            await self.usernames.remove(user_id, user["username"])
 
             deletion_time = datetime.now(timezone.utc) + timedelta(days=settings.RESTORATION_TOKEN_EXPIRE_DAYS)
             logger.info(
@@ -256,15 +583,17 @@ class UserService:
                 f"Удаление произойдёт {deletion_time}."
             )
 
-            delete_account_permanently.apply_async(
-                args=[user_id],
-                eta=deletion_time,
-            )
+            with span("celery.publish", {"celery.task": delete_account_permanently.name}):
+                delete_account_permanently.apply_async(
+                    args=[user_id],
+                    eta=deletion_time,
+                )
 
-            send_restoration_email.delay(
-                user["email"],
-                restoration_token,
-            )
+            with span("celery.publish", {"celery.task": send_restoration_email.name}):
+                send_restoration_email.delay(
+                    user["email"],
+                    restoration_token,
+                )
 
             logger.success(
                 f"Пользователь {user_id} помечен как удалённый. "
@@ -278,4 +607,35 @@ class UserService:
             raise e.to_http()
         except Exception as e:
             logger.error(f"Ошибка при удалении пользователя {user_id}: {e}")
-            raise UserDeletionException(user_id).to_http()
\ No newline at end of file
+            raise UserDeletionException(user_id).to_http()
+
+    async def restore_user(self, user_data: UserRestore) -> bool:
+        """
+        Восстанавливает ранее удалённый аккаунт по токену восстановления.
+
+        Args:
+            user_data (UserRestore): Email пользователя и токен восстановления.
+
+        Returns:
+            bool: True, если аккаунт успешно восстановлен.
+
+        Raises:
+            HTTPException: Если токен неверный, аккаунт не найден или произошла ошибка.
+        """
+        try:
+            user = await self.user_repo.get_deleted_user_by_email(user_data.email)
+            if not user or not verify_value(user_data.restoration_token, user["restoration_token"]):
+                logger.warning(f"Неудачная попытка восстановления аккаунта с email {user_data.email}.")
+                raise InvalidCredentialsException()
+
+            await self.user_repo.restore_user(user["id"])
+            await self.cache.delete(str(user["id"]), namespace=CacheNamespace.USER)
+            await self.usernames.add(user["id"], user["username"])
+
+            logger.success(f"Пользователь {user['id']} успешно восстановлен.")
+            return True
+        except InvalidCredentialsException as e:
+            raise e.to_http()
+        except Exception as e:
+            logger.error(f"Ошибка при восстановлении пользователя с email {user_data.email}: {e}")
+            raise UserRestorationException(user_data.email).to_http()
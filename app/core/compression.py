@@ -0,0 +1,326 @@
+"""
+Сжатие HTTP-ответов с выбором zstd, brotli или gzip по заголовку Accept-Encoding.
+
+Пакеты zstandard и brotli опциональны: если они не установлены, соответствующая
+кодировка не предлагается и клиенты получают gzip. Не сжимаются ответы меньше
+COMPRESSION_MINIMUM_SIZE, ответы с уже заданным Content-Encoding, несжимаемые типы
+(изображения, архивы) и ответы без тела (204, 304, HEAD). Потоковые ответы
+сжимаются по частям: каждый фрагмент сбрасывается из компрессора сразу, без
+накопления тела.
+
+Статические ответы (например, /api/openapi.json) сжимаются один раз при запуске
+с максимальным уровнем и отдаются из памяти.
+"""
+import zlib
+from functools import lru_cache
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Типы содержимого, которые имеет смысл сжимать, помимо text/*, *+json и *+xml.
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+})
+
+# Уровни для статических ответов: сжатие выполняется один раз, поэтому берётся максимум.
+STATIC_LEVELS = {"zstd": 19, "br": 11, "gzip": 9}
+
+
+class GzipCompressor:
+    """Потоковый компрессор gzip."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Сжимает фрагмент; при final завершает поток, иначе сбрасывает буфер компрессора."""
+        flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self._compressor.compress(data) + self._compressor.flush(flush_mode)
+
+
+class BrotliCompressor:
+    """Потоковый компрессор brotli."""
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Сжимает фрагмент; при final завершает поток, иначе сбрасывает буфер компрессора."""
+        chunk = self._compressor.process(data)
+        return chunk + (self._compressor.finish() if final else self._compressor.flush())
+
+
+class ZstdCompressor:
+    """Потоковый компрессор zstd."""
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Сжимает фрагмент; при final завершает поток, иначе сбрасывает буфер компрессора."""
+        flush_mode = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return self._compressor.compress(data) + self._compressor.flush(flush_mode)
+
+
+# Доступные кодировки в порядке предпочтения сервера при равном q.
+COMPRESSORS: Dict[str, Callable[[int], object]] = {}
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+if brotli is not None:
+    COMPRESSORS["br"] = BrotliCompressor
+COMPRESSORS["gzip"] = GzipCompressor
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """
+    Сжимает данные целиком.
+
+    Args:
+        data (bytes): Исходные данные.
+        encoding (str): Кодировка: zstd, br или gzip.
+        level (int): Уровень сжатия.
+
+    Returns:
+        bytes: Сжатые данные.
+    """
+    return COMPRESSORS[encoding](level).compress(data, final=True)
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """
+    Выбирает кодировку по заголовку Accept-Encoding.
+
+    Учитываются веса q (q=0 запрещает кодировку) и "*". При равных весах
+    выбирается кодировка, стоящая раньше в COMPRESSORS. Результат кэшируется:
+    число различных значений заголовка у клиентов невелико.
+
+    Args:
+        accept_encoding (str): Значение заголовка Accept-Encoding.
+
+    Returns:
+        Optional[str]: Выбранная кодировка или None, если сжатие не поддерживается клиентом.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        name = name.strip()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if name:
+            weights[name] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for encoding in COMPRESSORS:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """
+    Проверяет, имеет ли смысл сжимать содержимое данного типа.
+
+    Args:
+        content_type (str): Значение заголовка Content-Type.
+
+    Returns:
+        bool: True для текстовых форматов.
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class StaticPayload:
+    """
+    Статический ответ, сжатый всеми доступными кодировками заранее.
+
+    Attributes:
+        media_type (str): Тип содержимого.
+        variants (Dict[Optional[str], bytes]): Тело ответа по кодировке (None — без сжатия).
+    """
+
+    def __init__(self, body: bytes, media_type: str):
+        """
+        Инициализирует StaticPayload и сжимает тело.
+
+        Args:
+            body (bytes): Тело ответа.
+            media_type (str): Тип содержимого.
+        """
+        self.media_type = media_type
+        self.variants: Dict[Optional[str], bytes] = {None: body}
+        for encoding in COMPRESSORS:
+            self.variants[encoding] = compress(body, encoding, STATIC_LEVELS[encoding])
+
+    async def __call__(self, scope: Scope, encoding: Optional[str], send: Send) -> None:
+        """Отправляет вариант ответа для выбранной кодировки."""
+        body = self.variants[encoding]
+        headers = [
+            (b"content-type", self.media_type.encode("latin-1")),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"vary", b"Accept-Encoding"),
+        ]
+        if encoding is not None:
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+class CompressionMiddleware:
+    """
+    Pure-ASGI middleware сжатия ответов.
+
+    Уровень сжатия задаётся по кодировке (COMPRESSION_LEVELS) и может быть
+    переопределён для маршрута (COMPRESSION_ROUTE_LEVELS, ключ — шаблон пути
+    маршрута); уровень 0 отключает сжатие маршрута. Шаблон маршрута берётся из
+    scope["route"], который роутер записывает до отправки ответа.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = settings.COMPRESSION_MINIMUM_SIZE,
+        levels: Mapping[str, int] = settings.COMPRESSION_LEVELS,
+        route_levels: Mapping[str, Mapping[str, int]] = settings.COMPRESSION_ROUTE_LEVELS,
+        static_payloads: Optional[Mapping[str, Callable[[], Tuple[bytes, str]]]] = None,
+    ):
+        """
+        Инициализация compression middleware.
+
+        Args:
+            app: ASGI-приложение.
+            minimum_size (int): Минимальный размер тела для сжатия в байтах.
+            levels (Mapping[str, int]): Уровни сжатия по кодировкам.
+            route_levels (Mapping[str, Mapping[str, int]]): Уровни сжатия по шаблонам маршрутов.
+            static_payloads (Optional[Mapping[str, Callable]]): Пути статических ответов и функции,
+                возвращающие тело и тип содержимого. Вызываются один раз при сборке middleware
+                (при запуске приложения), когда все маршруты уже зарегистрированы.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = dict(levels)
+        self.route_levels = route_levels
+        self.static: Dict[str, StaticPayload] = {
+            path: StaticPayload(*factory()) for path, factory in (static_payloads or {}).items()
+        }
+
+    def _level(self, scope: Scope, encoding: str) -> int:
+        """Возвращает уровень сжатия для маршрута запроса."""
+        route = scope.get("route")
+        overrides = self.route_levels.get(route.path if route is not None else scope["path"])
+        if overrides is not None and encoding in overrides:
+            return overrides[encoding]
+        return self.levels.get(encoding, 0)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обработка запроса и сжатие ответа.
+
+        Args:
+            scope: Scope запроса.
+            receive: Receive channel.
+            send: Send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+
+        static = self.static.get(scope["path"])
+        if static is not None and scope["method"] in ("GET", "HEAD"):
+            await static(scope, encoding, send)
+            return
+
+        if encoding is None or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                headers = MutableHeaders(raw=start["headers"])
+                level = self._level(scope, encoding)
+                if (
+                    level <= 0
+                    or start["status"] in (204, 304)
+                    or "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type", ""))
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = COMPRESSORS[encoding](level)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                # Сжатое представление отличается побайтно, поэтому сильный ETag становится слабым.
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                body = compressor.compress(body, final=not more_body)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+                await send(start)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            if compressor is None:
+                await send(message)
+                return
+
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,12 +1,25 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from app.core.monitoring import setup_application_metrics
+from app.core.monitoring import ProcessMetrics, setup_application_metrics, mark_process_dead
 from app.api.storage.database import Database
 from app.api.storage.redis import RedisManager
+from app.api.v1.autocomplete import UsernameIndex
+from app.api.v1.availability import AvailabilityFilter
+from app.api.v1.repositories import UserRepository
+from app.core.health import HealthChecker
+from app.core.loop_monitor import LoopMonitor
+from app.core.tracing import setup_tracing
+from app.core.settings import settings
+from app.core.logging import logger
 
 db = Database()
 cache = RedisManager()
+health = HealthChecker(db, cache)
+availability = AvailabilityFilter(cache)
+usernames = UsernameIndex(cache)
+loop_monitor = LoopMonitor()
+process_metrics = ProcessMetrics()
 
 
 async def get_database() -> Database:
@@ -45,11 +58,30 @@ async def lifespan(app) -> AsyncGenerator[None, None]:
         None: Управление жизненным циклом.
     """
     setup_application_metrics(app)
+    setup_tracing()
+    await process_metrics.start()
+    if settings.LOOP_MONITOR_ENABLED:
+        await loop_monitor.start()
+    limiter = getattr(app.state, "limiter", None)
 
     await db.connect()
     await cache.connect()
+    if limiter:
+        await limiter.start()
+    await health.start()
+    await availability.start(UserRepository(db))
+    await usernames.start(UserRepository(db))
 
     yield
 
+    await usernames.stop()
+    await availability.stop()
+    await health.stop()
+    if limiter:
+        await limiter.stop()
     await db.close()
-    await cache.close()
\ No newline at end of file
+    await cache.close()
+    await loop_monitor.stop()
+    await process_metrics.stop()
+    mark_process_dead()
+    await logger.complete()
\ No newline at end of file
@@ -5,7 +5,7 @@ from app.api.v1.repositories import UserRepository
 from app.api.v1.services import UserService
 
 from app.core.dependencies.repositories import get_user_repository
-from app.core.dependencies.common import get_cache
+from app.core.dependencies.common import get_cache, availability, usernames
 
 
 async def get_user_service(
@@ -22,4 +22,4 @@ async def get_user_service(
     Returns:
         UserService: Сервис пользователей.
     """
-    return UserService(user_repo, cache)
\ No newline at end of file
+    return UserService(user_repo, cache, availability, usernames)
\ No newline at end of file
@@ -0,0 +1,252 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
+
+from app.api.storage.database import Database
+from app.api.storage.redis import RedisManager
+from app.workers.celery import celery
+from app.core.settings import settings
+from app.core.logging import logger
+
+READY = "ready"
+DEGRADED = "degraded"
+NOT_READY = "not_ready"
+
+
+class HealthChecker:
+    """
+    Фоновая проверка зависимостей для readiness-пробы.
+
+    Проверки (ping пула MySQL, PING Redis, соединение с брокером Celery) выполняются
+    раз в HEALTH_CHECK_INTERVAL секунд, а /health/ready отдаёт последний результат,
+    поэтому частота проб не добавляет нагрузки на зависимости.
+
+    Статусы:
+    - ready: все зависимости доступны;
+    - degraded: недоступны Redis или брокер — запросы обслуживаются
+      (кэш переключается на локальный fallback), но фоновые задачи и общий кэш
+      не работают;
+    - not_ready: недоступна база данных, насыщен пул соединений или результат
+      проверки устарел.
+
+    Attributes:
+        db (Database): Объект базы данных.
+        cache (RedisManager): Менеджер Redis.
+        interval (float): Интервал проверок в секундах.
+        timeout (float): Таймаут одной проверки в секундах.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        cache: RedisManager,
+        interval: float = settings.HEALTH_CHECK_INTERVAL,
+        timeout: float = settings.HEALTH_CHECK_TIMEOUT,
+        saturation_threshold: float = settings.HEALTH_POOL_SATURATION_THRESHOLD,
+    ):
+        """
+        Инициализирует HealthChecker.
+
+        Args:
+            db (Database): Объект базы данных.
+            cache (RedisManager): Менеджер Redis.
+            interval (float): Интервал проверок в секундах.
+            timeout (float): Таймаут одной проверки в секундах.
+            saturation_threshold (float): Доля занятых соединений пула, при которой воркер не готов.
+        """
+        self.db = db
+        self.cache = cache
+        self.interval = interval
+        self.timeout = timeout
+        self.saturation_threshold = saturation_threshold
+        self.result: Dict[str, Any] = {"status": NOT_READY, "checks": {}, "checked_at": None}
+        self._task: Optional[asyncio.Task] = None
+
+    async def _check(self, check: Callable[[], Any]) -> Dict[str, Any]:
+        """
+        Выполняет одну проверку с таймаутом и измеряет её длительность.
+
+        Args:
+            check (Callable[[], Any]): Корутинная функция проверки, возвращающая доп. данные.
+
+        Returns:
+            Dict[str, Any]: Результат проверки.
+        """
+        start = time.perf_counter()
+        try:
+            details = await asyncio.wait_for(check(), timeout=self.timeout)
+            result = {"status": "ok", **(details or {})}
+        except Exception as e:
+            result = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    async def _check_database(self) -> Dict[str, Any]:
+        """Проверяет пул MySQL: ping соединения и насыщенность пула."""
+        pool = self.db.pool
+        if pool is None:
+            raise ConnectionError("пул соединений не создан")
+
+        saturation = (pool.size - pool.freesize) / pool.maxsize
+        async with pool.acquire() as connection:
+            await connection.ping(reconnect=False)
+        return {"pool_size": pool.size, "pool_maxsize": pool.maxsize, "pool_saturation": round(saturation, 3)}
+
+    async def _check_redis(self) -> Dict[str, Any]:
+        """Проверяет Redis: PING в обход circuit breaker и насыщенность пула."""
+        client = self.cache.client
+        if client is None:
+            raise ConnectionError("клиент Redis не создан")
+
+        await client.ping()
+        return {"breaker": self.cache.breaker.state, "pool_saturation": self._redis_pool_saturation()}
+
+    def _redis_pool_saturation(self) -> Optional[float]:
+        """
+        Вычисляет долю занятых соединений пула Redis.
+
+        У пула redis-py нет публичного счётчика занятых соединений, поэтому он читается
+        из внутреннего атрибута; если атрибут недоступен, насыщенность неизвестна (None)
+        и на готовность не влияет.
+
+        Returns:
+            Optional[float]: Доля занятых соединений или None.
+        """
+        pool = self.cache.client.connection_pool
+        in_use = getattr(pool, "_in_use_connections", None)
+        max_connections = getattr(pool, "max_connections", None)
+        if in_use is None or not max_connections:
+            return None
+        return round(len(in_use) / max_connections, 3)
+
+    async def _check_broker(self) -> None:
+        """Проверяет доступность брокера Celery (блокирующий вызов kombu выполняется в executor)."""
+
+        def connect() -> None:
+            with celery.connection_for_write() as connection:
+                connection.ensure_connection(max_retries=1, timeout=self.timeout)
+
+        await asyncio.get_running_loop().run_in_executor(None, connect)
+
+    async def run_checks(self) -> Dict[str, Any]:
+        """
+        Выполняет все проверки параллельно и обновляет кэшированный результат.
+
+        Returns:
+            Dict[str, Any]: Результат проверок.
+        """
+        database, redis, broker = await asyncio.gather(
+            self._check(self._check_database),
+            self._check(self._check_redis),
+            self._check(self._check_broker),
+        )
+        checks = {"database": database, "redis": redis, "broker": broker}
+
+        saturated = any(
+            (check.get("pool_saturation") or 0) >= self.saturation_threshold for check in (database, redis)
+        )
+        if database["status"] != "ok" or saturated:
+            state = NOT_READY
+        elif redis["status"] != "ok" or broker["status"] != "ok":
+            state = DEGRADED
+        else:
+            state = READY
+
+        if state != self.result["status"]:
+            logger.warning(f"Статус готовности изменился: {self.result['status']} -> {state}.")
+
+        self.result = {"status": state, "checks": checks, "checked_at": time.time()}
+        return self.result
+
+    async def _loop(self) -> None:
+        """Периодически выполняет проверки."""
+        while True:
+            try:
+                await self.run_checks()
+            except Exception as e:
+                logger.error(f"Ошибка проверки готовности: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        """Запускает фоновые проверки."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Останавливает фоновые проверки."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Возвращает кэшированный результат проверок.
+
+        Результат старше трёх интервалов считается устаревшим (фоновые проверки
+        остановились или event loop перегружен), и воркер помечается как неготовый.
+
+        Returns:
+            Dict[str, Any]: Результат проверок.
+        """
+        checked_at = self.result["checked_at"]
+        if checked_at is None or time.time() - checked_at > self.interval * 3:
+            return {**self.result, "status": NOT_READY, "stale": True}
+        return self.result
+
+
+def create_health_router(app: FastAPI, checker: HealthChecker) -> None:
+    """
+    Создание эндпоинтов liveness и readiness проб.
+
+    Args:
+        app: Экземпляр FastAPI приложения.
+        checker: Фоновая проверка зависимостей.
+    """
+    @app.get("/health", include_in_schema=False)
+    async def health_check() -> JSONResponse:
+        """
+        Health check эндпоинт для балансировщиков и мониторинга (прежний формат ответа).
+
+        Returns:
+            JSONResponse: Ответ со статусом здоровья.
+        """
+        return JSONResponse(
+            content={"status": "healthy", "timestamp": time.time()},
+            status_code=status.HTTP_200_OK
+        )
+
+    @app.get("/health/live", include_in_schema=False)
+    async def liveness() -> JSONResponse:
+        """
+        Liveness-проба: процесс жив и event loop обрабатывает запросы.
+
+        Returns:
+            JSONResponse: Ответ со статусом процесса.
+        """
+        return JSONResponse(
+            content={"status": "alive", "timestamp": time.time()},
+            status_code=status.HTTP_200_OK
+        )
+
+    @app.get("/health/ready", include_in_schema=False)
+    async def readiness() -> JSONResponse:
+        """
+        Readiness-проба по кэшированному результату фоновых проверок.
+
+        Returns:
+            JSONResponse: Результат проверок; 503, если воркер не готов принимать трафик.
+        """
+        result = checker.readiness()
+        return JSONResponse(
+            content=result,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE if result["status"] == NOT_READY else status.HTTP_200_OK
+        )
@@ -1,5 +1,12 @@
+import asyncio
+import atexit
+import copy
 import os
+import queue
+import random
+import threading
 from sys import stdout
+from typing import Any, Dict, List
 
 from loguru import logger
 
@@ -18,43 +25,234 @@ LOG_FORMAT_FILE = (
 )
 
 
+def is_production() -> bool:
+    """Проверяет, запущено ли приложение в production-окружении."""
+    return settings.ENVIRONMENT == "production"
+
+
+def module_levels() -> Dict[str, Any]:
+    """
+    Формирует фильтр уровней по модулям для loguru.
+
+    Ключ "" задаёт уровень по умолчанию (LOG_LEVEL), остальные ключи —
+    префиксы модулей из LOG_MODULE_LEVELS, например {"app.api.storage": "WARNING"}.
+
+    Returns:
+        Dict[str, Any]: Фильтр для параметра filter sink'а.
+    """
+    return {"": settings.LOG_LEVEL, **settings.LOG_MODULE_LEVELS}
+
+
+_queued_sinks: List["QueuedSink"] = []
+
+# Логгер без обработчиков, копия которого пишет в потоке QueuedSink. Копировать сам
+# logger нельзя: подключённые к нему sink'и (потоки, файлы) не копируются.
+_bare_logger: Any = None
+
+
+def dropped_log_records() -> int:
+    """
+    Возвращает число записей журнала, отброшенных при переполнении очередей QueuedSink.
+
+    Returns:
+        int: Сумма по всем QueuedSink процесса.
+    """
+    return sum(sink.dropped for sink in _queued_sinks)
+
+
+class QueuedSink:
+    """
+    Sink loguru с записью в отдельном потоке.
+
+    Запись форматируется в потоке вызывающего кода (loguru делает это до передачи
+    в sink), а сюда попадает готовая строка: write() только кладёт её в очередь.
+    Фоновый поток пишет строки через отдельный экземпляр логгера, поэтому ротация
+    и хранение файлов продолжают работать средствами loguru. Медленный диск или
+    заполненный pipe stdout больше не блокируют event loop.
+
+    Встроенный enqueue=True в loguru сериализует каждую запись через pickle и
+    multiprocessing-очередь, что на вызывающей стороне дороже синхронной записи.
+
+    Очередь ограничена maxsize записями. Если поток записи не успевает, записи
+    ниже уровня drop_below отбрасываются и учитываются в dropped (метрика
+    worker_log_records_dropped, см. dropped_log_records), а более важные ждут
+    места в очереди.
+
+    Attributes:
+        name (str): Имя sink'а, используется в имени потока.
+        maxsize (int): Максимальное число записей в очереди.
+        drop_below (int): Номер уровня, ниже которого записи отбрасываются при заполненной очереди.
+        dropped (int): Число отброшенных записей с момента запуска процесса.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sink: Any,
+        maxsize: int = settings.LOG_QUEUE_MAXSIZE,
+        drop_below: str = settings.LOG_QUEUE_DROP_BELOW,
+        **options: Any,
+    ):
+        """
+        Инициализирует QueuedSink и запускает поток записи.
+
+        Args:
+            name (str): Имя sink'а.
+            sink (Any): Назначение записи (путь к файлу или поток вывода).
+            maxsize (int): Максимальное число записей в очереди.
+            drop_below (str): Уровень, ниже которого записи отбрасываются при заполненной очереди.
+            **options (Any): Параметры loguru для назначения (rotation, retention и т.д.).
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.drop_below = logger.level(drop_below).no
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._writer = copy.deepcopy(_bare_logger)
+        self._writer.add(sink, format="{message}", level=0, **options)
+        self._start()
+        _queued_sinks.append(self)
+        # После fork (gunicorn с preload_app) поток записи в дочернем процессе не существует.
+        os.register_at_fork(after_in_child=self._start)
+        atexit.register(self.stop)
+
+    def _start(self) -> None:
+        """Создаёт очередь и запускает поток записи."""
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.maxsize)
+        self._thread = threading.Thread(target=self._run, name=f"log-writer-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Пишет строки из очереди до получения None."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            self._writer.opt(raw=True).log(item.record["level"].name, item)
+
+    def write(self, message: str) -> None:
+        """Кладёт отформатированную запись в очередь; при заполненной очереди отбрасывает маловажные."""
+        if message.record["level"].no >= self.drop_below:
+            self._queue.put(message)
+            return
+
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+    async def complete(self) -> None:
+        """Дожидается записи всех сообщений, поставленных в очередь (logger.complete())."""
+        drained = threading.Event()
+        self._queue.put(drained)
+        await asyncio.get_running_loop().run_in_executor(None, drained.wait)
+
+    def stop(self) -> None:
+        """Дописывает очередь и останавливает поток записи (вызывается при logger.remove())."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+
 def configure_logger():
     """
     Конфигурирует логгер.
 
     - Удаляет стандартный логгер.
     - Создаёт директорию для логов, если она не существует.
-    - Настраивает логирование в файл с ротацией и вывод в консоль с цветами.
+    - Настраивает логирование в файл с ротацией и вывод в консоль с цветами
+      (или в JSON при LOG_JSON).
+    - При LOG_ENQUEUE записи передаются в очередь и пишутся отдельным потоком
+      (см. QueuedSink), поэтому запись на диск и в stdout не блокирует event loop.
+    - Уровни можно переопределить по модулям через LOG_MODULE_LEVELS.
+    - diagnose (значения переменных в трейсбеках) по умолчанию выключен в production.
     """
+    global _bare_logger
+
     logger.remove()
+    _bare_logger = copy.deepcopy(logger)
 
     log_dir = os.path.dirname(os.path.abspath(settings.LOG_FILE_PATH))
     if log_dir and not os.path.exists(log_dir):
         logger.debug(f"Creating log directory: {log_dir}")
         os.makedirs(log_dir, exist_ok=True)
 
-    logger.add(
-        settings.LOG_FILE_PATH,
-        rotation=settings.LOG_ROTATION,
-        retention=settings.LOG_RETENTION,
-        level=settings.LOG_LEVEL,
-        format=LOG_FORMAT_FILE,
-        backtrace=True,
-        diagnose=True,
-    )
+    levels = module_levels()
+    diagnose = settings.LOG_DIAGNOSE if settings.LOG_DIAGNOSE is not None else not is_production()
+    common = {
+        # Минимальный уровень sink'а — самый низкий из уровней модулей, остальное отсекает фильтр.
+        "level": min(logger.level(level).no for level in levels.values()),
+        "filter": levels,
+        "backtrace": True,
+        "diagnose": diagnose,
+        "serialize": settings.LOG_JSON,
+    }
+
+    file_sink: Any = settings.LOG_FILE_PATH
+    file_options = {"rotation": settings.LOG_ROTATION, "retention": settings.LOG_RETENTION}
+    stdout_sink: Any = stdout
+    if settings.LOG_ENQUEUE:
+        file_sink, file_options = QueuedSink("file", file_sink, **file_options), {}
+        stdout_sink = QueuedSink("stdout", stdout_sink)
+
+    logger.add(file_sink, format=LOG_FORMAT_FILE, **file_options, **common)
 
     logger.add(
-        stdout,
-        level=settings.LOG_LEVEL,
+        stdout_sink,
         format=LOG_FORMAT_TERMINAL,
-        backtrace=True,
-        diagnose=True,
-        colorize=True,
+        colorize=not settings.LOG_JSON,
+        **common,
     )
 
     logger.info("Logger has been configured successfully.")
 
 
+class SampledLogger:
+    """
+    Логгер для горячего пути (запросы к базе данных и Redis, чтение из кэша).
+
+    Записывает только долю LOG_HOT_PATH_SAMPLE_RATE вызовов; решение принимается
+    до форматирования, поэтому пропущенная запись почти ничего не стоит. Сообщения
+    передаются в стиле loguru (`"Ключ {} найден", key`), а не f-строкой, чтобы
+    форматирование выполнялось только для записанных сообщений.
+
+    Attributes:
+        rate (float): Доля записываемых сообщений от 0 до 1.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Инициализирует SampledLogger.
+
+        Args:
+            rate (float): Доля записываемых сообщений от 0 до 1.
+        """
+        self.rate = rate
+
+    def _log(self, level: str, message: str, *args, **kwargs) -> None:
+        """Записывает сообщение с вероятностью rate от имени вызывающего кода."""
+        if self.rate >= 1.0 or random.random() < self.rate:
+            logger.opt(depth=2).log(level, message, *args, **kwargs)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """Записывает сообщение уровня DEBUG с вероятностью rate."""
+        self._log("DEBUG", message, *args, **kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        """Записывает сообщение уровня INFO с вероятностью rate."""
+        self._log("INFO", message, *args, **kwargs)
+
+
 configure_logger()
 
-__all__ = ["logger"]
+hot_logger = SampledLogger(
+    settings.LOG_HOT_PATH_SAMPLE_RATE
+    if settings.LOG_HOT_PATH_SAMPLE_RATE is not None
+    else (0.01 if is_production() else 1.0)
+)
+
+__all__ = ["logger", "hot_logger", "dropped_log_records"]
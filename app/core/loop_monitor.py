@@ -0,0 +1,116 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from app.core.monitoring import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+from app.core.settings import settings
+from app.core.logging import logger
+
+
+class LoopMonitor:
+    """
+    Монитор задержки event loop и блокирующих вызовов.
+
+    Фоновая задача (heartbeat) засыпает на interval секунд и измеряет, насколько
+    позже она проснулась: это задержка планирования, которую получают все запросы
+    воркера. Значения пишутся в гистограмму event_loop_lag_seconds.
+
+    Сторожевой поток проверяет, когда heartbeat последний раз отработал. Если
+    event loop не выполнял его дольше interval + threshold, значит текущий callback
+    блокирует loop, и поток логирует стек потока event loop — по нему видно
+    корутину и вызов, который держит loop (bcrypt, синхронная запись, публикация в
+    брокер). Стек логируется один раз за блокировку. Без блокировок монитор
+    просыпается раз в interval в event loop и раз в interval в сторожевом потоке.
+
+    Attributes:
+        interval (float): Интервал heartbeat в секундах.
+        threshold (float): Длительность блокировки, после которой логируется стек.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.LOOP_MONITOR_INTERVAL,
+        threshold: float = settings.LOOP_MONITOR_BLOCK_THRESHOLD,
+    ):
+        """
+        Инициализирует LoopMonitor.
+
+        Args:
+            interval (float): Интервал heartbeat в секундах.
+            threshold (float): Длительность блокировки, после которой логируется стек.
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def _heartbeat(self) -> None:
+        """Измеряет задержку пробуждения после sleep(interval)."""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            EVENT_LOOP_LAG.observe(max(0.0, time.perf_counter() - start - self.interval))
+            self._last_beat = time.monotonic()
+
+    def _watch(self) -> None:
+        """
+        Сторожевой цикл: логирует стек event loop при блокировке дольше порога.
+
+        Поток просыпается к моменту, когда блокировка превысила бы порог, если
+        heartbeat больше не отработает, поэтому при работающем loop он просыпается
+        примерно раз в interval, а не с частотой, определяемой порогом.
+        """
+        reported_beat = None
+        timeout = self.interval + self.threshold
+
+        while not self._stop.wait(timeout):
+            last_beat = self._last_beat
+            blocked_for = time.monotonic() - last_beat - self.interval
+            if blocked_for < self.threshold:
+                timeout = self.threshold - blocked_for
+                continue
+
+            # Во время уже залогированной блокировки поток ждёт следующего heartbeat с шагом threshold.
+            timeout = self.threshold
+            if reported_beat == last_beat:
+                continue
+
+            reported_beat = last_beat
+            EVENT_LOOP_BLOCKS.inc()
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "стек недоступен\n"
+            logger.warning(f"Event loop заблокирован дольше {blocked_for:.3f} сек. Стек потока event loop:\n{stack}")
+
+    async def start(self) -> None:
+        """Запускает heartbeat и сторожевой поток."""
+        if self._task is not None:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Монитор event loop запущен (интервал {self.interval} сек., порог {self.threshold} сек.).")
+
+    async def stop(self) -> None:
+        """Останавливает heartbeat и сторожевой поток."""
+        if self._task is None:
+            return
+
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._watchdog.join()
+        self._watchdog = None
@@ -1,22 +1,56 @@
+import asyncio
+import gc
+import os
+import shutil
+import sys
 import time
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Response
 
 from prometheus_client import (
     Histogram,
     Gauge,
     Counter,
+    CollectorRegistry,
     generate_latest,
+    multiprocess,
     CONTENT_TYPE_LATEST,
     REGISTRY,
 )
-
-from prometheus_fastapi_instrumentator import Instrumentator
-from prometheus_fastapi_instrumentator.metrics import Info
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.settings import settings
+from app.core.logging import logger, dropped_log_records
+
+# Каталог mmap-файлов метрик для режима нескольких процессов. prometheus_client читает
+# переменную окружения напрямую при создании метрик, поэтому она задаётся до запуска
+# воркеров (docker-compose, лаунчер), а не через Settings.
+MULTIPROC_DIR: Optional[str] = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+# Пути, которые не учитываются в HTTP-метриках.
+EXCLUDED_PATHS = frozenset({
+    "/metrics", "/health", "/health/live", "/health/ready", "/api/docs", "/api/redoc", "/api/openapi.json",
+    "/operator/profile", "/operator/memory/start", "/operator/memory/snapshot", "/operator/memory/diff",
+    "/operator/memory/stop", "/operator/export/users",
+})
+
+# Методы вне этого списка учитываются как OTHER, чтобы ограничить кардинальность меток.
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+# Метка endpoint для запросов, не совпавших ни с одним маршрутом (например, 404).
+UNMATCHED_ENDPOINT = "unmatched"
+
+
+def latency_buckets() -> Tuple[float, ...]:
+    """
+    Определение бакетов для гистограмм latency.
+
+    Returns:
+        Tuple[float, ...]: Границы бакетов в секундах.
+    """
+    return (.005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0, 2.5, 5.0, 7.5, 10.0, 30.0, 60.0)
+
 
 REQUEST_COUNT = Counter(
     "http_requests_total",
@@ -27,19 +61,22 @@ REQUEST_COUNT = Counter(
 REQUEST_DURATION = Histogram(
     "http_request_duration_seconds",
     "HTTP request duration in seconds",
-    ["method", "endpoint"]
+    ["method", "endpoint"],
+    buckets=latency_buckets(),
 )
 
 ACTIVE_REQUESTS = Gauge(
     "http_requests_in_progress",
     "Number of active HTTP requests",
-    ["method", "endpoint"]
+    ["method"],
+    multiprocess_mode="livesum",
 )
 
 APPLICATION_INFO = Gauge(
     "application_info",
     "Application version information",
-    ["version", "environment"]
+    ["version", "environment"],
+    multiprocess_mode="max",
 )
 
 EXCEPTION_COUNT = Counter(
@@ -48,62 +85,73 @@ EXCEPTION_COUNT = Counter(
     ["method", "endpoint", "exception_type"]
 )
 
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state (0 - closed, 1 - open, 2 - half-open)",
+    ["dependency"],
+    multiprocess_mode="max",
+)
 
-def latency_buckets() -> Tuple[float, ...]:
-    """
-    Определение бакетов для гистограмм latency.
-
-    Returns:
-        Tuple[float, ...]: Границы бакетов в секундах.
-    """
-    return (.005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0, 2.5, 5.0, 7.5, 10.0, 30.0, 60.0)
-
-
-def http_requests_total() -> None:
-    """Кастомная метрика для общего количества HTTP запросов."""
-    def instrumentation(info: Info) -> None:
-        REQUEST_COUNT.labels(
-            method=info.request.method,
-            endpoint=info.modified_handler,
-            status_code=info.response.status_code
-        ).inc()
+CIRCUIT_BREAKER_TRIPS = Counter(
+    "circuit_breaker_trips_total",
+    "Total count of circuit breaker trips",
+    ["dependency"]
+)
 
-    return instrumentation
+RATE_LIMIT_DECISIONS = Counter(
+    "rate_limit_decisions_total",
+    "Total count of rate limit decisions",
+    ["route", "key_type", "tier", "decision"]
+)
 
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Event loop scheduling lag in seconds",
+    buckets=(.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1.0, 2.5, 5.0),
+)
 
-def http_request_duration() -> None:
-    """Кастомная метрика для длительности HTTP запросов."""
-    def instrumentation(info: Info) -> None:
-        if hasattr(info, "duration"):
-            REQUEST_DURATION.labels(
-                method=info.request.method,
-                endpoint=info.modified_handler
-            ).observe(info.duration)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks_total",
+    "Total count of event loop blocks longer than the configured threshold"
+)
 
-    return instrumentation
+PROCESS_RSS = Gauge(
+    "worker_resident_memory_bytes",
+    "Resident set size of the worker process in bytes",
+    multiprocess_mode="liveall",
+)
 
+ALLOCATED_BLOCKS = Gauge(
+    "worker_allocated_blocks",
+    "Number of memory blocks currently allocated by the Python allocator (live objects and buffers)",
+    multiprocess_mode="liveall",
+)
 
-def create_instrumentator() -> Instrumentator:
-    """
-    Создание и конфигурация Prometheus instrumentator.
+GC_PENDING = Gauge(
+    "worker_gc_pending_objects",
+    "Allocations minus deallocations since the last collection, by GC generation",
+    ["generation"],
+    multiprocess_mode="liveall",
+)
 
-    Returns:
-        Instrumentator: Сконфигурированный экземпляр Prometheus instrumentator.
-    """
-    instrumentator = Instrumentator(
-        should_group_status_codes=True,
-        should_ignore_untemplated=True,
-        should_respect_env_var=True,
-        should_instrument_requests_inprogress=True,
-        excluded_handlers=["/metrics", "/health", "/api/docs", "/api/redoc", "/api/openapi.json"],
-        inprogress_name="http_requests_in_progress",
-        inprogress_labels=True,
-    )
+GC_COLLECTIONS = Gauge(
+    "worker_gc_collections",
+    "Number of collections, by GC generation",
+    ["generation"],
+    multiprocess_mode="liveall",
+)
 
-    instrumentator.add(http_requests_total())
-    instrumentator.add(http_request_duration())
+LOG_RECORDS_DROPPED = Gauge(
+    "worker_log_records_dropped",
+    "Number of log records dropped because the log writer queue was full",
+    multiprocess_mode="liveall",
+)
 
-    return instrumentator
+CACHE_FALLBACK_OPERATIONS = Counter(
+    "cache_fallback_operations_total",
+    "Total count of cache operations served by the in-process fallback",
+    ["operation"]
+)
 
 
 def setup_application_metrics(app: FastAPI, version: str = "1.0.0", environment: str = "development") -> None:
@@ -119,18 +167,52 @@ def setup_application_metrics(app: FastAPI, version: str = "1.0.0", environment:
 
 
 class MonitoringMiddleware:
-    """Middleware для комплексного мониторинга запросов."""
+    """
+    Pure-ASGI middleware для сбора HTTP-метрик.
 
-    def __init__(self, app: FastAPI):
+    Метка endpoint — шаблон маршрута (scope["route"].path), который роутер
+    записывает в scope при сопоставлении, поэтому кардинальность меток
+    ограничена числом маршрутов. Запросы без маршрута учитываются как
+    "unmatched". Длительность измеряется через perf_counter, а дочерние
+    метрики с метками кэшируются, чтобы не вызывать labels() на каждый запрос.
+    """
+
+    def __init__(self, app: ASGIApp):
         """
         Инициализация monitoring middleware.
 
         Args:
-            app: Экземпляр FastAPI приложения.
+            app: ASGI-приложение.
         """
         self.app = app
-
-    async def __call__(self, scope, receive, send) -> None:
+        self._active: Dict[str, Any] = {}
+        self._durations: Dict[Tuple[str, str], Any] = {}
+        self._counts: Dict[Tuple[str, str, int], Any] = {}
+
+    def _active_gauge(self, method: str) -> Any:
+        """Возвращает дочернюю метрику активных запросов для метода."""
+        gauge = self._active.get(method)
+        if gauge is None:
+            gauge = self._active[method] = ACTIVE_REQUESTS.labels(method=method)
+        return gauge
+
+    def _record(self, method: str, endpoint: str, status_code: int, duration: float) -> None:
+        """Записывает длительность и счётчик запроса в кэшированные дочерние метрики."""
+        histogram = self._durations.get((method, endpoint))
+        if histogram is None:
+            histogram = self._durations[(method, endpoint)] = REQUEST_DURATION.labels(
+                method=method, endpoint=endpoint
+            )
+        histogram.observe(duration)
+
+        counter = self._counts.get((method, endpoint, status_code))
+        if counter is None:
+            counter = self._counts[(method, endpoint, status_code)] = REQUEST_COUNT.labels(
+                method=method, endpoint=endpoint, status_code=status_code
+            )
+        counter.inc()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Обработка запроса и сбор метрик.
 
@@ -139,34 +221,176 @@ class MonitoringMiddleware:
             receive: Receive channel.
             send: Send channel.
         """
-        if scope["type"] != "http":
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope, receive)
-        method = request.method
-        endpoint = request.url.path
+        method = scope["method"]
+        if method not in KNOWN_METHODS:
+            method = "OTHER"
 
-        # Отслеживание активных запросов
-        ACTIVE_REQUESTS.labels(method=method, endpoint=endpoint).inc()
+        status_code = 500
 
-        start_time = time.time()
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        active = self._active_gauge(method)
+        active.inc()
+        start_time = time.perf_counter()
 
         try:
-            await self.app(scope, receive, send)
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            route = scope.get("route")
             EXCEPTION_COUNT.labels(
                 method=method,
-                endpoint=endpoint,
+                endpoint=route.path if route is not None else UNMATCHED_ENDPOINT,
                 exception_type=type(e).__name__
             ).inc()
             raise
         finally:
-            duration = time.time() - start_time
-            ACTIVE_REQUESTS.labels(method=method, endpoint=endpoint).dec()
+            duration = time.perf_counter() - start_time
+            active.dec()
 
-            # Запись длительности для всех запросов
-            REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(duration)
+            route = scope.get("route")
+            self._record(method, route.path if route is not None else UNMATCHED_ENDPOINT, status_code, duration)
+
+
+def prepare_multiprocess_dir() -> None:
+    """
+    Очищает каталог метрик режима нескольких процессов перед запуском воркеров.
+
+    Файлы предыдущего запуска иначе продолжат суммироваться в /metrics.
+    Вызывается один раз в мастер-процессе, до запуска воркеров.
+    """
+    if not MULTIPROC_DIR:
+        return
+
+    for name in os.listdir(MULTIPROC_DIR) if os.path.isdir(MULTIPROC_DIR) else ():
+        path = os.path.join(MULTIPROC_DIR, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.remove(path)
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """
+    Удаляет файлы live-gauge завершившегося воркера.
+
+    Без этого значения gauge в режиме livesum продолжают учитывать мёртвый процесс.
+
+    Args:
+        pid: PID воркера (по умолчанию текущий процесс).
+    """
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid or os.getpid(), MULTIPROC_DIR)
+
+
+def collect_metrics() -> bytes:
+    """
+    Формирует ответ /metrics.
+
+    В режиме нескольких процессов метрики всех воркеров агрегируются из
+    каталога PROMETHEUS_MULTIPROC_DIR, иначе экспортируется реестр текущего процесса.
+
+    Returns:
+        bytes: Метрики Prometheus в текстовом формате.
+    """
+    if not MULTIPROC_DIR:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=MULTIPROC_DIR)
+    return generate_latest(registry)
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """
+    Определяет RSS текущего процесса по /proc/self/statm.
+
+    Returns:
+        Optional[int]: RSS в байтах или None, если /proc недоступен.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ProcessMetrics:
+    """
+    Периодический сбор метрик воркера: RSS, число выделенных блоков памяти,
+    поколения GC и отброшенные записи журнала.
+
+    Каждый воркер записывает свои значения раз в interval секунд фоновой задачей:
+    /metrics обслуживает один воркер, а значения остальных он читает из файлов
+    режима нескольких процессов. Сбор — чтение /proc/self/statm, счётчиков GC и
+    sys.getallocatedblocks(), поэтому выполняется в event loop. Число живых
+    объектов оценивается по выделенным блокам, а не через gc.get_objects: тот
+    линеен по размеру кучи и удерживает GIL. Постоянный рост блоков при
+    неизменном числе ожидающих сборки объектов указывает на утечку, а не на
+    отставание GC.
+
+    Attributes:
+        interval (float): Интервал сбора в секундах.
+    """
+
+    def __init__(self, interval: float = settings.PROCESS_METRICS_INTERVAL):
+        """
+        Инициализирует ProcessMetrics.
+
+        Args:
+            interval (float): Интервал сбора в секундах.
+        """
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._pending = [GC_PENDING.labels(generation=str(index)) for index in range(3)]
+        self._collections = [GC_COLLECTIONS.labels(generation=str(index)) for index in range(3)]
+
+    def collect(self) -> None:
+        """Обновляет метрики памяти текущего процесса."""
+        rss = resident_memory_bytes()
+        if rss is not None:
+            PROCESS_RSS.set(rss)
+        ALLOCATED_BLOCKS.set(sys.getallocatedblocks())
+
+        for gauge, pending in zip(self._pending, gc.get_count()):
+            gauge.set(pending)
+        for gauge, stats in zip(self._collections, gc.get_stats()):
+            gauge.set(stats["collections"])
+        LOG_RECORDS_DROPPED.set(dropped_log_records())
+
+    async def _loop(self) -> None:
+        """Периодически собирает метрики; ошибка сбора не останавливает задачу."""
+        while True:
+            try:
+                self.collect()
+            except Exception as e:
+                logger.error(f"Ошибка сбора метрик процесса: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        """Запускает периодический сбор."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Останавливает периодический сбор."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
 
 
 def create_metrics_router(app: FastAPI) -> None:
@@ -185,23 +409,10 @@ def create_metrics_router(app: FastAPI) -> None:
             Response: Метрики Prometheus в текстовом формате.
         """
         return Response(
-            content=generate_latest(REGISTRY),
+            content=collect_metrics(),
             media_type=CONTENT_TYPE_LATEST
         )
 
-    @app.get("/health", include_in_schema=False)
-    async def health_check() -> JSONResponse:
-        """
-        Health check эндпоинт для балансировщиков и мониторинга.
-
-        Returns:
-            JSONResponse: Ответ со статусом здоровья.
-        """
-        return JSONResponse(
-            content={"status": "healthy", "timestamp": time.time()},
-            status_code=200
-        )
-
 
 def setup_monitoring(app: FastAPI) -> None:
     """
@@ -209,7 +420,6 @@ def setup_monitoring(app: FastAPI) -> None:
 
     Функция конфигурирует все компоненты мониторинга включая:
     - Сбор метрик Prometheus
-    - Health checks
     - Middleware для мониторинга запросов
 
     Args:
@@ -218,6 +428,3 @@ def setup_monitoring(app: FastAPI) -> None:
     create_metrics_router(app)
 
     app.add_middleware(MonitoringMiddleware)
-
-    instrumentator = create_instrumentator()
-    instrumentator.instrument(app)
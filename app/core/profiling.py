@@ -0,0 +1,353 @@
+"""
+Профилирование работающего воркера: семплирующий CPU-профайлер и снимки памяти.
+
+CPU-профайлер — отдельный поток, который с интервалом PROFILER_SAMPLE_INTERVAL снимает
+стеки всех потоков процесса через sys._current_frames() и агрегирует их в формат
+collapsed stacks (`кадр;кадр;кадр количество`), который принимают flamegraph.pl,
+speedscope и inferno. Поток существует только во время сессии, поэтому без
+профилирования накладные расходы нулевые.
+
+Профилирование памяти использует tracemalloc: он включается оператором, снимки
+хранятся в воркере, а эндпоинты возвращают топ мест выделения памяти и разницу
+между снимками. Пока tracemalloc не запущен, накладных расходов нет.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, OrderedDict
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+from fastapi import Depends, FastAPI, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.security.operator import require_operator
+from app.core.settings import settings
+from app.core.logging import logger
+
+
+class SamplingProfiler:
+    """
+    Семплирующий профайлер стеков потоков.
+
+    Attributes:
+        interval (float): Интервал между снимками стеков в секундах.
+        samples (Counter): Количество снимков по каждому стеку.
+    """
+
+    def __init__(self, interval: float = settings.PROFILER_SAMPLE_INTERVAL):
+        """
+        Инициализирует SamplingProfiler.
+
+        Args:
+            interval (float): Интервал между снимками стеков в секундах.
+        """
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _frame_label(frame: FrameType) -> str:
+        """Формирует подпись кадра: функция и место определения."""
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _collapse(self, frame: Optional[FrameType]) -> str:
+        """Сворачивает стек кадра в строку от корня к листу."""
+        stack: List[str] = []
+        while frame is not None:
+            stack.append(self._frame_label(frame))
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def _run(self) -> None:
+        """Цикл снятия стеков до вызова stop()."""
+        own_id = threading.get_ident()
+        names: Dict[int, str] = {}
+
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if thread_id not in names:
+                    names.update((thread.ident, thread.name) for thread in threading.enumerate())
+                name = names.get(thread_id, f"thread-{thread_id}")
+                self.samples[f"{name};{self._collapse(frame)}"] += 1
+
+    def start(self) -> None:
+        """Запускает поток профайлера."""
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Останавливает поток профайлера."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self) -> str:
+        """
+        Возвращает результат в формате collapsed stacks.
+
+        Returns:
+            str: Стеки с количеством снимков, по одному на строку.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+# Одна сессия профилирования на процесс: параллельные сессии искажают друг друга.
+_session_lock = asyncio.Lock()
+
+
+async def profile(seconds: float) -> str:
+    """
+    Профилирует текущий процесс заданное время.
+
+    Args:
+        seconds (float): Длительность профилирования.
+
+    Returns:
+        str: Результат в формате collapsed stacks.
+
+    Raises:
+        HTTPException: Если в процессе уже идёт сессия профилирования.
+    """
+    if _session_lock.locked():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Profiling session already in progress")
+
+    async with _session_lock:
+        profiler = SamplingProfiler()
+        logger.warning(f"Запущено профилирование воркера {os.getpid()} на {seconds} сек.")
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+        logger.info(f"Профилирование воркера {os.getpid()} завершено: {sum(profiler.samples.values())} снимков.")
+        return profiler.collapsed()
+
+
+class MemoryProfiler:
+    """
+    Снимки памяти tracemalloc с хранением в воркере.
+
+    Снятие снимка и подсчёт статистики линейны по числу отслеживаемых выделений,
+    поэтому эндпоинты вызывают snapshot и diff в пуле потоков (run_in_executor):
+    значительная часть работы выполняется в Python-коде tracemalloc, и GIL
+    переключается на event loop. Доступ к хранилищу снимков защищён блокировкой.
+
+    Attributes:
+        max_snapshots (int): Максимальное число хранимых снимков (старые вытесняются).
+        snapshots (OrderedDict): Снимки по номеру.
+    """
+
+    # Выделения самого tracemalloc и импорта модулей не относятся к утечкам приложения.
+    FILTERS = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+    def __init__(self, max_snapshots: int = settings.MEMORY_PROFILER_MAX_SNAPSHOTS):
+        """
+        Инициализирует MemoryProfiler.
+
+        Args:
+            max_snapshots (int): Максимальное число хранимых снимков.
+        """
+        self.max_snapshots = max_snapshots
+        self.snapshots: "OrderedDict[int, tracemalloc.Snapshot]" = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _describe(statistic: Any) -> Dict[str, Any]:
+        """Преобразует статистику tracemalloc в словарь для ответа."""
+        result = {
+            "location": [f"{frame.filename}:{frame.lineno}" for frame in statistic.traceback],
+            "size_bytes": statistic.size,
+            "count": statistic.count,
+        }
+        if hasattr(statistic, "size_diff"):
+            result.update(size_diff_bytes=statistic.size_diff, count_diff=statistic.count_diff)
+        return result
+
+    def start(self, frames: int) -> None:
+        """
+        Запускает tracemalloc.
+
+        Args:
+            frames (int): Глубина сохраняемого стека выделения.
+
+        Raises:
+            HTTPException: Если tracemalloc уже запущен.
+        """
+        if tracemalloc.is_tracing():
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Memory tracing already started")
+
+        tracemalloc.start(frames)
+        logger.warning(f"В воркере {os.getpid()} запущен tracemalloc (глубина стека {frames}).")
+
+    def stop(self) -> None:
+        """Останавливает tracemalloc и удаляет снимки."""
+        tracemalloc.stop()
+        with self._lock:
+            self.snapshots.clear()
+        logger.info(f"В воркере {os.getpid()} остановлен tracemalloc.")
+
+    def snapshot(self, limit: int, group_by: str) -> Dict[str, Any]:
+        """
+        Снимает снимок памяти и возвращает топ мест выделения.
+
+        Args:
+            limit (int): Количество мест выделения в ответе.
+            group_by (str): Группировка: lineno или traceback.
+
+        Returns:
+            Dict[str, Any]: Номер снимка, объём отслеживаемой памяти и топ мест выделения.
+
+        Raises:
+            HTTPException: Если tracemalloc не запущен.
+        """
+        if not tracemalloc.is_tracing():
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Memory tracing is not started")
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(self.FILTERS)
+        with self._lock:
+            snapshot_id = self._next_id
+            self._next_id += 1
+            self.snapshots[snapshot_id] = snapshot
+            while len(self.snapshots) > self.max_snapshots:
+                self.snapshots.popitem(last=False)
+
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "snapshot_id": snapshot_id,
+            "traced_bytes": current,
+            "peak_traced_bytes": peak,
+            "top": [self._describe(statistic) for statistic in snapshot.statistics(group_by)[:limit]],
+        }
+
+    def diff(self, first: int, second: int, limit: int, group_by: str) -> Dict[str, Any]:
+        """
+        Сравнивает два снимка и возвращает места с наибольшим ростом памяти.
+
+        Args:
+            first (int): Номер исходного снимка.
+            second (int): Номер сравниваемого снимка.
+            limit (int): Количество мест выделения в ответе.
+            group_by (str): Группировка: lineno или traceback.
+
+        Returns:
+            Dict[str, Any]: Изменение объёма памяти и топ мест выделения по росту.
+
+        Raises:
+            HTTPException: Если снимок не найден.
+        """
+        with self._lock:
+            missing = [snapshot_id for snapshot_id in (first, second) if snapshot_id not in self.snapshots]
+            if missing:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Snapshot {missing[0]} not found")
+            old, new = self.snapshots[first], self.snapshots[second]
+
+        statistics = new.compare_to(old, group_by)
+        return {
+            "from": first,
+            "to": second,
+            "size_diff_bytes": sum(statistic.size_diff for statistic in statistics),
+            "top": [self._describe(statistic) for statistic in statistics[:limit]],
+        }
+
+
+memory_profiler = MemoryProfiler()
+
+
+def create_profiling_router(app: FastAPI) -> None:
+    """
+    Создание служебных эндпоинтов профилирования.
+
+    Args:
+        app: Экземпляр FastAPI приложения.
+    """
+    @app.get(
+        "/operator/profile",
+        include_in_schema=False,
+        dependencies=[Depends(require_operator)],
+    )
+    async def profile_endpoint(
+        seconds: float = Query(10.0, gt=0, le=settings.PROFILER_MAX_SECONDS),
+    ) -> PlainTextResponse:
+        """
+        Профилирует воркер, принявший запрос, и возвращает collapsed stacks.
+
+        При нескольких воркерах профилируется тот, на который попал запрос;
+        его PID указан в имени файла и заголовке X-Worker-Pid.
+
+        Returns:
+            PlainTextResponse: Файл для flamegraph.pl/speedscope.
+        """
+        pid = os.getpid()
+        result = await profile(seconds)
+        return PlainTextResponse(
+            content=result,
+            headers={
+                "Content-Disposition": f'attachment; filename="profile-{pid}-{int(time.time())}.collapsed"',
+                "X-Worker-Pid": str(pid),
+            },
+        )
+
+    @app.post(
+        "/operator/memory/start",
+        include_in_schema=False,
+        dependencies=[Depends(require_operator)],
+    )
+    async def memory_start(frames: int = Query(25, ge=1, le=100)) -> Dict[str, Any]:
+        """Запускает tracemalloc в воркере, принявшем запрос."""
+        memory_profiler.start(frames)
+        return {"status": "started", "pid": os.getpid(), "frames": frames}
+
+    @app.post(
+        "/operator/memory/snapshot",
+        include_in_schema=False,
+        dependencies=[Depends(require_operator)],
+    )
+    async def memory_snapshot(
+        limit: int = Query(20, ge=1, le=200),
+        group_by: str = Query("lineno", pattern="^(lineno|traceback)$"),
+    ) -> Dict[str, Any]:
+        """Снимает снимок памяти и возвращает топ мест выделения."""
+        result = await asyncio.get_running_loop().run_in_executor(None, memory_profiler.snapshot, limit, group_by)
+        return {"pid": os.getpid(), **result}
+
+    @app.get(
+        "/operator/memory/diff",
+        include_in_schema=False,
+        dependencies=[Depends(require_operator)],
+    )
+    async def memory_diff(
+        first: int = Query(..., alias="from"),
+        second: int = Query(..., alias="to"),
+        limit: int = Query(20, ge=1, le=200),
+        group_by: str = Query("lineno", pattern="^(lineno|traceback)$"),
+    ) -> Dict[str, Any]:
+        """Возвращает разницу между двумя снимками памяти."""
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, memory_profiler.diff, first, second, limit, group_by
+        )
+        return {"pid": os.getpid(), **result}
+
+    @app.post(
+        "/operator/memory/stop",
+        include_in_schema=False,
+        dependencies=[Depends(require_operator)],
+    )
+    async def memory_stop() -> Dict[str, Any]:
+        """Останавливает tracemalloc и удаляет снимки."""
+        memory_profiler.stop()
+        return {"status": "stopped", "pid": os.getpid()}
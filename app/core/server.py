@@ -0,0 +1,143 @@
+"""
+Продакшн-запуск сервиса: gunicorn с воркерами uvicorn.
+
+Запуск:
+    python -m app.core.server
+"""
+import math
+import os
+from importlib.util import find_spec
+from typing import Any, Dict, Optional
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from app.core.monitoring import mark_process_dead, prepare_multiprocess_dir
+from app.core.settings import settings
+from app.core.logging import logger
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read(path: str) -> Optional[str]:
+    """Читает файл cgroup или возвращает None, если он недоступен."""
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_quota() -> Optional[float]:
+    """
+    Определяет квоту CPU контейнера по cgroup v2 или v1.
+
+    Returns:
+        Optional[float]: Число доступных ядер или None, если квота не задана.
+    """
+    cpu_max = _read(CGROUP_V2_CPU_MAX)
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    quota, period = _read(CGROUP_V1_CPU_QUOTA), _read(CGROUP_V1_CPU_PERIOD)
+    if quota and period and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def worker_count() -> int:
+    """
+    Вычисляет число воркеров.
+
+    SERVER_WORKERS > 0 задаёт число явно. Иначе берётся по одному воркеру на
+    доступное ядро: квота CPU контейнера, ограниченная числом ядер, на которых
+    процессу разрешено выполняться.
+
+    Returns:
+        int: Число воркеров (не меньше 1).
+    """
+    if settings.SERVER_WORKERS > 0:
+        return settings.SERVER_WORKERS
+
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    quota = cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+class ServiceWorker(UvicornWorker):
+    """Воркер uvicorn с uvloop и httptools (если установлены) и ограничением конкурентности."""
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop" if find_spec("uvloop") else "asyncio",
+        "http": "httptools" if find_spec("httptools") else "h11",
+        "limit_concurrency": settings.SERVER_LIMIT_CONCURRENCY,
+        "lifespan": "on",
+    }
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """Хук gunicorn: удаляет файлы метрик завершившегося воркера."""
+    mark_process_dead(worker.pid)
+
+
+class ServiceApplication(BaseApplication):
+    """Приложение gunicorn с конфигурацией из Settings."""
+
+    def __init__(self, options: Dict[str, Any]):
+        """
+        Инициализирует приложение gunicorn.
+
+        Args:
+            options (Dict[str, Any]): Параметры конфигурации gunicorn.
+        """
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Передаёт параметры в конфигурацию gunicorn."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        """Импортирует ASGI-приложение (в мастере при preload_app)."""
+        from main import app
+
+        return app
+
+
+def run() -> None:
+    """Запускает сервис с числом воркеров и пулами соединений по доступным ресурсам."""
+    workers = worker_count()
+    # Размер пулов воркера зависит от числа воркеров (Settings.mysql_pool_maxsize,
+    # Settings.redis_pool_maxsize). Приложение импортируется в мастере после этого
+    # присваивания, поэтому воркеры наследуют значение при fork.
+    settings.SERVER_WORKERS = workers
+    prepare_multiprocess_dir()
+
+    logger.info(
+        f"Запуск сервера: воркеров {workers}, loop={ServiceWorker.CONFIG_KWARGS['loop']}, "
+        f"http={ServiceWorker.CONFIG_KWARGS['http']}, пул MySQL {settings.mysql_pool_maxsize}, "
+        f"пул Redis {settings.redis_pool_maxsize} на воркер."
+    )
+
+    ServiceApplication({
+        "bind": f"{settings.SERVER_HOST}:{settings.SERVER_PORT}",
+        "workers": workers,
+        "worker_class": ServiceWorker,
+        "preload_app": True,
+        "keepalive": settings.SERVER_KEEPALIVE,
+        "backlog": settings.SERVER_BACKLOG,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT,
+        "child_exit": child_exit,
+    }).run()
+
+
+if __name__ == "__main__":
+    run()
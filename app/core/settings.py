@@ -1,3 +1,6 @@
+import math
+from typing import Dict, Literal, Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -14,6 +17,52 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_ROTATION: str = "100 MB"
     LOG_RETENTION: str = "5 days"
+    LOG_ENQUEUE: bool = True
+    LOG_QUEUE_MAXSIZE: int = 10000
+    LOG_QUEUE_DROP_BELOW: str = "WARNING"
+    LOG_JSON: bool = False
+    LOG_DIAGNOSE: Optional[bool] = None
+    LOG_MODULE_LEVELS: Dict[str, str] = {}
+    LOG_HOT_PATH_SAMPLE_RATE: Optional[float] = None
+
+    # Server
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_KEEPALIVE: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_LIMIT_CONCURRENCY: int = 1000
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+
+    # Health checks
+    HEALTH_CHECK_INTERVAL: float = 5.0
+    HEALTH_CHECK_TIMEOUT: float = 1.0
+    HEALTH_POOL_SATURATION_THRESHOLD: float = 0.9
+
+    # Event loop monitor
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL: float = 0.1
+    LOOP_MONITOR_BLOCK_THRESHOLD: float = 0.1
+
+    # Operator endpoints
+    OPERATOR_TOKEN: Optional[str] = None
+    PROFILER_SAMPLE_INTERVAL: float = 0.005
+    PROFILER_MAX_SECONDS: float = 60.0
+    MEMORY_PROFILER_MAX_SNAPSHOTS: int = 5
+
+    # Process metrics
+    PROCESS_METRICS_INTERVAL: float = 15.0
+
+    # Tracing
+    TRACING_ENABLED: bool = False
+    TRACING_SERVICE_NAME: str = "users-service"
+    TRACING_SAMPLE_RATE: float = 1.0
+    TRACING_EXPORTER: Literal["otlp", "console", "memory"] = "otlp"
+
+    # Compression
+    COMPRESSION_MINIMUM_SIZE: int = 1000
+    COMPRESSION_LEVELS: Dict[str, int] = {"zstd": 3, "br": 4, "gzip": 6}
+    COMPRESSION_ROUTE_LEVELS: Dict[str, Dict[str, int]] = {}
 
     # MySQL
     MYSQL_HOST: str = "127.0.0.1"
@@ -21,12 +70,44 @@ class Settings(BaseSettings):
     MYSQL_USER: str = "root"
     MYSQL_PASSWORD: str
     MYSQL_DATABASE: str
+    MYSQL_POOL_MAXSIZE: int = 10
+    MYSQL_MAX_CONNECTIONS: int = 100
+    MYSQL_STREAM_BATCH_SIZE: int = 500
 
     # Redis
     REDIS_HOST: str = "127.0.0.1"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 0.5
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    REDIS_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    REDIS_CIRCUIT_RECOVERY_TIMEOUT: float = 10.0
+    REDIS_POOL_MAXSIZE: int = 50
+    REDIS_MAX_CONNECTIONS: int = 500
+
+    # Cache
+    USER_CACHE_TTL: int = 3600
+    USER_TOMBSTONE_TTL: int = 60
+    LOCAL_CACHE_MAXSIZE: int = 10000
+    LOCAL_CACHE_TTL: int = 60
+    CACHE_GENERATION_TTL: float = 1.0
+
+    # Batch lookup
+    USER_BATCH_MAX_IDS: int = 200
+
+    # Username and email availability
+    AVAILABILITY_BLOOM_CAPACITY: int = 1_000_000
+    AVAILABILITY_BLOOM_ERROR_RATE: float = 0.001
+    AVAILABILITY_REBUILD_INTERVAL: float = 86400.0
+
+    # Username autocomplete
+    AUTOCOMPLETE_DEFAULT_LIMIT: int = 10
+    AUTOCOMPLETE_MAX_LIMIT: int = 20
+    AUTOCOMPLETE_REBUILD_INTERVAL: float = 86400.0
+
+    # Bulk export
+    EXPORT_CHUNK_SIZE: int = 10000
 
     # JWT
     SECRET_KEY: str
@@ -34,6 +115,13 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
 
+    # Rate Limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_MODE: Literal["redis", "hybrid"] = "redis"
+    RATE_LIMIT_SYNC_INTERVAL: float = 0.25
+    RATE_LIMIT_DEFAULT_TIER: str = "standard"
+    RATE_LIMIT_TIERS: Dict[str, float] = {"standard": 1.0, "premium": 5.0}
+
     # Brute Force Protection
     BRUTE_FORCE_MAX_ATTEMPTS: int = 5
     BRUTE_FORCE_BLOCK_TIME: int = 1800
@@ -54,6 +142,40 @@ class Settings(BaseSettings):
 
     model_config = ConfigDict(env_file=".env", extra="ignore")
 
+    def _per_worker(self, total: int, maxsize: int) -> int:
+        """
+        Делит общий лимит соединений между воркерами сервера.
+
+        Args:
+            total (int): Лимит соединений на все воркеры.
+            maxsize (int): Верхняя граница пула одного воркера.
+
+        Returns:
+            int: Размер пула одного воркера (не меньше 1).
+        """
+        workers = max(1, self.SERVER_WORKERS)
+        return max(1, min(maxsize, math.floor(total / workers)))
+
+    @property
+    def mysql_pool_maxsize(self) -> int:
+        """
+        Формирует размер пула MySQL одного воркера.
+
+        Returns:
+            int: Максимальный размер пула, при котором все воркеры укладываются в MYSQL_MAX_CONNECTIONS.
+        """
+        return self._per_worker(self.MYSQL_MAX_CONNECTIONS, self.MYSQL_POOL_MAXSIZE)
+
+    @property
+    def redis_pool_maxsize(self) -> int:
+        """
+        Формирует размер пула Redis одного воркера.
+
+        Returns:
+            int: Максимальный размер пула, при котором все воркеры укладываются в REDIS_MAX_CONNECTIONS.
+        """
+        return self._per_worker(self.REDIS_MAX_CONNECTIONS, self.REDIS_POOL_MAXSIZE)
+
     @property
     def celery_broker_url(self) -> str:
         """
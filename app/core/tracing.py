@@ -0,0 +1,233 @@
+"""
+Опциональная трассировка OpenTelemetry.
+
+Если TRACING_ENABLED выключен или пакеты opentelemetry-api/opentelemetry-sdk не
+установлены, все функции модуля работают как no-op: декоратор traced добавляет
+одну проверку глобальной переменной, а TracingMiddleware передаёт запрос дальше.
+"""
+import asyncio
+import functools
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+from app.core.logging import logger
+
+try:
+    from opentelemetry import context, propagate, trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+except ImportError:
+    trace = None
+
+Attributes = Union[Dict[str, Any], Callable[..., Dict[str, Any]], None]
+
+_tracer: Optional[Any] = None
+_memory_exporter: Optional[Any] = None
+
+
+def setup_tracing() -> None:
+    """
+    Настраивает провайдер трассировки для текущего процесса.
+
+    Вызывается в каждом процессе после fork (lifespan воркера API, worker_process_init
+    в Celery), чтобы поток BatchSpanProcessor не оставался в мастер-процессе.
+    Семплирование — ParentBased(TraceIdRatioBased(TRACING_SAMPLE_RATE)): решение
+    вызывающего сервиса из traceparent сохраняется.
+    """
+    global _tracer, _memory_exporter
+
+    if not settings.TRACING_ENABLED or _tracer is not None:
+        return
+    if trace is None:
+        logger.warning("TRACING_ENABLED включён, но пакеты opentelemetry не установлены. Трассировка отключена.")
+        return
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATE)),
+    )
+
+    if settings.TRACING_EXPORTER == "memory":
+        _memory_exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(_memory_exporter))
+    elif settings.TRACING_EXPORTER == "console":
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    else:
+        # Адрес коллектора задаётся стандартными переменными OTEL_EXPORTER_OTLP_*.
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer("app")
+    logger.info(
+        f"Трассировка включена: exporter={settings.TRACING_EXPORTER}, sample_rate={settings.TRACING_SAMPLE_RATE}."
+    )
+
+
+def finished_spans() -> List[Any]:
+    """
+    Возвращает завершённые спаны in-memory exporter'а (TRACING_EXPORTER=memory).
+
+    Returns:
+        List[Any]: Список спанов или пустой список, если exporter не используется.
+    """
+    return list(_memory_exporter.get_finished_spans()) if _memory_exporter else []
+
+
+@contextmanager
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+    """
+    Открывает дочерний спан, если трассировка включена.
+
+    Args:
+        name (str): Имя спана.
+        attributes (Optional[Dict[str, Any]]): Атрибуты спана.
+    """
+    if _tracer is None:
+        yield
+        return
+
+    with _tracer.start_as_current_span(name, attributes=attributes):
+        yield
+
+
+def traced(name: str, attributes: Attributes = None) -> Callable:
+    """
+    Декоратор, оборачивающий вызов функции в спан.
+
+    Args:
+        name (str): Имя спана.
+        attributes (Attributes): Атрибуты спана или функция, вычисляющая их из
+            аргументов вызова (вызывается только при включённой трассировке).
+
+    Returns:
+        Callable: Декоратор.
+    """
+    def resolve(args: tuple, kwargs: dict) -> Optional[Dict[str, Any]]:
+        return attributes(*args, **kwargs) if callable(attributes) else attributes
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with _tracer.start_as_current_span(name, attributes=resolve(args, kwargs)):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _tracer.start_as_current_span(name, attributes=resolve(args, kwargs)):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TracingMiddleware:
+    """
+    Pure-ASGI middleware, создающее серверный спан на каждый HTTP-запрос.
+
+    Контекст вызывающего сервиса извлекается из заголовков traceparent/tracestate.
+    Имя спана уточняется шаблоном маршрута после роутинга, как метка endpoint
+    в MonitoringMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Инициализация tracing middleware.
+
+        Args:
+            app: ASGI-приложение.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обработка запроса в серверном спане.
+
+        Args:
+            scope: Scope запроса.
+            receive: Receive channel.
+            send: Send channel.
+        """
+        if _tracer is None or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        method = scope["method"]
+
+        with _tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=trace.SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as server_span:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    server_span.set_attribute("http.response.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    server_span.set_attribute("http.route", route.path)
+                    server_span.update_name(f"{method} {route.path}")
+
+
+def instrument_celery(app: Any) -> None:
+    """
+    Подключает распространение контекста трассировки в задачи Celery.
+
+    При публикации контекст текущего спана записывается в заголовки сообщения,
+    а в воркере задача выполняется в дочернем спане этого контекста.
+
+    Args:
+        app: Приложение Celery.
+    """
+    from celery import signals
+
+    active: Dict[str, Any] = {}
+
+    @signals.worker_process_init.connect(weak=False)
+    def init_worker_tracing(**kwargs) -> None:
+        setup_tracing()
+
+    @signals.before_task_publish.connect(weak=False)
+    def inject_context(headers: Optional[dict] = None, **kwargs) -> None:
+        if _tracer is not None and headers is not None:
+            propagate.inject(headers)
+
+    @signals.task_prerun.connect(weak=False)
+    def start_task_span(task_id: str, task: Any, **kwargs) -> None:
+        if _tracer is None:
+            return
+
+        carrier = {key: getattr(task.request, key, None) for key in ("traceparent", "tracestate")}
+        parent = propagate.extract({key: value for key, value in carrier.items() if value})
+        task_span = _tracer.start_span(f"celery.run {task.name}", context=parent, kind=trace.SpanKind.CONSUMER)
+        token = context.attach(trace.set_span_in_context(task_span))
+        active[task_id] = (task_span, token)
+
+    @signals.task_postrun.connect(weak=False)
+    def end_task_span(task_id: str, **kwargs) -> None:
+        task_span, token = active.pop(task_id, (None, None))
+        if task_span is not None:
+            context.detach(token)
+            task_span.set_attribute("celery.state", kwargs.get("state") or "")
+            task_span.end()
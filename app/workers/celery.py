@@ -1,6 +1,7 @@
 from celery import Celery
 
 from app.core.settings import settings
+from app.core.tracing import instrument_celery
 from app.core.logging import logger
 
 celery = Celery(
@@ -29,6 +30,8 @@ celery.conf.update(
     worker_hijack_root_logger=False,
 )
 
+instrument_celery(celery)
+
 if settings.TESTING:
     celery.conf.update(
         task_always_eager=True,
@@ -1,6 +1,9 @@
 from celery import shared_task
 
+from app.api.storage.redis import CacheNamespace
+from app.core.dependencies.common import get_cache, get_database
 from app.core.dependencies.repositories import get_user_repository
+from app.core.settings import settings
 from app.core.logging import logger
 
 
@@ -24,9 +27,20 @@ async def delete_account_permanently(user_id: int) -> None:
         Exception: Если произошла ошибка при удалении аккаунта.
     """
     try:
-        user_repo = await get_user_repository()
+        user_repo = await get_user_repository(await get_database())
         await user_repo.hard_delete_user(user_id)
+
+        if await user_repo.get_user_public_data_by_id(user_id, columns=("id",)):
+            logger.info(f"Аккаунт {user_id} был восстановлен, окончательное удаление пропущено.")
+            return
+
+        cache = await get_cache()
+        await cache.set_tombstone(
+            str(user_id), expire=settings.USER_TOMBSTONE_TTL, namespace=CacheNamespace.USER
+        )
+        # Имя и email остаются в фильтрах доступности до их перестроения (AvailabilityFilter):
+        # до этого проверка доступности подтверждает их по базе данных.
         logger.success(f"Аккаунт {user_id} окончательно удалён.")
     except Exception as e:
         logger.error(f"Ошибка удаления аккаунта {user_id}: {e}")
-        raise
\ No newline at end of file
+        raise
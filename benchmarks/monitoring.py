@@ -0,0 +1,109 @@
+"""
+Сравнение накладных расходов HTTP-метрик: прежний стек и MonitoringMiddleware.
+
+Прежний стек воспроизводит конфигурацию до перехода на pure-ASGI middleware:
+prometheus-fastapi-instrumentator и middleware, которое создаёт Request и
+размечает метрики сырым путём запроса. Его метрики пишутся в отдельный
+CollectorRegistry, чтобы не конфликтовать с метриками приложения. Для
+базовой линии пакет должен быть установлен отдельно
+(`pip install prometheus-fastapi-instrumentator`); иначе вариант пропускается.
+
+Запуск:
+    python -m benchmarks.monitoring --iterations 5000
+"""
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import CollectorRegistry, Gauge, Histogram
+
+from app.core.monitoring import MonitoringMiddleware
+
+
+def build_plain_app() -> FastAPI:
+    """Приложение без метрик с маршрутом, содержащим параметр пути."""
+    app = FastAPI()
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: int):
+        return {"id": user_id}
+
+    return app
+
+
+def build_current_app() -> FastAPI:
+    """Приложение с MonitoringMiddleware."""
+    app = build_plain_app()
+    app.add_middleware(MonitoringMiddleware)
+    return app
+
+
+def build_legacy_app() -> Optional[FastAPI]:
+    """Приложение с прежним стеком метрик или None, если instrumentator не установлен."""
+    try:
+        from prometheus_fastapi_instrumentator import Instrumentator
+    except ImportError:
+        return None
+
+    registry = CollectorRegistry()
+    active = Gauge("legacy_in_progress", "", ["method", "endpoint"], registry=registry)
+    duration = Histogram("legacy_duration_seconds", "", ["method", "endpoint"], registry=registry)
+
+    class LegacyMiddleware:
+        def __init__(self, app):
+            self.app = app
+
+        async def __call__(self, scope, receive, send):
+            if scope["type"] != "http":
+                await self.app(scope, receive, send)
+                return
+
+            request = Request(scope, receive)
+            method, endpoint = request.method, request.url.path
+            active.labels(method=method, endpoint=endpoint).inc()
+            start = time.time()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                active.labels(method=method, endpoint=endpoint).dec()
+                duration.labels(method=method, endpoint=endpoint).observe(time.time() - start)
+
+    app = build_plain_app()
+    app.add_middleware(LegacyMiddleware)
+    Instrumentator(should_instrument_requests_inprogress=True, registry=registry).instrument(app)
+    return app
+
+
+async def measure(app: FastAPI, iterations: int) -> float:
+    """Возвращает среднюю задержку запроса в микросекундах."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://benchmark") as client:
+        for index in range(min(100, iterations)):
+            await client.get(f"/users/{index}")
+
+        start = time.perf_counter()
+        for index in range(iterations):
+            await client.get(f"/users/{index}")
+        return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main(iterations: int) -> None:
+    baseline = await measure(build_plain_app(), iterations)
+    print(f"{'без метрик':<24} {baseline:>10.1f} мкс/запрос")
+
+    variants = [("MonitoringMiddleware", build_current_app()), ("прежний стек", build_legacy_app())]
+    for name, app in variants:
+        if app is None:
+            print(f"{name:<24} пропущено: пакет не установлен")
+            continue
+        latency = await measure(app, iterations)
+        print(f"{name:<24} {latency:>10.1f} мкс/запрос (накладные расходы {latency - baseline:.1f} мкс)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="Количество запросов на вариант")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
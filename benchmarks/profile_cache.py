@@ -0,0 +1,82 @@
+"""
+Сравнение форматов хранения профиля в Redis: JSON-блоб и хэш.
+
+Измеряются частичное чтение одного поля и частичная запись одного поля.
+Требуется доступный Redis из настроек приложения (REDIS_HOST, REDIS_PORT, REDIS_DB).
+
+Запуск:
+    python -m benchmarks.profile_cache --iterations 10000 --extra-fields 20
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable
+
+import redis.asyncio as redis
+
+from app.core.settings import settings
+
+BLOB_KEY = "benchmark:profile:blob"
+HASH_KEY = "benchmark:profile:hash"
+
+
+def build_profile(extra_fields: int) -> dict:
+    """Формирует профиль пользователя с дополнительными полями для имитации больших профилей."""
+    profile = {"id": 1, "username": "benchmark_user", "email": "benchmark@example.com", "version": 1}
+    profile.update({f"field_{index}": "x" * 32 for index in range(extra_fields)})
+    return profile
+
+
+async def measure(name: str, iterations: int, operation: Callable[[int], Awaitable[None]]) -> None:
+    """Выполняет операцию заданное число раз и выводит среднюю задержку и пропускную способность."""
+    start = time.perf_counter()
+    for iteration in range(iterations):
+        await operation(iteration)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {elapsed / iterations * 1e6:>10.1f} мкс/оп {iterations / elapsed:>12.0f} оп/с")
+
+
+async def main(iterations: int, extra_fields: int) -> None:
+    client = redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        password=settings.REDIS_PASSWORD,
+        decode_responses=True,
+    )
+    profile = build_profile(extra_fields)
+    await client.set(BLOB_KEY, json.dumps(profile))
+    await client.hset(HASH_KEY, mapping={field: json.dumps(value) for field, value in profile.items()})
+
+    async def blob_read(_: int) -> None:
+        json.loads(await client.get(BLOB_KEY))["username"]
+
+    async def hash_read(_: int) -> None:
+        json.loads((await client.hmget(HASH_KEY, ["username"]))[0])
+
+    async def blob_write(iteration: int) -> None:
+        cached = json.loads(await client.get(BLOB_KEY))
+        cached["username"] = f"user_{iteration}"
+        await client.set(BLOB_KEY, json.dumps(cached))
+
+    async def hash_write(iteration: int) -> None:
+        await client.hset(HASH_KEY, "username", json.dumps(f"user_{iteration}"))
+
+    print(f"Профиль: {len(profile)} полей, {len(json.dumps(profile))} байт JSON")
+    try:
+        await measure("blob: чтение поля", iterations, blob_read)
+        await measure("hash: чтение поля (HMGET)", iterations, hash_read)
+        await measure("blob: запись поля", iterations, blob_write)
+        await measure("hash: запись поля (HSET)", iterations, hash_write)
+    finally:
+        await client.delete(BLOB_KEY, HASH_KEY)
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=10000, help="Количество операций каждого типа")
+    parser.add_argument("--extra-fields", type=int, default=0, help="Дополнительные поля профиля")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.extra_fields))
@@ -0,0 +1,106 @@
+"""
+Сравнение накладных расходов ограничения частоты запросов: slowapi и встроенный RateLimiter.
+
+Для каждого варианта собирается минимальное приложение с одним маршрутом, и
+измеряется средняя задержка запроса через ASGI-транспорт. Из результата
+вычитается задержка приложения без ограничителя. Требуется доступный Redis из
+настроек приложения. Для базовой линии slowapi должен быть установлен
+отдельно (`pip install slowapi`); иначе вариант пропускается.
+
+Запуск:
+    python -m benchmarks.rate_limiter --iterations 5000
+"""
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.api.security.rate_limiter import RateLimiter, RateLimitMiddleware
+from app.api.storage.redis import RedisManager
+from app.core.settings import settings
+
+LIMIT = "1000000/minute"
+
+
+def build_plain_app() -> FastAPI:
+    """Приложение без ограничителя."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    return app
+
+
+def build_native_app(cache: RedisManager) -> FastAPI:
+    """Приложение со встроенным RateLimiter."""
+    app = build_plain_app()
+    app.add_middleware(RateLimitMiddleware, limiter=RateLimiter(cache, {("GET", "/ping"): LIMIT}))
+    return app
+
+
+def build_slowapi_app() -> Optional[FastAPI]:
+    """Приложение со slowapi (декоратор и SlowAPIMiddleware) или None, если slowapi не установлен."""
+    try:
+        from slowapi import Limiter
+        from slowapi.middleware import SlowAPIMiddleware
+        from slowapi.util import get_remote_address
+    except ImportError:
+        return None
+
+    password = f":{settings.REDIS_PASSWORD}@" if settings.REDIS_PASSWORD else ""
+    limiter = Limiter(
+        key_func=get_remote_address,
+        storage_uri=f"redis://{password}{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}",
+    )
+    app = FastAPI()
+    app.state.limiter = limiter
+
+    @app.get("/ping")
+    @limiter.limit(LIMIT)
+    async def ping(request: Request):
+        return {"status": "ok"}
+
+    app.add_middleware(SlowAPIMiddleware)
+    return app
+
+
+async def measure(app: FastAPI, iterations: int) -> float:
+    """Возвращает среднюю задержку запроса в микросекундах."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://benchmark") as client:
+        for _ in range(min(100, iterations)):
+            await client.get("/ping")
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await client.get("/ping")
+        return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main(iterations: int) -> None:
+    cache = RedisManager()
+    await cache.connect()
+    try:
+        baseline = await measure(build_plain_app(), iterations)
+        print(f"{'без ограничителя':<20} {baseline:>10.1f} мкс/запрос")
+
+        variants = [("RateLimiter", build_native_app(cache)), ("slowapi", build_slowapi_app())]
+        for name, app in variants:
+            if app is None:
+                print(f"{name:<20} пропущено: пакет не установлен")
+                continue
+            latency = await measure(app, iterations)
+            print(f"{name:<20} {latency:>10.1f} мкс/запрос (накладные расходы {latency - baseline:.1f} мкс)")
+    finally:
+        await cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="Количество запросов на вариант")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,95 @@
+"""
+Пропускная способность GET /api/v1/users/current при чтении профиля из кэша.
+
+Сравниваются прежний путь ответа (профиль декодируется из полей хэша в dict,
+FastAPI сериализует его стандартным JSONResponse) и текущий (ORJSONResponse по
+умолчанию, профиль из кэша отдаётся готовыми байтами). Аутентификация заменена
+зависимостью-заглушкой, чтобы измерялся только путь ответа. Требуется доступный
+Redis из настроек приложения (REDIS_HOST, REDIS_PORT, REDIS_DB).
+
+Запуск:
+    python -m benchmarks.responses --iterations 5000 --extra-fields 20
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.api.common.authentication import get_current_user
+from app.api.storage.redis import CacheNamespace, RedisManager
+from app.api.v1.endpoints import router
+from app.api.v1.services import UserService
+from app.core.dependencies.services import get_user_service
+
+USER_ID = 999_999_999
+
+
+def build_legacy_app(cache: RedisManager) -> FastAPI:
+    """Приложение с прежним путём ответа: json.loads полей и JSONResponse."""
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get("/api/v1/users/current", response_model=dict)
+    async def get_user_endpoint(user: dict = Depends(get_current_user)):
+        cached_user = await cache.get_hash(str(user["id"]), namespace=CacheNamespace.USER)
+        return {field: json.loads(value) for field, value in cached_user.items()}
+
+    app.dependency_overrides[get_current_user] = lambda: {"id": USER_ID}
+    return app
+
+
+def build_current_app(cache: RedisManager) -> FastAPI:
+    """Приложение с маршрутами сервиса и ORJSONResponse по умолчанию."""
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: {"id": USER_ID}
+    app.dependency_overrides[get_user_service] = lambda: UserService(None, cache)
+    return app
+
+
+async def measure(app: FastAPI, iterations: int) -> float:
+    """Возвращает количество запросов в секунду."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://benchmark") as client:
+        for _ in range(min(100, iterations)):
+            response = await client.get("/api/v1/users/current")
+            response.raise_for_status()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await client.get("/api/v1/users/current")
+        return iterations / (time.perf_counter() - start)
+
+
+async def main(iterations: int, extra_fields: int) -> None:
+    cache = RedisManager()
+    await cache.connect()
+
+    profile = {"id": USER_ID, "username": "benchmark_user", "email": "benchmark@example.com", "version": 1}
+    profile.update({f"field_{index}": "x" * 32 for index in range(extra_fields)})
+    await cache.hset_if_newer(
+        str(USER_ID),
+        UserService._encode_profile(profile),
+        version=profile["version"],
+        namespace=CacheNamespace.USER,
+    )
+
+    try:
+        legacy = await measure(build_legacy_app(cache), iterations)
+        current = await measure(build_current_app(cache), iterations)
+        print(f"Профиль: {len(profile)} полей, {len(json.dumps(profile))} байт JSON")
+        print(f"{'dict + JSONResponse':<28} {legacy:>10.0f} запросов/с")
+        print(f"{'байты из кэша + ORJSON':<28} {current:>10.0f} запросов/с ({current / legacy:.2f}x)")
+    finally:
+        await cache.delete(str(USER_ID), namespace=CacheNamespace.USER)
+        await cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="Количество запросов на вариант")
+    parser.add_argument("--extra-fields", type=int, default=0, help="Дополнительные поля профиля")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.extra_fields))
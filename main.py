@@ -1,14 +1,19 @@
 import uvicorn
 from fastapi import FastAPI
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
-from slowapi.middleware import SlowAPIMiddleware
 from app.api.security.exceptions import RateLimitExceededError
 
 from app.api.v1.endpoints import router
 from app.core.monitoring import setup_monitoring
-from app.core.dependencies.common import lifespan
-from app.api.security.rate_limiter import get_rate_limiter
+from app.core.compression import CompressionMiddleware
+from app.core.health import create_health_router
+from app.core.profiling import create_profiling_router
+from app.api.v1.export import create_export_router
+from app.core.tracing import TracingMiddleware
+from app.core.settings import settings
+from app.core.dependencies.common import lifespan, cache, health
+from app.api.security.rate_limiter import RateLimiter, RateLimitMiddleware
 from app.api.security.exceptions import rate_limit_exceeded_handler
 
 
@@ -20,18 +25,27 @@ def create_application() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
-    app.state.limiter = get_rate_limiter()
+    app.state.limiter = RateLimiter(cache)
 
     app.include_router(router, prefix="/api/v1", tags=["Users"])
 
-    setup_monitoring(app)
+    create_health_router(app, health)
+    create_profiling_router(app)
+    create_export_router(app)
 
-    app.add_middleware(SlowAPIMiddleware)
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(RateLimitMiddleware, limiter=app.state.limiter)
+    app.add_middleware(TracingMiddleware)
+    # Мониторинг снаружи ограничителя: ответы 429 учитываются в метриках запросов.
+    setup_monitoring(app)
     app.add_middleware(
-        GZipMiddleware,
-        minimum_size=1000,
+        CompressionMiddleware,
+        static_payloads={
+            app.openapi_url: lambda: (JSONResponse(app.openapi()).body, "application/json"),
+        },
     )
 
     app.exception_handler(RateLimitExceededError)(rate_limit_exceeded_handler)
@@ -48,5 +62,5 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         log_level="info",
-        reload=True,
+        reload=settings.ENVIRONMENT == "development",
     )
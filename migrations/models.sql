@@ -6,6 +6,8 @@ CREATE TABLE users (
     password VARCHAR(255) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    version INT UNSIGNED NOT NULL DEFAULT 1,
+    tier VARCHAR(32) NOT NULL DEFAULT 'standard',
     deleted_at TIMESTAMP NULL DEFAULT NULL,
     restoration_token VARCHAR(100) NULL DEFAULT NULL
 );
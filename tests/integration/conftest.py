@@ -3,8 +3,9 @@ import pytest_asyncio
 from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
 
+from app.api.storage.redis import CacheNamespace
 from app.api.v1.endpoints import router
-from app.core.dependencies.common import db, cache, lifespan
+from app.core.dependencies.common import db, cache, lifespan, availability, usernames
 from app.api.common.hashing import hash_value
 
 
@@ -44,9 +45,13 @@ async def setup_database():
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def setup_cache():
-    """Очищает кэш перед каждым тестом."""
+    """Очищает кэш, фильтры доступности и индекс автодополнения перед каждым тестом."""
     await cache.connect()
-    await cache.clear_cache()
+    await cache.clear_cache(CacheNamespace.ALL)
+    await cache.client.delete(
+        usernames.index.key,
+        *(key for bloom in availability.filters.values() for key in (bloom.key, bloom.rebuild_key)),
+    )
 
     yield
     await cache.close()
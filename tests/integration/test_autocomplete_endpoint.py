@@ -0,0 +1,100 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.api.v1.repositories import UserRepository
+from app.core.dependencies.common import db, usernames
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_from_index(client: AsyncClient, create_test_user):
+    """
+    Тест автодополнения по построенному индексу (без учёта регистра).
+    Должен вернуть 200 OK и пользователя, имя которого начинается с запроса.
+    """
+    await usernames.rebuild(UserRepository(db))
+
+    response = await client.get("/api/v1/users/autocomplete", params={"q": create_test_user["username"][:4].upper()})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json() == [
+        {"id": create_test_user["id"], "username": create_test_user["username"]}
+    ], "Неверный результат автодополнения"
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_without_index(client: AsyncClient, create_test_user):
+    """
+    Тест автодополнения, пока индекс не построен.
+    Должен вернуть 200 OK и результат поиска по базе данных.
+    """
+    response = await client.get("/api/v1/users/autocomplete", params={"q": create_test_user["username"][:4]})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert [user["id"] for user in response.json()] == [create_test_user["id"]]
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_after_register(client: AsyncClient, get_test_user_payload):
+    """
+    Тест обновления индекса при регистрации.
+    Зарегистрированный пользователь должен сразу находиться по индексу.
+    """
+    await usernames.rebuild(UserRepository(db))
+
+    response = await client.post("/api/v1/auth/register", json=get_test_user_payload)
+    assert response.status_code == status.HTTP_201_CREATED, f"Ошибка: {response.text}"
+
+    assert await usernames.search("test", 10) == [
+        {"id": response.json()["id"], "username": get_test_user_payload["username"]}
+    ], "Пользователь не добавлен в индекс"
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_after_rename(auth_client: AsyncClient, create_test_user):
+    """
+    Тест обновления индекса при смене имени.
+    Новое имя должно находиться, прежнее — нет.
+    """
+    await usernames.rebuild(UserRepository(db))
+
+    response = await auth_client.patch("/api/v1/users/current", json={"username": "renameduser"})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response = await auth_client.get("/api/v1/users/autocomplete", params={"q": "test"})
+    assert response.json() == [], f"Ошибка: {response.text}"
+
+    response = await auth_client.get("/api/v1/users/autocomplete", params={"q": "ren"})
+    assert response.json() == [
+        {"id": create_test_user["id"], "username": "renameduser"}
+    ], f"Ошибка: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_username_with_separator(client: AsyncClient):
+    """
+    Тест автодополнения для имени с разделителем элементов индекса.
+    Имя, записанное в базу данных в обход схемы, должно возвращаться без искажений.
+    """
+    username = "test\x00user"
+    user_id = await db.execute(
+        "INSERT INTO users (username, email, password) VALUES (%s, %s, %s)",
+        username, "separator@example.com", "hash",
+    )
+    await usernames.rebuild(UserRepository(db))
+
+    response = await client.get("/api/v1/users/autocomplete", params={"q": "test"})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json() == [{"id": user_id, "username": username}], "Неверный результат автодополнения"
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_empty_query(client: AsyncClient):
+    """
+    Тест автодополнения с пустым запросом.
+    Должен вернуть 422 Unprocessable Entity.
+    """
+    response = await client.get("/api/v1/users/autocomplete", params={"q": ""})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, f"Ошибка: {response.text}"
@@ -0,0 +1,173 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.api.v1.repositories import UserRepository
+from app.core.dependencies.common import db, cache, availability
+
+
+@pytest.fixture
+def value_lookups(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Записывает проверки занятости значений в базе данных."""
+    lookups = []
+    is_value_taken = UserRepository.is_value_taken
+
+    async def recording_is_value_taken(self, column, value, exclude_user_id=None):
+        lookups.append((column, value))
+        return await is_value_taken(self, column, value, exclude_user_id)
+
+    monkeypatch.setattr(UserRepository, "is_value_taken", recording_is_value_taken)
+    return lookups
+
+
+@pytest.mark.asyncio
+async def test_availability_free(client: AsyncClient):
+    """
+    Тест проверки свободных имени пользователя и email.
+    Должен вернуть 200 OK и available=True для обоих полей.
+    """
+    response = await client.get(
+        "/api/v1/auth/availability", params={"username": "freeuser", "email": "free@example.com"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json() == {
+        "username": {"value": "freeuser", "available": True},
+        "email": {"value": "free@example.com", "available": True},
+    }, "Неверный результат проверки"
+
+
+@pytest.mark.asyncio
+async def test_availability_taken(client: AsyncClient, create_test_user):
+    """
+    Тест проверки занятых имени пользователя и email (без учёта регистра).
+    Должен вернуть 200 OK и available=False для обоих полей.
+    """
+    response = await client.get(
+        "/api/v1/auth/availability",
+        params={"username": create_test_user["username"].upper(), "email": create_test_user["email"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    response_data = response.json()
+    assert response_data["username"]["available"] is False, "Имя пользователя должно быть занято"
+    assert response_data["email"]["available"] is False, "Email должен быть занят"
+
+
+@pytest.mark.asyncio
+async def test_availability_after_register(client: AsyncClient, get_test_user_payload):
+    """
+    Тест проверки имени пользователя после регистрации.
+    Должен вернуть available=False для только что зарегистрированного имени.
+    """
+    response = await client.post("/api/v1/auth/register", json=get_test_user_payload)
+    assert response.status_code == status.HTTP_201_CREATED, f"Ошибка: {response.text}"
+
+    response = await client.get(
+        "/api/v1/auth/availability", params={"username": get_test_user_payload["username"]}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json() == {
+        "username": {"value": get_test_user_payload["username"], "available": False},
+    }, "Неверный результат проверки"
+
+
+@pytest.mark.asyncio
+async def test_availability_no_params(client: AsyncClient):
+    """
+    Тест проверки доступности без параметров.
+    Должен вернуть 422 Unprocessable Entity.
+    """
+    response = await client.get("/api/v1/auth/availability")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, f"Ошибка: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_availability_definite_negative_skips_db(client: AsyncClient, create_test_user, value_lookups: list):
+    """
+    Тест проверки по построенному фильтру Блума.
+    Свободное значение должно считаться свободным без запроса к базе данных,
+    возможное совпадение — подтверждаться запросом.
+    """
+    await availability.rebuild(UserRepository(db))
+
+    response = await client.get("/api/v1/auth/availability", params={"username": "freeuser"})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json()["username"]["available"] is True
+    assert value_lookups == [], "Отрицательный ответ фильтра не должен проверяться в базе данных"
+
+    response = await client.get("/api/v1/auth/availability", params={"username": create_test_user["username"]})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json()["username"]["available"] is False
+    assert value_lookups == [("username", create_test_user["username"])]
+
+
+@pytest.mark.asyncio
+async def test_availability_filter_updated_on_register(client: AsyncClient, get_test_user_payload: dict):
+    """
+    Тест пополнения фильтра при регистрации.
+    Имя пользователя и email должны попасть в построенный фильтр.
+    """
+    await availability.rebuild(UserRepository(db))
+    assert await availability.might_be_taken("username", get_test_user_payload["username"]) is False
+
+    response = await client.post("/api/v1/auth/register", json=get_test_user_payload)
+
+    assert response.status_code == status.HTTP_201_CREATED, f"Ошибка: {response.text}"
+    assert await availability.might_be_taken("username", get_test_user_payload["username"]) is True
+    assert await availability.might_be_taken("email", get_test_user_payload["email"]) is True
+
+
+@pytest.mark.asyncio
+async def test_availability_filter_updated_on_update(auth_client: AsyncClient):
+    """
+    Тест пополнения фильтра при изменении профиля.
+    Новые имя пользователя и email должны попасть в построенный фильтр.
+    """
+    await availability.rebuild(UserRepository(db))
+    update_payload = {
+        "username": "updateduser",
+        "email": "updated@example.com",
+        "current_password": "securepassword123",
+    }
+
+    response = await auth_client.patch("/api/v1/users/current", json=update_payload)
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert await availability.might_be_taken("username", update_payload["username"]) is True
+    assert await availability.might_be_taken("email", update_payload["email"]) is True
+
+
+@pytest.mark.asyncio
+async def test_availability_filter_rebuild_swap(create_test_user):
+    """
+    Тест перестроения фильтра.
+    Перестроенный фильтр должен заменить рабочий, учесть пользователей из базы данных
+    и значения, добавленные во время перестроения, и забыть освобождённые значения.
+    """
+    await availability.rebuild(UserRepository(db))
+    await db.execute("DELETE FROM users WHERE id = %s", create_test_user["id"])
+    await db.execute(
+        "INSERT INTO users (username, email, password) VALUES (%s, %s, %s)",
+        "rebuilduser", "rebuild@example.com", "hash",
+    )
+    assert await availability.might_be_taken("username", "rebuilduser") is False
+
+    bloom = availability.filters["username"]
+    await bloom.begin_rebuild()
+    await availability.add(username="addedduringrebuild")
+    await bloom.add(["rebuilduser"], rebuilding=True)
+    assert await bloom.finish_rebuild() is True
+
+    assert await cache.client.exists(bloom.rebuild_key) == 0
+    assert await availability.might_be_taken("username", "rebuilduser") is True
+    assert await availability.might_be_taken("username", "addedduringrebuild") is True
+
+    assert await availability.rebuild(UserRepository(db)) == 1
+    assert await availability.might_be_taken("username", "rebuilduser") is True
+    assert await availability.might_be_taken("username", create_test_user["username"]) is False, \
+        "Освобождённое имя должно исчезнуть из фильтра после перестроения"
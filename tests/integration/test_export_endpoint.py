@@ -0,0 +1,128 @@
+import orjson
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+
+from app.api.v1.export import create_export_router, export_users
+from app.api.v1.repositories import UserRepository
+from app.core.dependencies.common import db
+from app.core.settings import settings
+
+OPERATOR_TOKEN = "test-operator-token"
+
+
+@pytest.fixture
+def app(app: FastAPI, monkeypatch) -> FastAPI:
+    """Подключает служебный эндпоинт выгрузки и задаёт токен оператора."""
+    monkeypatch.setattr(settings, "OPERATOR_TOKEN", OPERATOR_TOKEN)
+    create_export_router(app)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_export_users_ndjson(client: AsyncClient, create_test_user):
+    """
+    Тест выгрузки пользователей в NDJSON.
+    Должен вернуть 200 OK и по объекту на строку без пароля.
+    """
+    response = await client.get("/operator/export/users", headers={"X-Operator-Token": OPERATOR_TOKEN})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    users = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [user["id"] for user in users] == [create_test_user["id"]], "Неверный список пользователей"
+    assert users[0]["username"] == create_test_user["username"]
+    assert "password" not in users[0], "Выгрузка не должна содержать пароль"
+
+
+@pytest.mark.asyncio
+async def test_export_users_csv(client: AsyncClient, create_test_user):
+    """
+    Тест выгрузки пользователей в CSV.
+    Должен вернуть 200 OK, строку заголовков и строку пользователя.
+    """
+    response = await client.get(
+        "/operator/export/users", params={"format": "csv"}, headers={"X-Operator-Token": OPERATOR_TOKEN}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    header, row = response.text.splitlines()
+    assert header.startswith("id,username,email"), f"Неверный заголовок: {header}"
+    assert row.startswith(f"{create_test_user['id']},{create_test_user['username']},"), f"Неверная строка: {row}"
+
+
+@pytest_asyncio.fixture
+async def create_users() -> list:
+    """Создаёт пять пользователей и возвращает их ID по возрастанию."""
+    return [
+        await db.execute(
+            "INSERT INTO users (username, email, password) VALUES (%s, %s, %s)",
+            f"exportuser{index}", f"export{index}@example.com", "hash",
+        )
+        for index in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_users_across_pages(client: AsyncClient, create_users: list, monkeypatch):
+    """
+    Тест выгрузки, которая занимает несколько страниц.
+    Должен вернуть всех пользователей по одному разу в порядке ID.
+    """
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 2)
+
+    response = await client.get("/operator/export/users", headers={"X-Operator-Token": OPERATOR_TOKEN})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert [orjson.loads(line)["id"] for line in response.text.splitlines()] == create_users
+
+
+@pytest.mark.asyncio
+async def test_export_users_abandoned_stream(create_users: list):
+    """
+    Тест прерванной выгрузки.
+    Закрытие генератора после первой порции должно освободить соединение с базой данных.
+    """
+    stream = export_users(UserRepository(db), "ndjson", chunk_size=2)
+
+    first = await stream.__anext__()
+    assert len(first.splitlines()) == 2
+    assert db.pool.size - db.pool.freesize == 1, "Соединение должно быть занято выгрузкой"
+
+    await stream.aclose()
+
+    assert db.pool.size - db.pool.freesize == 0, "Соединение должно быть освобождено"
+    assert await db.fetch("SELECT COUNT(*) AS total FROM users") == [{"total": len(create_users)}]
+
+
+@pytest.mark.asyncio
+async def test_export_users_csv_formula_cells(client: AsyncClient):
+    """
+    Тест экранирования формул в CSV.
+    Значение, начинающееся с символа формулы, должно начинаться с апострофа.
+    """
+    await db.execute(
+        "INSERT INTO users (username, email, password) VALUES (%s, %s, %s)",
+        "=HYPERLINK(1)", "formula@example.com", "hash",
+    )
+
+    response = await client.get(
+        "/operator/export/users", params={"format": "csv"}, headers={"X-Operator-Token": OPERATOR_TOKEN}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    _, row = response.text.splitlines()
+    assert ",'=HYPERLINK(1),formula@example.com," in row, f"Неверная строка: {row}"
+
+
+@pytest.mark.asyncio
+async def test_export_users_forbidden(client: AsyncClient):
+    """
+    Тест выгрузки пользователей без токена оператора.
+    Должен вернуть 403 Forbidden.
+    """
+    response = await client.get("/operator/export/users")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN, f"Ошибка: {response.text}"
@@ -19,6 +19,83 @@ async def test_get_current_user_success(auth_client: AsyncClient, create_test_us
     assert response_data["email"] == create_test_user["email"]
 
 
+@pytest.mark.asyncio
+async def test_get_current_user_cached(auth_client: AsyncClient, create_test_user):
+    """
+    Тест повторного получения данных текущего пользователя из кэша.
+    Должен вернуть тот же JSON, что и при чтении из базы данных.
+    """
+    first = await auth_client.get("/api/v1/users/current")
+    second = await auth_client.get("/api/v1/users/current")
+
+    assert second.status_code == status.HTTP_200_OK, f"Ошибка: {second.text}"
+    assert second.headers["content-type"] == "application/json", "Неверный Content-Type"
+    assert second.json() == first.json(), "Ответ из кэша отличается от ответа из базы данных"
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_not_modified(auth_client: AsyncClient):
+    """
+    Тест условного запроса с актуальным ETag.
+    Должен вернуть 304 Not Modified без тела ответа.
+    """
+    response = await auth_client.get("/api/v1/users/current")
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    etag = response.headers["etag"]
+
+    response = await auth_client.get("/api/v1/users/current", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, f"Ошибка: {response.text}"
+    assert response.headers["etag"] == etag, "ETag изменился"
+    assert not response.content, "Ответ 304 не должен содержать тело"
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_etag_changes_after_update(auth_client: AsyncClient):
+    """
+    Тест условного запроса после изменения профиля.
+    Устаревший ETag должен привести к ответу 200 OK с новым ETag.
+    """
+    response = await auth_client.get("/api/v1/users/current")
+    etag = response.headers["etag"]
+
+    response = await auth_client.patch("/api/v1/users/current", json={"username": "etaguser"})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response = await auth_client.get("/api/v1/users/current", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.headers["etag"] != etag, "ETag не изменился после обновления"
+    assert response.json()["username"] == "etaguser", "Профиль не обновился"
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_sparse_fields(auth_client: AsyncClient, create_test_user):
+    """
+    Тест получения выборочного набора полей текущего пользователя.
+    Должен вернуть только запрошенные поля и id.
+    """
+    for _ in range(2):
+        response = await auth_client.get("/api/v1/users/current", params={"fields": "username"})
+
+        assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+        assert response.json() == {
+            "id": create_test_user["id"],
+            "username": create_test_user["username"],
+        }, "Ответ содержит лишние поля"
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_invalid_fields(auth_client: AsyncClient):
+    """
+    Тест запроса поля вне белого списка.
+    Должен вернуть 422 Unprocessable Entity.
+    """
+    response = await auth_client.get("/api/v1/users/current", params={"fields": "password"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, f"Ошибка: {response.text}"
+
+
 @pytest.mark.asyncio
 async def test_get_current_user_unauthorized(client: AsyncClient):
     """
@@ -0,0 +1,66 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.api.storage.redis import CacheNamespace
+from app.core.dependencies.common import cache
+from app.core.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_get_users_success(client: AsyncClient, create_test_user):
+    """
+    Тест пакетного получения публичных профилей.
+    Должен вернуть 200 OK, профили в порядке запроса без отсутствующих ID и без email.
+    """
+    user_id = create_test_user["id"]
+
+    for _ in range(2):
+        response = await client.get("/api/v1/users", params={"ids": f"{user_id + 1000},{user_id},{user_id}"})
+
+        assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+        assert response.json() == [
+            {"id": user_id, "username": create_test_user["username"]}
+        ], "Неверный список профилей"
+
+
+@pytest.mark.asyncio
+async def test_get_users_does_not_cache_missing_ids(client: AsyncClient, create_test_user):
+    """
+    Тест пакетного получения отсутствующих ID.
+    Должен пропустить их в ответе, не записывая маркеры отсутствия в кэш.
+    """
+    missing_ids = [create_test_user["id"] + offset for offset in (1, 2)]
+
+    response = await client.post("/api/v1/users/batch", json={"ids": missing_ids})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json() == []
+    for user_id in missing_ids:
+        assert await cache.get_hash(str(user_id), namespace=CacheNamespace.USER) == {}, \
+            "Маркер отсутствия не должен записываться пакетным запросом"
+
+
+@pytest.mark.asyncio
+async def test_get_users_batch_post(client: AsyncClient, create_test_user):
+    """
+    Тест пакетного получения публичных профилей через POST.
+    Должен вернуть 200 OK и профили в порядке запроса.
+    """
+    response = await client.post("/api/v1/users/batch", json={"ids": [create_test_user["id"]]})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert [user["id"] for user in response.json()] == [create_test_user["id"]]
+
+
+@pytest.mark.asyncio
+async def test_get_users_too_many_ids(client: AsyncClient):
+    """
+    Тест пакетного получения с превышением лимита ID.
+    Должен вернуть 422 Unprocessable Entity.
+    """
+    ids = ",".join(str(user_id) for user_id in range(1, settings.USER_BATCH_MAX_IDS + 2))
+
+    response = await client.get("/api/v1/users", params={"ids": ids})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, f"Ошибка: {response.text}"
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+
+from app.core.dependencies.common import db, cache
+from app.core.health import HealthChecker, create_health_router
+
+
+@pytest.fixture
+def checker() -> HealthChecker:
+    """Создаёт проверку зависимостей без фонового цикла."""
+    return HealthChecker(db, cache)
+
+
+@pytest.fixture
+def app(checker: HealthChecker) -> FastAPI:
+    """Создаёт экземпляр FastAPI с эндпоинтами проб."""
+    app = FastAPI()
+    create_health_router(app, checker)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_liveness(client: AsyncClient):
+    """
+    Тест liveness-пробы.
+    Должен вернуть 200 OK без обращения к зависимостям.
+    """
+    response = await client.get("/health/live")
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json()["status"] == "alive"
+
+
+@pytest.mark.asyncio
+async def test_health_legacy_response(client: AsyncClient):
+    """
+    Тест прежнего эндпоинта /health.
+    Должен вернуть 200 OK и статус healthy, как до появления проб.
+    """
+    response = await client.get("/health")
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json()["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_redis_check_without_pool_counter():
+    """
+    Тест проверки Redis с пулом без счётчика занятых соединений.
+    Проверка должна пройти, а насыщенность пула — быть неизвестной.
+    """
+    async def ping() -> bool:
+        return True
+
+    client = SimpleNamespace(ping=ping, connection_pool=SimpleNamespace(max_connections=10))
+    checker = HealthChecker(db, SimpleNamespace(client=client, breaker=SimpleNamespace(state="closed")))
+
+    result = await checker._check(checker._check_redis)
+
+    assert result["status"] == "ok", f"Ошибка: {result}"
+    assert result["pool_saturation"] is None
+
+
+@pytest.mark.asyncio
+async def test_readiness_before_first_check(client: AsyncClient):
+    """
+    Тест readiness-пробы до первой фоновой проверки.
+    Должен вернуть 503 Service Unavailable.
+    """
+    response = await client.get("/health/ready")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE, f"Ошибка: {response.text}"
+    assert response.json()["status"] == "not_ready"
+
+
+@pytest.mark.asyncio
+async def test_readiness_after_check(client: AsyncClient, checker: HealthChecker):
+    """
+    Тест readiness-пробы после проверки зависимостей.
+    Должен вернуть 200 OK с результатами проверок базы данных и Redis.
+    """
+    await checker.run_checks()
+
+    response = await client.get("/health/ready")
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    checks = response.json()["checks"]
+    assert checks["database"]["status"] == "ok", f"Ошибка проверки базы данных: {checks['database']}"
+    assert checks["redis"]["status"] == "ok", f"Ошибка проверки Redis: {checks['redis']}"
+    assert "pool_saturation" in checks["database"], "Нет насыщенности пула"
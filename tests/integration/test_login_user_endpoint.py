@@ -1,8 +1,10 @@
+import jwt
 import pytest
 from httpx import AsyncClient
 from fastapi import status
 
 from app.api.v1.exceptions import InvalidCredentialsException
+from app.core.settings import settings
 
 
 @pytest.mark.asyncio
@@ -30,6 +32,26 @@ async def test_login_user_success(client: AsyncClient, create_test_user, get_tes
     assert refresh_token_cookie, "refresh_token должен быть установлен в cookies"
 
 
+@pytest.mark.asyncio
+async def test_login_user_token_tier(client: AsyncClient, create_test_user, get_test_user_payload):
+    """
+    Тест тарифа в access-токене.
+    Токен должен содержать субъект и тариф пользователя для ограничителя запросов.
+    """
+    payload = {
+        "email": get_test_user_payload["email"],
+        "password": get_test_user_payload["password"],
+    }
+
+    response = await client.post("/api/v1/auth/login", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    claims = jwt.decode(response.json()["access_token"], settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    assert claims["sub"] == str(create_test_user["id"])
+    assert claims["tier"] == settings.RATE_LIMIT_DEFAULT_TIER
+
+
 @pytest.mark.asyncio
 async def test_login_user_wrong_password(client: AsyncClient, create_test_user):
     """
@@ -0,0 +1,104 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+
+from app.core.profiling import create_profiling_router
+from app.core.settings import settings
+
+OPERATOR_TOKEN = "test-operator-token"
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    """Создаёт экземпляр FastAPI с эндпоинтом профилирования."""
+    app = FastAPI()
+    create_profiling_router(app)
+    return app
+
+
+@pytest.fixture
+def operator_token(monkeypatch):
+    """Включает служебные эндпоинты с известным токеном оператора."""
+    monkeypatch.setattr(settings, "OPERATOR_TOKEN", OPERATOR_TOKEN)
+    return OPERATOR_TOKEN
+
+
+@pytest.mark.asyncio
+async def test_profile_disabled(client: AsyncClient, monkeypatch):
+    """
+    Тест профилирования без настроенного токена оператора.
+    Должен вернуть 404 Not Found.
+    """
+    monkeypatch.setattr(settings, "OPERATOR_TOKEN", None)
+
+    response = await client.get("/operator/profile", params={"seconds": 0.1})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND, f"Ошибка: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_profile_invalid_token(client: AsyncClient, operator_token):
+    """
+    Тест профилирования с неверным токеном оператора.
+    Должен вернуть 403 Forbidden.
+    """
+    response = await client.get(
+        "/operator/profile",
+        params={"seconds": 0.1},
+        headers={"X-Operator-Token": "wrong-token"},
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN, f"Ошибка: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_profile_success(client: AsyncClient, operator_token):
+    """
+    Тест успешного профилирования.
+    Должен вернуть 200 OK и файл в формате collapsed stacks.
+    """
+    response = await client.get(
+        "/operator/profile",
+        params={"seconds": 0.2},
+        headers={"X-Operator-Token": operator_token},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert "attachment" in response.headers["content-disposition"], "Ответ не является файлом"
+
+    lines = response.text.splitlines()
+    assert lines, "Пустой профиль"
+    stack, _, count = lines[0].rpartition(" ")
+    assert ";" in stack and count.isdigit(), f"Некорректный формат строки: {lines[0]}"
+
+
+@pytest.mark.asyncio
+async def test_memory_snapshot_diff(client: AsyncClient, operator_token):
+    """
+    Тест снимков памяти tracemalloc.
+    Должен вернуть топ мест выделения для снимков и разницу между ними.
+    """
+    headers = {"X-Operator-Token": operator_token}
+
+    response = await client.post("/operator/memory/start", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка запуска: {response.text}"
+
+    try:
+        first = await client.post("/operator/memory/snapshot", headers=headers)
+        assert first.status_code == status.HTTP_200_OK, f"Ошибка снимка: {first.text}"
+
+        allocations = [bytearray(1024) for _ in range(1000)]
+
+        second = await client.post("/operator/memory/snapshot", headers=headers)
+        assert second.status_code == status.HTTP_200_OK, f"Ошибка снимка: {second.text}"
+
+        response = await client.get(
+            "/operator/memory/diff",
+            params={"from": first.json()["snapshot_id"], "to": second.json()["snapshot_id"]},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+        assert response.json()["size_diff_bytes"] >= len(allocations) * 1024, "Рост памяти не обнаружен"
+    finally:
+        response = await client.post("/operator/memory/stop", headers=headers)
+        assert response.status_code == status.HTTP_200_OK, f"Ошибка остановки: {response.text}"
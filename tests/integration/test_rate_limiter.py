@@ -0,0 +1,252 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+from prometheus_client import REGISTRY
+
+from app.api.security.rate_limiter import RateLimiter, RateLimitMiddleware
+from app.core.dependencies.common import cache
+from app.core.monitoring import setup_monitoring
+
+LIMITS = {
+    ("GET", "/api/v1/limited"): "2/minute",
+    ("POST", "/api/v1/limited"): "1/hour",
+    ("GET", "/api/v1/items/{item_id}"): "1/minute",
+}
+
+
+@pytest.fixture
+def limiter() -> RateLimiter:
+    """Создаёт ограничитель с тестовыми лимитами в режиме redis."""
+    return RateLimiter(cache, limits=LIMITS, user_keyed=frozenset(), mode=RateLimiter.REDIS)
+
+
+@pytest.fixture
+def app(limiter: RateLimiter) -> FastAPI:
+    """Создаёт экземпляр FastAPI с RateLimitMiddleware и мониторингом снаружи него, как в main.py."""
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    setup_monitoring(app)
+
+    @app.get("/api/v1/limited")
+    async def read_limited() -> dict:
+        return {"status": "ok"}
+
+    @app.post("/api/v1/limited")
+    async def write_limited() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/api/v1/items/{item_id}")
+    async def read_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    @app.get("/api/v1/unlimited")
+    async def read_unlimited() -> dict:
+        return {"status": "ok"}
+
+    return app
+
+
+def request_count(endpoint: str, status_code: int, method: str = "GET") -> float:
+    """Возвращает значение http_requests_total для набора меток."""
+    labels = {"method": method, "endpoint": endpoint, "status_code": str(status_code)}
+    return REGISTRY.get_sample_value("http_requests_total", labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_exceeded(client: AsyncClient):
+    """
+    Тест превышения лимита.
+    Запросы в пределах лимита проходят, следующий получает 429 Too Many Requests.
+    """
+    for _ in range(2):
+        response = await client.get("/api/v1/limited")
+        assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response = await client.get("/api/v1/limited")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS, f"Ошибка: {response.text}"
+    assert response.json()["detail"] == "Too many requests"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_retry_after(client: AsyncClient):
+    """
+    Тест заголовка Retry-After.
+    Должен вернуть время до следующей разрешённой попытки в секундах, не больше периода лимита.
+    """
+    await client.get("/api/v1/limited")
+    await client.get("/api/v1/limited")
+
+    response = await client.get("/api/v1/limited")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS, f"Ошибка: {response.text}"
+    # При лимите 2/minute интервал эмиссии — 30 секунд.
+    assert 1 <= int(response.headers["Retry-After"]) <= 30
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_per_route(client: AsyncClient):
+    """
+    Тест раздельных лимитов маршрутов.
+    Лимиты считаются отдельно для каждой пары метод и путь; маршрут без лимита не ограничивается.
+    """
+    response = await client.post("/api/v1/limited")
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response = await client.post("/api/v1/limited")
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS, f"Ошибка: {response.text}"
+    # При лимите 1/hour следующая попытка — не раньше чем через час.
+    assert int(response.headers["Retry-After"]) > 3500
+
+    response = await client.get("/api/v1/limited")
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    for _ in range(5):
+        response = await client.get("/api/v1/unlimited")
+        assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_path_template(client: AsyncClient):
+    """
+    Тест лимита маршрута с параметром пути.
+    Лимит общий для всех значений параметра.
+    """
+    response = await client.get("/api/v1/items/1")
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response = await client.get("/api/v1/items/2")
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS, f"Ошибка: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_fail_open(client: AsyncClient):
+    """
+    Тест работы при недоступном Redis.
+    Ограничитель в режиме redis пропускает запросы без ограничений.
+    """
+    for _ in range(cache.breaker.failure_threshold):
+        cache.breaker.record_failure()
+    try:
+        for _ in range(5):
+            response = await client.get("/api/v1/limited")
+            assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    finally:
+        cache.breaker.record_success()
+
+
+@pytest.fixture
+def hybrid_limits() -> dict:
+    """Возвращает лимиты для тестов режима hybrid."""
+    return {("GET", "/api/v1/limited"): "3/hour"}
+
+
+def create_hybrid_limiter(limits: dict) -> RateLimiter:
+    """Создаёт ограничитель в режиме hybrid (отдельный экземпляр — отдельный воркер)."""
+    return RateLimiter(cache, limits=limits, user_keyed=frozenset(), mode=RateLimiter.HYBRID)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_local_decisions(hybrid_limits: dict):
+    """
+    Тест режима hybrid без синхронизации.
+    Решения принимаются по локальному счётчику, запросы в Redis не отправляются.
+    """
+    limiter = create_hybrid_limiter(hybrid_limits)
+    policy = limiter.match("GET", "/api/v1/limited")
+    rate_limit = policy.tiers["anonymous"]
+
+    for _ in range(3):
+        assert await limiter.hit(rate_limit, "ip:127.0.0.1") == 0
+
+    assert 1 <= await limiter.hit(rate_limit, "ip:127.0.0.1") <= 3600
+    assert await cache.client.keys("rate_limit:*") == []
+
+
+@pytest.mark.asyncio
+async def test_hybrid_sync_shares_totals(hybrid_limits: dict):
+    """
+    Тест синхронизации воркеров в режиме hybrid.
+    Запросы одного воркера после синхронизации учитываются в лимите другого.
+    """
+    first, second = create_hybrid_limiter(hybrid_limits), create_hybrid_limiter(hybrid_limits)
+    rate_limit = first.match("GET", "/api/v1/limited").tiers["anonymous"]
+
+    assert await first.hit(rate_limit, "ip:127.0.0.1") == 0
+    assert await first.hit(rate_limit, "ip:127.0.0.1") == 0
+    await first.sync()
+
+    assert await second.hit(rate_limit, "ip:127.0.0.1") == 0
+    await second.sync()
+
+    assert await second.hit(rate_limit, "ip:127.0.0.1") > 0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_sync_skips_idle_windows(hybrid_limits: dict, monkeypatch: pytest.MonkeyPatch):
+    """
+    Тест синхронизации простаивающих окон.
+    Окна без новых запросов не отправляются в Redis.
+    """
+    limiter = create_hybrid_limiter(hybrid_limits)
+    rate_limit = limiter.match("GET", "/api/v1/limited").tiers["anonymous"]
+    batches = []
+    increment_batch = cache.increment_batch
+
+    async def record_batch(counters: dict):
+        batches.append(dict(counters))
+        return await increment_batch(counters)
+
+    monkeypatch.setattr(cache, "increment_batch", record_batch)
+
+    await limiter.hit(rate_limit, "ip:127.0.0.1")
+    await limiter.hit(rate_limit, "ip:127.0.0.2")
+    await limiter.sync()
+    await limiter.sync()
+    await limiter.hit(rate_limit, "ip:127.0.0.2")
+    await limiter.sync()
+
+    assert len(batches) == 2, f"Ошибка: {batches}"
+    assert len(batches[0]) == 2
+    assert [key.split(":")[-2] for key in batches[1]] == ["127.0.0.2"]
+    assert all(amount == 1 for amount, _ in batches[1].values())
+
+
+@pytest.mark.asyncio
+async def test_hybrid_sync_keeps_pending_while_redis_unavailable(hybrid_limits: dict):
+    """
+    Тест синхронизации при недоступном Redis.
+    Накопленные запросы сохраняются и отправляются после восстановления.
+    """
+    limiter = create_hybrid_limiter(hybrid_limits)
+    rate_limit = limiter.match("GET", "/api/v1/limited").tiers["anonymous"]
+    await limiter.hit(rate_limit, "ip:127.0.0.1")
+
+    for _ in range(cache.breaker.failure_threshold):
+        cache.breaker.record_failure()
+    try:
+        await limiter.sync()
+        assert await limiter.hit(rate_limit, "ip:127.0.0.1") == 0
+    finally:
+        cache.breaker.record_success()
+
+    await limiter.sync()
+
+    keys = await cache.client.keys("rate_limit:*")
+    assert len(keys) == 1
+    assert await cache.client.get(keys[0]) == "2"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_rejection_counted(client: AsyncClient):
+    """
+    Тест учёта отклонённых запросов в метриках.
+    Ответ 429 должен учитываться в http_requests_total под шаблоном маршрута.
+    """
+    rejected = request_count("/api/v1/items/{item_id}", 429)
+
+    await client.get("/api/v1/items/1")
+    response = await client.get("/api/v1/items/1")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS, f"Ошибка: {response.text}"
+    assert request_count("/api/v1/items/{item_id}", 429) == rejected + 1
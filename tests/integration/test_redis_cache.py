@@ -0,0 +1,169 @@
+import pytest
+
+from app.api.storage.redis import RedisManager, CacheNamespace
+from app.api.v1.services import UserService
+from app.core.dependencies.common import cache
+
+
+@pytest.mark.asyncio
+async def test_clear_cache_invalidates_namespace():
+    """
+    Тест инвалидации пространства имён через clear_cache.
+    Ключи пространства должны стать недоступны, ключи других пространств — сохраниться.
+    """
+    await cache.set("1", "profile", namespace=CacheNamespace.USER)
+    await cache.set("1", "3", namespace=CacheNamespace.BRUTE_FORCE_DELETE)
+
+    await cache.clear_cache([CacheNamespace.USER])
+
+    assert await cache.get("1", namespace=CacheNamespace.USER) is None, "Ключ должен быть инвалидирован"
+    assert await cache.get("1", namespace=CacheNamespace.BRUTE_FORCE_DELETE) == "3", \
+        "Ключ другого пространства имён не должен быть затронут"
+
+
+@pytest.mark.asyncio
+async def test_clear_cache_default_keeps_brute_force_counters():
+    """
+    Тест инвалидации кэша без явного списка пространств имён.
+    Профили должны стать недоступны, счётчики попыток ввода пароля — сохраниться.
+    """
+    await cache.set("1", "profile", namespace=CacheNamespace.USER)
+    await cache.set("1", "3", namespace=CacheNamespace.BRUTE_FORCE_UPDATE)
+    await cache.set("1", "3", namespace=CacheNamespace.BRUTE_FORCE_DELETE)
+
+    await cache.clear_cache()
+
+    assert await cache.get("1", namespace=CacheNamespace.USER) is None, "Ключ должен быть инвалидирован"
+    assert await cache.get("1", namespace=CacheNamespace.BRUTE_FORCE_UPDATE) == "3", \
+        "Счётчик попыток не должен сбрасываться"
+    assert await cache.get("1", namespace=CacheNamespace.BRUTE_FORCE_DELETE) == "3", \
+        "Счётчик попыток не должен сбрасываться"
+
+
+@pytest.mark.asyncio
+async def test_generation_cached_locally():
+    """
+    Тест локального кэширования поколения пространства имён.
+    Повторные операции не должны читать счётчик поколения из Redis.
+    """
+    await cache.get("1", namespace=CacheNamespace.USER)
+    await cache.client.set(cache._generation_key(CacheNamespace.USER), 1000)
+
+    assert await cache.get_generation(CacheNamespace.USER) != 1000, "Поколение должно браться из локального кэша"
+
+    cache._generations.clear()
+    assert await cache.get_generation(CacheNamespace.USER) == 1000, "После истечения TTL поколение читается из Redis"
+
+
+@pytest.mark.asyncio
+async def test_clear_cache_seen_by_other_worker():
+    """
+    Тест инвалидации, выполненной другим воркером.
+    После истечения CACHE_GENERATION_TTL ключ должен стать недоступен и в этом воркере.
+    """
+    other = RedisManager()
+    await other.connect()
+    try:
+        await cache.set("1", "profile", namespace=CacheNamespace.USER)
+        assert await other.get("1", namespace=CacheNamespace.USER) == "profile"
+
+        await cache.clear_cache([CacheNamespace.USER])
+        other._generations.clear()
+
+        assert await other.get("1", namespace=CacheNamespace.USER) is None, "Ключ должен быть инвалидирован"
+    finally:
+        await other.close()
+
+
+@pytest.mark.asyncio
+async def test_hset_if_newer_partial_consecutive_version():
+    """
+    Тест частичной записи профиля поверх предыдущей версии.
+    Должны обновиться только переданные поля и версия.
+    """
+    await cache.hset_if_newer("1", {"id": "1", "username": '"old"', "email": '"a@x.io"'}, version=1)
+
+    assert await cache.hset_if_newer("1", {"username": '"new"'}, version=2, partial=True), "Запись должна быть принята"
+    assert await cache.get_hash("1") == {"id": "1", "username": '"new"', "email": '"a@x.io"', "version": "2"}
+
+
+@pytest.mark.asyncio
+async def test_hset_if_newer_rejects_stale_version():
+    """
+    Тест записи профиля с устаревшей версией.
+    Запись должна быть отклонена, кэш — не измениться.
+    """
+    await cache.hset_if_newer("1", {"id": "1", "username": '"new"'}, version=3)
+
+    assert not await cache.hset_if_newer("1", {"id": "1", "username": '"old"'}, version=2)
+    assert not await cache.hset_if_newer("1", {"username": '"old"'}, version=2, partial=True)
+    assert (await cache.get_hash("1"))["username"] == '"new"', "Кэш не должен измениться"
+
+
+@pytest.mark.asyncio
+async def test_hset_if_newer_partial_skipping_version_drops_hash():
+    """
+    Тест частичной записи, пропускающей версию (изменения применяются не по порядку).
+    Хэш более старой версии должен быть удалён, а не дополнен частью полей.
+    """
+    await cache.hset_if_newer("1", {"id": "1", "username": '"old"', "email": '"a@x.io"'}, version=1)
+
+    assert not await cache.hset_if_newer("1", {"username": '"b"'}, version=3, partial=True)
+    assert await cache.get_hash("1") == {}, "Хэш устаревшей версии должен быть удалён"
+
+    assert not await cache.hset_if_newer("1", {"email": '"new@x.io"'}, version=2, partial=True), \
+        "Частичная запись без предыдущей версии должна быть отклонена"
+    assert await cache.get_hash("1") == {}
+
+
+@pytest.mark.asyncio
+async def test_cache_profile_out_of_order_updates():
+    """
+    Тест двух параллельных изменений профиля, записываемых в кэш не по порядку.
+    A меняет email (версия 2), B — имя (версия 3), запись B приходит первой.
+    В кэше должен оказаться полный профиль версии 3 с email из A.
+    """
+    service = UserService(None, cache)
+    await service._cache_profile({"id": 1, "username": "old", "email": "old@x.io", "version": 1})
+
+    await service._cache_profile({"id": 1, "username": "b", "email": "new@x.io", "version": 3}, ["username"])
+    await service._cache_profile({"id": 1, "username": "old", "email": "new@x.io", "version": 2}, ["email"])
+
+    cached = await cache.get_hash("1", namespace=CacheNamespace.USER)
+    assert cached["version"] == "3", f"Неверная версия: {cached}"
+    assert cached["username"] == '"b"' and cached["email"] == '"new@x.io"', f"Неверный профиль: {cached}"
+
+
+@pytest.mark.asyncio
+async def test_hset_if_newer_tombstone_blocks_writes():
+    """
+    Тест записи профиля поверх маркера отсутствия.
+    Запись должна быть отклонена до явного удаления маркера.
+    """
+    await cache.set_tombstone("1", expire=60)
+
+    assert not await cache.hset_if_newer("1", {"id": "1"}, version=1)
+
+    await cache.delete("1")
+    assert await cache.hset_if_newer("1", {"id": "1"}, version=1)
+
+
+@pytest.mark.asyncio
+async def test_local_copy_dropped_on_redis_miss():
+    """
+    Тест согласования локального кэша с Redis.
+    Ключ, удалённый другим воркером, не должен отдаваться из локального кэша при отказе Redis.
+    """
+    await cache.hset_if_newer("1", {"id": "1"}, version=1, namespace=CacheNamespace.USER)
+    key = f"{CacheNamespace.USER}:{await cache.get_generation(CacheNamespace.USER)}:1"
+    await cache.client.delete(key)
+
+    assert await cache.get_hash("1", namespace=CacheNamespace.USER) == {}
+
+    for _ in range(cache.breaker.failure_threshold):
+        cache.breaker.record_failure()
+    try:
+        assert await cache.get_hash("1", namespace=CacheNamespace.USER) == {}, \
+            "Локальная копия должна быть удалена после промаха в Redis"
+    finally:
+        cache.breaker.record_success()
@@ -2,7 +2,7 @@ import pytest
 from httpx import AsyncClient
 from fastapi import status
 
-from app.api.v1.exceptions import UserAlreadyExistsException
+from app.api.v1.exceptions import UserAlreadyExistsException, UsernameAlreadyExistsException
 
 
 @pytest.mark.asyncio
@@ -37,4 +37,38 @@ async def test_register_user_duplicate_email(client: AsyncClient, create_test_us
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST, f"Ошибка: {response.text}"
     assert response.json()["detail"] == UserAlreadyExistsException(email=create_test_user["email"]).message, \
-        "Некорректное сообщение об ошибке"
\ No newline at end of file
+        "Некорректное сообщение об ошибке"
+
+@pytest.mark.asyncio
+async def test_register_user_duplicate_username(client: AsyncClient, create_test_user):
+    """
+    Тест: регистрация пользователя с уже существующим именем.
+    Должен вернуть 400 BAD REQUEST с соответствующим сообщением об ошибке.
+    """
+    payload = {
+        "username": create_test_user["username"],
+        "email": "another@example.com",
+        "password": "newpassword123",
+    }
+
+    response = await client.post("/api/v1/auth/register", json=payload)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, f"Ошибка: {response.text}"
+    assert response.json()["detail"] == UsernameAlreadyExistsException(create_test_user["username"]).message, \
+        "Некорректное сообщение об ошибке"
+
+@pytest.mark.asyncio
+async def test_register_user_control_characters_in_username(client: AsyncClient):
+    """
+    Тест: регистрация пользователя с управляющими символами в имени.
+    Должен вернуть 422 Unprocessable Entity.
+    """
+    payload = {
+        "username": "test\x00user",
+        "email": "test@example.com",
+        "password": "securepassword123",
+    }
+
+    response = await client.post("/api/v1/auth/register", json=payload)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, f"Ошибка: {response.text}"
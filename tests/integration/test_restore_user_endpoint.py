@@ -0,0 +1,92 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.api.common.tokens import TokenService
+from app.api.v1.exceptions import InvalidCredentialsException
+
+RESTORATION_TOKEN = "known-restoration-token"
+
+
+@pytest.fixture
+def known_restoration_token(monkeypatch):
+    """Подменяет генерацию токена восстановления на известное значение."""
+    monkeypatch.setattr(
+        TokenService,
+        "generate_restoration_token",
+        staticmethod(lambda: RESTORATION_TOKEN),
+    )
+    return RESTORATION_TOKEN
+
+
+async def delete_current_user(client: AsyncClient, password: str) -> None:
+    """Удаляет аккаунт текущего пользователя."""
+    response = await client.request(
+        method="DELETE",
+        url="/api/v1/users/current",
+        json={"current_password": password},
+    )
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка удаления: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_restore_user_success(
+    auth_client: AsyncClient, get_test_user_payload, known_restoration_token
+):
+    """
+    Тест успешного восстановления удалённого аккаунта.
+    Должен вернуть 200 OK, после чего профиль снова доступен, а не отдаётся из негативного кэша.
+    """
+    access_token = auth_client.cookies.get("access_token")
+    await delete_current_user(auth_client, get_test_user_payload["password"])
+
+    restore_payload = {
+        "email": get_test_user_payload["email"],
+        "restoration_token": known_restoration_token,
+    }
+    response = await auth_client.post("/api/v1/users/restore", json=restore_payload)
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json() == {"message": "Your account has been successfully restored."}
+
+    response = await auth_client.get(
+        "/api/v1/users/current",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json()["email"] == get_test_user_payload["email"]
+
+
+@pytest.mark.asyncio
+async def test_restore_user_invalid_token(
+    auth_client: AsyncClient, get_test_user_payload, known_restoration_token
+):
+    """
+    Тест восстановления аккаунта с неверным токеном.
+    Должен вернуть 401 Unauthorized.
+    """
+    await delete_current_user(auth_client, get_test_user_payload["password"])
+
+    restore_payload = {
+        "email": get_test_user_payload["email"],
+        "restoration_token": "wrong-token",
+    }
+    response = await auth_client.post("/api/v1/users/restore", json=restore_payload)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, f"Ошибка: {response.text}"
+    assert response.json()["detail"] == InvalidCredentialsException().message, "Некорректное сообщение об ошибке"
+
+
+@pytest.mark.asyncio
+async def test_restore_active_user(client: AsyncClient, create_test_user):
+    """
+    Тест восстановления аккаунта, который не был удалён.
+    Должен вернуть 401 Unauthorized.
+    """
+    restore_payload = {
+        "email": create_test_user["email"],
+        "restoration_token": RESTORATION_TOKEN,
+    }
+    response = await client.post("/api/v1/users/restore", json=restore_payload)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, f"Ошибка: {response.text}"
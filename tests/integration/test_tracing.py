@@ -0,0 +1,131 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+
+pytest.importorskip("opentelemetry.sdk")
+
+from celery import signals
+from opentelemetry import trace
+
+from app.api.v1.endpoints import router
+from app.core import tracing
+from app.core.dependencies.common import db, cache, lifespan
+from app.core.settings import settings
+from app.workers.celery import celery
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_SPAN_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def memory_tracing():
+    """Включает трассировку с in-memory exporter'ом на время тестов модуля."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+        monkeypatch.setattr(settings, "TRACING_EXPORTER", "memory")
+        monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 1.0)
+        monkeypatch.setattr(tracing, "_tracer", None)
+        monkeypatch.setattr(tracing, "_memory_exporter", None)
+        tracing.setup_tracing()
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_spans():
+    """Очищает завершённые спаны перед каждым тестом."""
+    tracing._memory_exporter.clear()
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    """Создаёт экземпляр FastAPI с роутерами и TracingMiddleware."""
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(router, prefix="/api/v1")
+    app.add_middleware(tracing.TracingMiddleware)
+    return app
+
+
+def spans_by_name() -> dict:
+    """Возвращает завершённые спаны по имени (последний спан с каждым именем)."""
+    return {finished.name: finished for finished in tracing.finished_spans()}
+
+
+@pytest.mark.asyncio
+async def test_http_request_span(auth_client: AsyncClient):
+    """
+    Тест серверного спана HTTP-запроса.
+    Спан назван по шаблону маршрута, продолжает трассу из traceparent и содержит
+    дочерние спаны обращений к MySQL и Redis.
+    """
+    tracing._memory_exporter.clear()
+
+    response = await auth_client.get(
+        "/api/v1/users/current", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_SPAN_ID}-01"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    spans = spans_by_name()
+    server = spans["GET /api/v1/users/current"]
+    assert server.kind == trace.SpanKind.SERVER
+    assert server.attributes["http.route"] == "/api/v1/users/current"
+    assert server.attributes["http.response.status_code"] == 200
+    assert format(server.context.trace_id, "032x") == TRACE_ID
+    assert format(server.parent.span_id, "016x") == PARENT_SPAN_ID
+
+    children = [finished for finished in tracing.finished_spans() if finished is not server]
+    assert any(finished.name == "mysql.fetch" for finished in children), f"Ошибка: {list(spans)}"
+    assert any(finished.name.startswith("redis.") for finished in children), f"Ошибка: {list(spans)}"
+    assert all(finished.context.trace_id == server.context.trace_id for finished in children)
+
+
+@pytest.mark.asyncio
+async def test_traced_mysql_call():
+    """
+    Тест спана запроса к MySQL.
+    Спан содержит систему и текст запроса.
+    """
+    await db.fetch("SELECT 1 AS value")
+
+    fetch = spans_by_name()["mysql.fetch"]
+    assert fetch.attributes["db.system"] == "mysql"
+    assert fetch.attributes["db.statement"] == "SELECT 1 AS value"
+
+
+@pytest.mark.asyncio
+async def test_traced_redis_call():
+    """
+    Тест спана операции Redis.
+    Спан создаётся для каждой операции менеджера и содержит систему.
+    """
+    await cache.set("tracing", "1", namespace="user")
+    await cache.get("tracing", namespace="user")
+
+    spans = spans_by_name()
+    assert spans["redis.set"].attributes["db.system"] == "redis"
+    assert spans["redis.get"].attributes["db.system"] == "redis"
+
+
+def test_celery_context_propagation():
+    """
+    Тест распространения контекста в задачу Celery.
+    Контекст спана публикации записывается в заголовки, а задача выполняется в дочернем спане.
+    """
+    headers = {}
+    with tracing.span("publish"):
+        signals.before_task_publish.send(sender="send_email", headers=headers)
+
+    assert headers["traceparent"].split("-")[1] != "0" * 32
+
+    task = SimpleNamespace(name="send_email", request=SimpleNamespace(**headers))
+    signals.task_prerun.send(sender=celery, task_id="task-1", task=task)
+    signals.task_postrun.send(sender=celery, task_id="task-1", task=task, state="SUCCESS")
+
+    spans = spans_by_name()
+    publish, run = spans["publish"], spans["celery.run send_email"]
+    assert run.kind == trace.SpanKind.CONSUMER
+    assert run.attributes["celery.state"] == "SUCCESS"
+    assert run.context.trace_id == publish.context.trace_id
+    assert run.parent.span_id == publish.context.span_id
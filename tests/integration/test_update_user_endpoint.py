@@ -29,6 +29,28 @@ async def test_update_user_success(auth_client: AsyncClient):
     assert response_json["email"] == update_payload["email"], "Email не обновился"
 
 
+@pytest.mark.asyncio
+async def test_update_user_refreshes_cached_profile(auth_client: AsyncClient):
+    """
+    Тест обновления закэшированного профиля после изменения данных.
+    Повторный запрос профиля должен вернуть новые данные и увеличенную версию.
+    """
+    response = await auth_client.get("/api/v1/users/current")
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    cached_version = response.json()["version"]
+
+    response = await auth_client.patch("/api/v1/users/current", json={"username": "renameduser"})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response = await auth_client.get("/api/v1/users/current")
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response_json = response.json()
+    assert response_json["username"] == "renameduser", "Профиль в кэше не обновился"
+    assert response_json["version"] > cached_version, "Версия профиля не увеличилась"
+    assert "password" not in response_json, "Ответ не должен содержать хэш пароля"
+
+
 @pytest.mark.asyncio
 async def test_update_user_invalid_password(auth_client: AsyncClient):
     """
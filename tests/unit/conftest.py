@@ -0,0 +1,11 @@
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+
+@pytest_asyncio.fixture
+async def client(app: FastAPI):
+    """Создаёт асинхронный HTTP-клиент для приложения из фикстуры app тестового модуля."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from app.api.storage.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Подменяет time.monotonic управляемыми часами."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_breaker_opens_after_threshold(clock):
+    """
+    Тест размыкания выключателя.
+    После failure_threshold ошибок подряд вызовы должны отклоняться.
+    """
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=10.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request(), "Разомкнутый выключатель должен отклонять вызовы"
+
+
+def test_breaker_success_resets_failures(clock):
+    """
+    Тест сброса счётчика ошибок.
+    Успешный вызов между ошибками не должен приводить к размыканию.
+    """
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=10.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_half_open_probe_success(clock):
+    """
+    Тест пробного вызова после recovery_timeout.
+    Должен пропускаться один пробный вызов, успех замыкает выключатель.
+    """
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10.0)
+    breaker.record_failure()
+
+    clock[0] += 10.0
+    assert breaker.allow_request(), "После recovery_timeout должен пропускаться пробный вызов"
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request(), "Одновременно допускается только один пробный вызов"
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow_request()
+
+
+def test_breaker_half_open_probe_failure(clock):
+    """
+    Тест неудачного пробного вызова.
+    Выключатель должен снова разомкнуться на recovery_timeout.
+    """
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=10.0)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock[0] += 10.0
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    clock[0] += 5.0
+    assert not breaker.allow_request()
+    clock[0] += 5.0
+    assert breaker.allow_request()
@@ -0,0 +1,224 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.core.compression import COMPRESSORS, CompressionMiddleware, negotiate
+
+PAYLOAD = {"users": [{"id": index, "username": f"user{index}"} for index in range(100)]}
+
+OPENAPI = b'{"openapi": "3.1.0", "paths": {}}' * 50
+
+
+def preferred(*encodings: str) -> str:
+    """Возвращает первую из кодировок в порядке предпочтения сервера."""
+    return next(encoding for encoding in COMPRESSORS if encoding in encodings)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("GZIP", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=invalid", None),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("*;q=0", None),
+        ("gzip;q=0, *", next((encoding for encoding in COMPRESSORS if encoding != "gzip"), None)),
+        ("*, " + ", ".join(f"{encoding};q=0" for encoding in COMPRESSORS if encoding != "gzip"), "gzip"),
+    ],
+)
+def test_negotiate(accept_encoding: str, expected: str):
+    """
+    Тест выбора кодировки по Accept-Encoding.
+    Учитываются веса q, запрет через q=0 и "*" (не снимает явный запрет); неизвестные кодировки игнорируются.
+    """
+    assert negotiate(accept_encoding) == expected
+
+
+@pytest.mark.skipif("br" not in COMPRESSORS, reason="brotli не установлен")
+def test_negotiate_weights_between_encodings():
+    """
+    Тест выбора между поддерживаемыми кодировками.
+    Побеждает больший вес q, при равных весах — порядок предпочтения сервера.
+    """
+    assert negotiate("gzip;q=0.9, br;q=0.8") == "gzip"
+    assert negotiate("gzip, br") == preferred("gzip", "br")
+
+
+@pytest.fixture
+def factory_calls() -> list:
+    """Считает вызовы фабрики статического ответа."""
+    return []
+
+
+@pytest.fixture
+def app(factory_calls: list) -> FastAPI:
+    """Создаёт экземпляр FastAPI с CompressionMiddleware и тестовыми маршрутами."""
+    app = FastAPI()
+
+    def openapi_payload():
+        factory_calls.append(1)
+        return OPENAPI, "application/json"
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=500,
+        levels={"zstd": 3, "br": 4, "gzip": 6},
+        route_levels={"/uncompressed": {encoding: 0 for encoding in COMPRESSORS}},
+        static_payloads={"/api/openapi.json": openapi_payload},
+    )
+
+    @app.get("/json")
+    async def large_json():
+        return JSONResponse(PAYLOAD)
+
+    @app.get("/uncompressed")
+    async def uncompressed_json():
+        return JSONResponse(PAYLOAD)
+
+    @app.get("/small")
+    async def small_json():
+        return JSONResponse({"status": "ok"})
+
+    @app.get("/image")
+    async def image():
+        return Response(content=bytes(2000), media_type="image/png")
+
+    @app.get("/etag/{kind}")
+    async def with_etag(kind: str):
+        etag = '"v1"' if kind == "strong" else 'W/"v1"'
+        return JSONResponse(PAYLOAD, headers={"ETag": etag})
+
+    @app.get("/empty")
+    async def empty():
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_compress_large_json(client: AsyncClient):
+    """
+    Тест сжатия JSON-ответа.
+    Ответ больше минимального размера сжимается, Content-Length соответствует сжатому телу.
+    """
+    response = await client.get("/json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.json() == PAYLOAD
+    assert int(response.headers["Content-Length"]) < len(response.content)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, accept_encoding",
+    [
+        ("/small", "gzip"),
+        ("/image", "gzip"),
+        ("/uncompressed", "gzip"),
+        ("/json", "identity"),
+        ("/json", "gzip;q=0"),
+        ("/empty", "gzip"),
+    ],
+    ids=["below-minimum-size", "incompressible-type", "route-level-0", "identity", "q0", "no-content"],
+)
+async def test_response_not_compressed(client: AsyncClient, path: str, accept_encoding: str):
+    """
+    Тест ответов, которые не сжимаются.
+    Маленькие ответы, несжимаемые типы, маршруты с уровнем 0, ответы без тела
+    и клиенты без поддержки кодировки получают исходное тело.
+    """
+    response = await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    assert response.status_code < 300, f"Ошибка: {response.text}"
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_strong_etag_becomes_weak(client: AsyncClient):
+    """
+    Тест ETag сжатого ответа.
+    Сильный ETag становится слабым, слабый не меняется; без сжатия ETag не меняется.
+    """
+    strong = await client.get("/etag/strong", headers={"Accept-Encoding": "gzip"})
+    weak = await client.get("/etag/weak", headers={"Accept-Encoding": "gzip"})
+    identity = await client.get("/etag/strong", headers={"Accept-Encoding": "identity"})
+
+    assert strong.headers["ETag"] == 'W/"v1"'
+    assert weak.headers["ETag"] == 'W/"v1"'
+    assert identity.headers["ETag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_precompressed_openapi(client: AsyncClient, factory_calls: list):
+    """
+    Тест статического ответа /api/openapi.json.
+    Тело сжимается один раз при сборке middleware и отдаётся из памяти в выбранной кодировке.
+    """
+    compressed = await client.get("/api/openapi.json", headers={"Accept-Encoding": "gzip"})
+    identity = await client.get("/api/openapi.json", headers={"Accept-Encoding": "identity"})
+    head = await client.head("/api/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.status_code == status.HTTP_200_OK, f"Ошибка: {compressed.text}"
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.content == OPENAPI
+    assert "Content-Encoding" not in identity.headers
+    assert identity.content == OPENAPI
+    assert head.headers["Content-Length"] == compressed.headers["Content-Length"]
+    assert head.content == b""
+    assert len(factory_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_flushed_per_chunk():
+    """
+    Тест сжатия потокового ответа.
+    Каждый фрагмент сбрасывается из компрессора сразу: клиент может распаковать его
+    до получения следующего, а Content-Length не передаётся.
+    """
+    chunks = [f'{{"chunk": {index}, "data": "{"x" * 300}"}}\n'.encode() for index in range(3)]
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    middleware = CompressionMiddleware(
+        StreamingResponse(body(), media_type="application/x-ndjson"),
+        minimum_size=500,
+        levels={"gzip": 6},
+    )
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    messages = []
+
+    async def receive():
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk, message in zip(chunks, bodies):
+        assert decompressor.decompress(message["body"]) == chunk
+    assert bodies[-1]["more_body"] is False
+    assert gzip.decompress(b"".join(message["body"] for message in bodies)) == b"".join(chunks)
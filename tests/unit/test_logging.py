@@ -0,0 +1,148 @@
+import random
+import threading
+
+import pytest
+
+from app.core.logging import QueuedSink, SampledLogger, dropped_log_records, logger
+
+
+class BlockingSink:
+    """Sink, который собирает строки и может задержать запись до release()."""
+
+    def __init__(self, blocked: bool = False):
+        self.lines = []
+        self.writing = threading.Event()
+        self._released = threading.Event()
+        if not blocked:
+            self._released.set()
+
+    def __call__(self, message: str) -> None:
+        self.writing.set()
+        self._released.wait()
+        self.lines.append(str(message).rstrip("\n"))
+
+    def release(self) -> None:
+        self._released.set()
+
+
+@pytest.fixture
+def add_sink():
+    """Подключает sink к логгеру на время теста и возвращает функцию подключения."""
+    handler_ids = []
+
+    def add(sink, level: str = "DEBUG", format: str = "{message}") -> None:
+        handler_ids.append(logger.add(sink, level=level, format=format, filter=__name__))
+
+    yield add
+    for handler_id in handler_ids:
+        logger.remove(handler_id)
+
+
+@pytest.mark.asyncio
+async def test_queued_sink_writes_in_order(add_sink):
+    """
+    Тест записи через очередь.
+    Записи пишутся потоком записи в порядке поступления; complete() дожидается записи.
+    """
+    target = BlockingSink()
+    queued = QueuedSink("test", target)
+    add_sink(queued)
+
+    for index in range(100):
+        logger.info(f"запись {index}")
+    await queued.complete()
+
+    assert target.lines == [f"запись {index}" for index in range(100)]
+    assert queued.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_sink_drops_low_priority_when_full(add_sink):
+    """
+    Тест переполнения очереди.
+    Записи ниже порога отбрасываются и учитываются; запись очереди не блокирует вызывающий код.
+    """
+    target = BlockingSink(blocked=True)
+    queued = QueuedSink("test", target, maxsize=2, drop_below="WARNING")
+    add_sink(queued)
+    total_dropped = dropped_log_records()
+
+    try:
+        logger.info("первая")
+        assert target.writing.wait(1.0), "Поток записи не начал запись"
+        for index in range(10):
+            logger.debug(f"запись {index}")
+
+        assert queued.dropped == 8
+        assert dropped_log_records() == total_dropped + 8
+    finally:
+        target.release()
+    await queued.complete()
+
+    assert target.lines == ["первая", "запись 0", "запись 1"]
+
+
+@pytest.mark.asyncio
+async def test_queued_sink_keeps_high_priority_when_full(add_sink):
+    """
+    Тест переполнения очереди для важных записей.
+    Запись уровня WARNING и выше не отбрасывается, а ждёт места в очереди.
+    """
+    target = BlockingSink(blocked=True)
+    queued = QueuedSink("test", target, maxsize=1, drop_below="WARNING")
+    add_sink(queued)
+
+    def log_error() -> None:
+        logger.error("ошибка")
+
+    producer = threading.Thread(target=log_error)
+    try:
+        logger.info("первая")
+        assert target.writing.wait(1.0), "Поток записи не начал запись"
+        logger.info("вторая")
+
+        producer.start()
+        producer.join(0.1)
+        assert producer.is_alive(), "Запись ERROR должна ждать места в очереди"
+    finally:
+        target.release()
+    producer.join(1.0)
+    await queued.complete()
+
+    assert target.lines == ["первая", "вторая", "ошибка"]
+    assert queued.dropped == 0
+
+
+def test_sampled_logger_rate(add_sink):
+    """
+    Тест доли записываемых сообщений.
+    При rate 0 ничего не пишется, при rate 1 — всё, при промежуточном — примерно доля rate.
+    """
+    lines = []
+    add_sink(lines.append)
+
+    SampledLogger(0.0).info("пропущено")
+    for _ in range(10):
+        SampledLogger(1.0).info("записано")
+    assert len(lines) == 10
+
+    random.seed(42)
+    sampled = SampledLogger(0.2)
+    for _ in range(1000):
+        sampled.info("выборка")
+    assert 150 <= len(lines) - 10 <= 250
+
+
+def test_sampled_logger_formats_and_reports_caller(add_sink):
+    """
+    Тест форматирования записанных сообщений.
+    Аргументы подставляются в стиле loguru, а в записи указана вызывающая функция.
+    """
+    lines = []
+    add_sink(lines.append, format="{function} - {message}")
+
+    SampledLogger(1.0).debug("Ключ {} найден", "user:1")
+
+    assert [str(line).rstrip("\n") for line in lines] == [
+        "test_sampled_logger_formats_and_reports_caller - Ключ user:1 найден"
+    ]
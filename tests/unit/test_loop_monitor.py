@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.logging import logger
+from app.core.loop_monitor import LoopMonitor
+
+
+class CountingEvent(threading.Event):
+    """threading.Event, считающий вызовы wait (пробуждения сторожевого потока)."""
+
+    def __init__(self):
+        super().__init__()
+        self.waits = 0
+
+    def wait(self, timeout=None):
+        self.waits += 1
+        return super().wait(timeout)
+
+
+@pytest.fixture
+def warnings():
+    """Собирает предупреждения журнала во время теста."""
+    messages = []
+    handler_id = logger.add(messages.append, level="WARNING", format="{message}")
+    yield messages
+    logger.remove(handler_id)
+
+
+def block_loop(seconds: float) -> None:
+    """Блокирует event loop синхронным ожиданием."""
+    time.sleep(seconds)
+
+
+def metric(name: str) -> float:
+    """Возвращает значение метрики без меток."""
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_stall_detected_once(warnings: list):
+    """
+    Тест обнаружения блокировки event loop.
+    Блокировка дольше порога логируется один раз со стеком потока event loop.
+    """
+    monitor = LoopMonitor(interval=0.05, threshold=0.1)
+    blocks = metric("event_loop_blocks_total")
+
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        block_loop(0.5)
+        await asyncio.sleep(0.1)
+    finally:
+        await monitor.stop()
+
+    assert metric("event_loop_blocks_total") == blocks + 1
+    assert len(warnings) == 1, f"Ошибка: {warnings}"
+    assert "block_loop" in warnings[0]
+
+
+@pytest.mark.asyncio
+async def test_short_block_not_reported(warnings: list):
+    """
+    Тест блокировки короче порога.
+    Не должна логироваться, но учитывается в задержке event loop.
+    """
+    monitor = LoopMonitor(interval=0.05, threshold=0.3)
+    blocks = metric("event_loop_blocks_total")
+    lag_count = metric("event_loop_lag_seconds_count")
+
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        block_loop(0.1)
+        await asyncio.sleep(0.2)
+    finally:
+        await monitor.stop()
+
+    assert metric("event_loop_blocks_total") == blocks
+    assert warnings == []
+    assert metric("event_loop_lag_seconds_count") > lag_count
+
+
+@pytest.mark.asyncio
+async def test_watchdog_wakeups_follow_interval():
+    """
+    Тест частоты пробуждений сторожевого потока.
+    Без блокировок поток просыпается примерно раз в interval, независимо от порога.
+    """
+    monitor = LoopMonitor(interval=0.1, threshold=0.01)
+    monitor._stop = CountingEvent()
+
+    await monitor.start()
+    try:
+        await asyncio.sleep(1.0)
+    finally:
+        await monitor.stop()
+
+    # Раз в interval — около 10 пробуждений; с шагом threshold / 2 было бы около 200.
+    assert monitor._stop.waits <= 20, f"Ошибка: {monitor._stop.waits} пробуждений"
@@ -0,0 +1,169 @@
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+from prometheus_client import REGISTRY
+
+from app.core import monitoring
+from app.core.monitoring import setup_monitoring
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    """Создаёт экземпляр FastAPI с мониторингом и тестовыми маршрутами."""
+    app = FastAPI()
+    setup_monitoring(app)
+
+    @app.get("/api/v1/items/{item_id}")
+    async def read_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    @app.get("/health/live")
+    async def liveness() -> dict:
+        return {"status": "alive"}
+
+    return app
+
+
+def request_count(endpoint: str, status_code: int, method: str = "GET") -> float:
+    """Возвращает значение http_requests_total для набора меток."""
+    labels = {"method": method, "endpoint": endpoint, "status_code": str(status_code)}
+    return REGISTRY.get_sample_value("http_requests_total", labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_template_label(client: AsyncClient):
+    """
+    Тест метки endpoint.
+    Запросы с разными параметрами пути учитываются под шаблоном маршрута, а не под фактическим путём.
+    """
+    before = request_count("/api/v1/items/{item_id}", 200)
+
+    for item_id in (1, 2, 3):
+        response = await client.get(f"/api/v1/items/{item_id}")
+        assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert request_count("/api/v1/items/{item_id}", 200) == before + 3
+    assert 'endpoint="/api/v1/items/{item_id}"' in response.text
+    assert 'endpoint="/api/v1/items/1"' not in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_unmatched_and_excluded_paths(client: AsyncClient):
+    """
+    Тест запросов без маршрута и исключённых путей.
+    Запрос без маршрута учитывается как unmatched, пробы и /metrics не учитываются.
+    """
+    unmatched = request_count(monitoring.UNMATCHED_ENDPOINT, 404)
+    health = request_count("/health/live", 200)
+    metrics = request_count("/metrics", 200)
+
+    await client.get("/api/v1/missing/42")
+    await client.get("/health/live")
+    await client.get("/metrics")
+
+    assert request_count(monitoring.UNMATCHED_ENDPOINT, 404) == unmatched + 1
+    assert request_count("/health/live", 200) == health
+    assert request_count("/metrics", 200) == metrics
+
+
+@pytest.mark.asyncio
+async def test_metrics_unknown_method(client: AsyncClient):
+    """
+    Тест метки method для нестандартного HTTP-метода.
+    Метод вне KNOWN_METHODS учитывается как OTHER.
+    """
+    before = request_count(monitoring.UNMATCHED_ENDPOINT, 404, method="OTHER")
+
+    await client.request("PROPFIND", "/api/v1/missing")
+
+    assert request_count(monitoring.UNMATCHED_ENDPOINT, 404, method="OTHER") == before + 1
+
+
+def test_prepare_multiprocess_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Тест очистки каталога метрик перед запуском воркеров.
+    Файлы и каталоги предыдущего запуска удаляются.
+    """
+    (tmp_path / "counter_1.db").write_bytes(b"stale")
+    (tmp_path / "nested").mkdir()
+    monkeypatch.setattr(monitoring, "MULTIPROC_DIR", str(tmp_path))
+
+    monitoring.prepare_multiprocess_dir()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_mark_process_dead(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Тест удаления файлов завершившегося воркера.
+    Удаляются только live-gauge файлы этого PID; счётчики остаются в агрегате.
+    """
+    for name in ("gauge_livesum_101.db", "gauge_livesum_102.db", "counter_101.db"):
+        (tmp_path / name).write_bytes(b"")
+    monkeypatch.setattr(monitoring, "MULTIPROC_DIR", str(tmp_path))
+
+    monitoring.mark_process_dead(101)
+
+    assert sorted(os.listdir(tmp_path)) == ["counter_101.db", "gauge_livesum_102.db"]
+
+
+def test_collect_metrics_multiprocess(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Тест агрегации метрик воркеров.
+    /metrics в режиме нескольких процессов суммирует значения, записанные другими процессами.
+    """
+    worker = (
+        "from app.core.monitoring import REQUEST_COUNT\n"
+        "REQUEST_COUNT.labels(method='GET', endpoint='/api/v1/users', status_code=200).inc(2)\n"
+    )
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", worker], env=env, cwd=Path(__file__).parents[2], check=True)
+    monkeypatch.setattr(monitoring, "MULTIPROC_DIR", str(tmp_path))
+
+    output = monitoring.collect_metrics().decode()
+
+    assert 'http_requests_total{endpoint="/api/v1/users",method="GET",status_code="200"} 4.0' in output
+
+
+@pytest.mark.asyncio
+async def test_process_metrics_survive_collect_error(monkeypatch: pytest.MonkeyPatch):
+    """
+    Тест фонового сбора метрик процесса.
+    Ошибка одного сбора логируется, а задача продолжает собирать метрики.
+    """
+    process_metrics = monitoring.ProcessMetrics(interval=0.01)
+    calls = []
+
+    def collect() -> None:
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError("statm unavailable")
+
+    monkeypatch.setattr(process_metrics, "collect", collect)
+
+    await process_metrics.start()
+    await asyncio.sleep(0.1)
+    await process_metrics.stop()
+
+    assert len(calls) > 1
+
+
+def test_process_metrics_collect():
+    """
+    Тест сбора метрик процесса.
+    Число выделенных блоков памяти и ожидающих сборки объектов записывается в метрики.
+    """
+    monitoring.ProcessMetrics().collect()
+
+    assert REGISTRY.get_sample_value("worker_allocated_blocks") > 0
+    assert REGISTRY.get_sample_value("worker_gc_pending_objects", {"generation": "0"}) is not None
@@ -0,0 +1,81 @@
+import tracemalloc
+
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+
+from app.core.profiling import create_profiling_router, memory_profiler
+from app.core.settings import settings
+
+OPERATOR_TOKEN = "operator-secret"
+
+
+@pytest.fixture
+def app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    """Создаёт экземпляр FastAPI со служебными эндпоинтами профилирования."""
+    monkeypatch.setattr(settings, "OPERATOR_TOKEN", OPERATOR_TOKEN)
+    app = FastAPI()
+    create_profiling_router(app)
+    return app
+
+
+@pytest.fixture
+def memory_tracing():
+    """Останавливает tracemalloc и удаляет снимки после теста."""
+    yield
+    if tracemalloc.is_tracing():
+        memory_profiler.stop()
+
+
+@pytest.mark.asyncio
+async def test_memory_snapshot_and_diff(client: AsyncClient, memory_tracing):
+    """
+    Тест снимков памяти.
+    Снимки снимаются и сравниваются вне event loop; diff показывает рост памяти между снимками.
+    """
+    client.headers["X-Operator-Token"] = OPERATOR_TOKEN
+
+    response = await client.post("/operator/memory/start", params={"frames": 5})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    first = (await client.post("/operator/memory/snapshot")).json()
+    allocated = [bytearray(1024) for _ in range(1000)]
+    second = (await client.post("/operator/memory/snapshot", params={"limit": 5})).json()
+
+    assert second["snapshot_id"] == first["snapshot_id"] + 1
+    assert len(second["top"]) <= 5
+
+    response = await client.get(
+        "/operator/memory/diff", params={"from": first["snapshot_id"], "to": second["snapshot_id"]}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert response.json()["size_diff_bytes"] >= 1024 * 1000
+    assert any("test_profiling.py" in entry["location"][0] for entry in response.json()["top"])
+    del allocated
+
+
+@pytest.mark.asyncio
+async def test_memory_diff_unknown_snapshot(client: AsyncClient, memory_tracing):
+    """
+    Тест сравнения с несуществующим снимком.
+    Должен вернуть 404 Not Found.
+    """
+    client.headers["X-Operator-Token"] = OPERATOR_TOKEN
+
+    response = await client.get("/operator/memory/diff", params={"from": 1000, "to": 1001})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND, f"Ошибка: {response.text}"
+
+
+@pytest.mark.asyncio
+async def test_memory_snapshot_without_tracing(client: AsyncClient):
+    """
+    Тест снимка без запущенного tracemalloc.
+    Должен вернуть 409 Conflict.
+    """
+    client.headers["X-Operator-Token"] = OPERATOR_TOKEN
+
+    response = await client.post("/operator/memory/snapshot")
+
+    assert response.status_code == status.HTTP_409_CONFLICT, f"Ошибка: {response.text}"
@@ -0,0 +1,119 @@
+import pytest
+
+from app.api.common.jwt_manager import create_access_token, create_refresh_token
+from app.api.security.rate_limiter import RateLimiter, parse_rate_limit
+
+LIMITS = {
+    ("GET", "/api/v1/users/current"): "10/minute",
+    ("GET", "/api/v1/users"): "100/minute",
+}
+
+USER_KEYED = frozenset({("GET", "/api/v1/users/current")})
+
+
+@pytest.fixture
+def limiter() -> RateLimiter:
+    """Создаёт ограничитель с тарифами standard и premium (Redis не используется)."""
+    return RateLimiter(
+        None,
+        limits=LIMITS,
+        user_keyed=USER_KEYED,
+        tiers={"standard": 1.0, "premium": 5.0},
+        default_tier="standard",
+    )
+
+
+def make_scope(token: str = None, client: str = "10.0.0.1", cookie: bool = False) -> dict:
+    """Формирует scope HTTP-запроса с токеном в заголовке Authorization или в cookie."""
+    headers = []
+    if token and cookie:
+        headers.append((b"cookie", f"access_token={token}".encode()))
+    elif token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    return {"type": "http", "method": "GET", "headers": headers, "client": (client, 50000)}
+
+
+def test_parse_rate_limit_multiplier():
+    """
+    Тест компиляции лимита с коэффициентом тарифа.
+    Количество запросов умножается на коэффициент, интервал эмиссии пересчитывается.
+    """
+    rate_limit = parse_rate_limit("GET:/", "10/minute", 5.0)
+
+    assert rate_limit.limit == 50
+    assert rate_limit.emission_interval_us == 60 * 1_000_000 // 50
+
+
+@pytest.mark.parametrize("value", ["10", "0/minute", "ten/minute", "10/week"])
+def test_parse_rate_limit_invalid(value: str):
+    """
+    Тест некорректного формата лимита.
+    Должен выбросить ValueError.
+    """
+    with pytest.raises(ValueError):
+        parse_rate_limit("GET:/", value)
+
+
+def test_identify_by_subject(limiter: RateLimiter):
+    """
+    Тест ключа клиента на маршруте с аутентификацией.
+    Запросы одного пользователя с разных IP считаются вместе, разных пользователей — отдельно.
+    """
+    policy = limiter.match("GET", "/api/v1/users/current")
+    token = create_access_token({"sub": 1, "tier": "standard"})
+
+    first = limiter.identify(policy, make_scope(token, client="10.0.0.1"))
+    second = limiter.identify(policy, make_scope(token, client="10.0.0.2", cookie=True))
+    other = limiter.identify(policy, make_scope(create_access_token({"sub": 2}), client="10.0.0.1"))
+
+    assert first == second == ("user:1", "user", "standard")
+    assert other[0] == "user:2"
+
+
+def test_identify_tier(limiter: RateLimiter):
+    """
+    Тест выбора тарифа по claim tier.
+    Тариф из токена выбирает лимит с коэффициентом; неизвестный тариф и токен без тарифа — тариф по умолчанию.
+    """
+    policy = limiter.match("GET", "/api/v1/users/current")
+
+    _, _, premium = limiter.identify(policy, make_scope(create_access_token({"sub": 1, "tier": "premium"})))
+    _, _, unknown = limiter.identify(policy, make_scope(create_access_token({"sub": 1, "tier": "gold"})))
+    _, _, missing = limiter.identify(policy, make_scope(create_access_token({"sub": 1})))
+
+    assert premium == "premium"
+    assert policy.tiers[premium].limit == 50
+    assert unknown == missing == "standard"
+    assert policy.tiers[missing].limit == 10
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        None,
+        "not-a-jwt",
+        create_refresh_token({"sub": 1}),
+    ],
+    ids=["missing", "malformed", "refresh"],
+)
+def test_identify_without_valid_access_token(limiter: RateLimiter, token: str):
+    """
+    Тест ключа клиента без валидного access-токена.
+    Запрос считается по IP.
+    """
+    policy = limiter.match("GET", "/api/v1/users/current")
+
+    identity, key_type, _ = limiter.identify(policy, make_scope(token))
+
+    assert (identity, key_type) == ("ip:10.0.0.1", "ip")
+
+
+def test_identify_anonymous_route(limiter: RateLimiter):
+    """
+    Тест ключа клиента на анонимном маршруте.
+    Запрос считается по IP даже при наличии токена.
+    """
+    policy = limiter.match("GET", "/api/v1/users")
+    token = create_access_token({"sub": 1, "tier": "premium"})
+
+    assert limiter.identify(policy, make_scope(token)) == ("ip:10.0.0.1", "ip", "anonymous")
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+from app.api.storage.redis import RedisManager, CacheNamespace, TOMBSTONE
+from app.core.settings import settings
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Подменяет time.monotonic управляемыми часами."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def offline_cache(clock) -> RedisManager:
+    """Возвращает RedisManager с разомкнутым выключателем (Redis недоступен)."""
+    manager = RedisManager()
+    for _ in range(manager.breaker.failure_threshold):
+        manager.breaker.record_failure()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_fallback_get_set(offline_cache: RedisManager):
+    """
+    Тест чтения и записи при недоступном Redis.
+    Значение должно обслуживаться локальным кэшем.
+    """
+    await offline_cache.set("1", "value", namespace=CacheNamespace.USER)
+
+    assert await offline_cache.get("1", namespace=CacheNamespace.USER) == "value"
+
+    await offline_cache.delete("1", namespace=CacheNamespace.USER)
+    assert await offline_cache.get("1", namespace=CacheNamespace.USER) is None
+
+
+@pytest.mark.asyncio
+async def test_fallback_counter_honours_expire(offline_cache: RedisManager, clock):
+    """
+    Тест счётчика попыток при недоступном Redis.
+    Счётчик должен жить expire секунд, а не LOCAL_CACHE_TTL.
+    """
+    namespace = CacheNamespace.BRUTE_FORCE_DELETE
+    for _ in range(3):
+        attempts = await offline_cache.increment("1", expire=1800, namespace=namespace)
+    assert attempts == 3
+
+    clock[0] += settings.LOCAL_CACHE_TTL + 1
+    assert await offline_cache.get("1", namespace=namespace) == "3", "Счётчик не должен истекать раньше expire"
+
+    clock[0] += 1800
+    assert await offline_cache.get("1", namespace=namespace) is None, "Счётчик должен истечь через expire"
+    assert await offline_cache.increment("1", expire=1800, namespace=namespace) == 1
+
+
+@pytest.mark.asyncio
+async def test_fallback_counter_reset_by_delete(offline_cache: RedisManager):
+    """
+    Тест сброса счётчика попыток при недоступном Redis.
+    После delete счётчик должен начинаться заново.
+    """
+    namespace = CacheNamespace.BRUTE_FORCE_UPDATE
+    await offline_cache.increment("1", expire=1800, namespace=namespace)
+    await offline_cache.delete("1", namespace=namespace)
+
+    assert await offline_cache.increment("1", expire=1800, namespace=namespace) == 1
+
+
+@pytest.mark.asyncio
+async def test_fallback_hash_versions_and_tombstone(offline_cache: RedisManager):
+    """
+    Тест записи профиля в локальный кэш при недоступном Redis.
+    Должны соблюдаться проверка версии и маркер отсутствия.
+    """
+    assert await offline_cache.hset_if_newer("1", {"id": "1", "username": '"a"'}, version=1)
+    assert await offline_cache.hset_if_newer("1", {"username": '"b"'}, version=2, partial=True)
+    assert not await offline_cache.hset_if_newer("1", {"username": '"c"'}, version=4, partial=True)
+    assert await offline_cache.get_hash("1") == {}, "Частичная запись через версию должна удалить профиль"
+
+    await offline_cache.set_tombstone("2", expire=60)
+    assert await offline_cache.get_hash("2", fields=["id"]) == {TOMBSTONE: "1"}
+    assert not await offline_cache.hset_if_newer("2", {"id": "2"}, version=1)
+
+
+@pytest.mark.asyncio
+async def test_fallback_run_script_returns_none(offline_cache: RedisManager):
+    """
+    Тест выполнения Lua-скрипта при недоступном Redis.
+    Должен вернуть None без обращения к Redis.
+    """
+    assert await offline_cache.run_script("return 1", [], []) is None
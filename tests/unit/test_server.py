@@ -0,0 +1,104 @@
+import pytest
+
+from app.core import server
+from app.core.settings import settings
+
+
+@pytest.fixture
+def cgroup(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Перенаправляет пути cgroup во временный каталог; возвращает функцию записи файла."""
+    paths = {
+        "CGROUP_V2_CPU_MAX": tmp_path / "cpu.max",
+        "CGROUP_V1_CPU_QUOTA": tmp_path / "cpu.cfs_quota_us",
+        "CGROUP_V1_CPU_PERIOD": tmp_path / "cpu.cfs_period_us",
+    }
+    for name, path in paths.items():
+        monkeypatch.setattr(server, name, str(path))
+
+    def write(name: str, content: str) -> None:
+        paths[name].write_text(content + "\n")
+
+    return write
+
+
+@pytest.fixture
+def cpus(monkeypatch: pytest.MonkeyPatch):
+    """Задаёт число ядер, на которых процессу разрешено выполняться."""
+    def set_cpus(count: int) -> None:
+        monkeypatch.setattr(server.os, "sched_getaffinity", lambda pid: set(range(count)), raising=False)
+
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 0)
+    return set_cpus
+
+
+def test_cpu_quota_cgroup_v2(cgroup):
+    """
+    Тест квоты CPU по cgroup v2.
+    Квота — отношение quota к period; значение max означает отсутствие квоты.
+    """
+    cgroup("CGROUP_V2_CPU_MAX", "150000 100000")
+    assert server.cpu_quota() == 1.5
+
+    cgroup("CGROUP_V2_CPU_MAX", "max 100000")
+    assert server.cpu_quota() is None
+
+
+def test_cpu_quota_cgroup_v1(cgroup):
+    """
+    Тест квоты CPU по cgroup v1.
+    Отрицательная квота означает отсутствие ограничения.
+    """
+    cgroup("CGROUP_V1_CPU_QUOTA", "200000")
+    cgroup("CGROUP_V1_CPU_PERIOD", "100000")
+    assert server.cpu_quota() == 2.0
+
+    cgroup("CGROUP_V1_CPU_QUOTA", "-1")
+    assert server.cpu_quota() is None
+
+
+def test_cpu_quota_without_cgroup(cgroup):
+    """
+    Тест квоты CPU без файлов cgroup.
+    Должен вернуть None.
+    """
+    assert server.cpu_quota() is None
+
+
+def test_worker_count_explicit(monkeypatch: pytest.MonkeyPatch):
+    """
+    Тест явного числа воркеров.
+    SERVER_WORKERS > 0 используется без определения ресурсов.
+    """
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 3)
+
+    assert server.worker_count() == 3
+
+
+def test_worker_count_affinity(cgroup, cpus):
+    """
+    Тест числа воркеров без квоты CPU.
+    По одному воркеру на доступное ядро.
+    """
+    cpus(8)
+
+    assert server.worker_count() == 8
+
+
+@pytest.mark.parametrize(
+    "cpu_max, available, expected",
+    [
+        ("200000 100000", 8, 2),
+        ("150000 100000", 8, 2),
+        ("50000 100000", 8, 1),
+        ("800000 100000", 4, 4),
+    ],
+)
+def test_worker_count_quota(cgroup, cpus, cpu_max: str, available: int, expected: int):
+    """
+    Тест числа воркеров с квотой CPU.
+    Квота округляется вверх и ограничивается числом доступных ядер; воркеров не меньше одного.
+    """
+    cgroup("CGROUP_V2_CPU_MAX", cpu_max)
+    cpus(available)
+
+    assert server.worker_count() == expected